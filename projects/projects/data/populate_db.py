@@ -27,6 +27,9 @@ os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 # Importação correta do módulo monster (garantindo que esteja acessível)
 try:
     from game.monster import Monster
+    from game.reference_data import invalidate_reference_data
+    from game.migrations import migrate
+    from game.dice import compile_dice
 except ImportError:
     print("Erro: Não foi possível importar 'Monster' de 'game.monster'. Verifique o caminho.")
     sys.exit(1)
@@ -82,6 +85,9 @@ def drop_tables(conn):
     
     # 4. Reativa a verificação de chaves estrangeiras
     cursor.execute("PRAGMA foreign_keys = ON")
+
+    # 5. Sem tabelas, o esquema volta à versão 0 (as migrações rodam de novo)
+    cursor.execute("PRAGMA user_version = 0")
     
     conn.commit()
     print("Tabelas apagadas com sucesso (se existiam).")
@@ -335,38 +341,43 @@ def insert_class(conn, name, hit_dice, mana_dice, base_ac, description,
     except sqlite3.Error as e:
         print(f"Erro ao inserir classe '{name}': {e}")
 
+INSERT_MONSTER_SQL = '''
+    INSERT OR IGNORE INTO monsters (
+        name, level, hp, ac, attack_bonus, damage_dice, 
+        exp_reward, gold_dice, strength, dexterity, constitution,
+        intelligence, wisdom, charisma, main_attack_attribute, 
+        attack_type, physical_resistance, magical_resistance
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _monster_row(monster):
+    """Valores de um Monster na ordem de INSERT_MONSTER_SQL."""
+    return (
+        monster.name,
+        monster.level,
+        monster.hp_max,
+        monster.ac,
+        monster.attack_bonus,
+        monster.damage_dice,
+        monster.exp_reward,
+        monster.gold_dice,
+        monster.strength,
+        monster.dexterity,
+        monster.constitution,
+        monster.intelligence,
+        monster.wisdom,
+        monster.charisma,
+        monster.main_attack_attribute,
+        monster.attack_type,
+        monster.physical_resistance,
+        monster.magical_resistance
+    )
+
 def insert_monster(conn, monster):
     """Insere um monstro na tabela com os novos campos de resistência."""
     cursor = conn.cursor()
     try:
-        # A instrução SQL foi atualizada para incluir os novos campos
-        cursor.execute('''
-        INSERT OR IGNORE INTO monsters (
-            name, level, hp, ac, attack_bonus, damage_dice, 
-            exp_reward, gold_dice, strength, dexterity, constitution,
-            intelligence, wisdom, charisma, main_attack_attribute, 
-            attack_type, physical_resistance, magical_resistance
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            monster.name,
-            monster.level,
-            monster.hp_max,
-            monster.ac,
-            monster.attack_bonus,
-            monster.damage_dice,
-            monster.exp_reward,
-            monster.gold_dice,
-            monster.strength,
-            monster.dexterity,
-            monster.constitution,
-            monster.intelligence,
-            monster.wisdom,
-            monster.charisma,
-            monster.main_attack_attribute,
-            monster.attack_type,
-            monster.physical_resistance,
-            monster.magical_resistance
-        ))
+        cursor.execute(INSERT_MONSTER_SQL, _monster_row(monster))
         conn.commit()
         if cursor.rowcount > 0:
             print(f"Monstro '{monster.name}' inserido com sucesso!")
@@ -412,8 +423,6 @@ def insert_item(conn, item_data):
     item_id = item_data.get('id')
     item_name = item_data.get('name')
     item_category = item_data.get('category')
-    equip_slot = item_data.get('equip_slot')
-    item_level = item_data.get('level', 1)
 
     if None in (item_id, item_name, item_category):
         print("Erro: ID, nome e categoria são obrigatórios.")
@@ -425,9 +434,32 @@ def insert_item(conn, item_data):
         print(f"Item '{item_name}' (ID: {item_id}) já existe. Pulando.")
         return item_id
     
+    columns, values = _item_columns(item_data)
+    
+    # Executar inserção
+    placeholders = ', '.join(['?'] * len(columns))
+    column_names = ', '.join(columns)
+    
+    try:
+        cursor.execute(f"INSERT INTO items ({column_names}) VALUES ({placeholders})", values)
+        conn.commit()
+        print(f"Item '{item_name}' (ID: {item_id}) adicionado!")
+        return item_id
+    except sqlite3.Error as e:
+        print(f"Erro ao inserir item '{item_name}': {e}")
+        return None
+
+def _item_columns(item_data):
+    """
+    Colunas e valores de um item: só os campos informados e válidos para a
+    categoria, para que os demais fiquem com o DEFAULT da tabela.
+    """
+    item_category = item_data.get('category')
+    
     # Montar query com campos dinâmicos
     columns = ['id', 'name', 'category', 'equip_slot', 'level']
-    values = [item_id, item_name, item_category, equip_slot, item_level]
+    values = [item_data.get('id'), item_data.get('name'), item_category,
+              item_data.get('equip_slot'), item_data.get('level', 1)]
     
     # Campos comuns
     common_fields = ['description', 'weight', 'value', 'subcategory']
@@ -470,18 +502,7 @@ def insert_item(conn, item_data):
                 columns.append(field)
                 values.append(item_data[field])
     
-    # Executar inserção
-    placeholders = ', '.join(['?'] * len(columns))
-    column_names = ', '.join(columns)
-    
-    try:
-        cursor.execute(f"INSERT INTO items ({column_names}) VALUES ({placeholders})", values)
-        conn.commit()
-        print(f"Item '{item_name}' (ID: {item_id}) adicionado!")
-        return item_id
-    except sqlite3.Error as e:
-        print(f"Erro ao inserir item '{item_name}': {e}")
-        return None
+    return tuple(columns), values
 
         
 def insert_skills(conn, name, description, attribute):
@@ -544,47 +565,243 @@ def add_background_starting_skill(conn, background_id, skill_name, starting_leve
     except sqlite3.Error as e:
         print(f"Erro ao adicionar perícia inicial: {e}")
     
-def populate_initial_data():
-    conn = create_connection(DB_PATH)
+# ---------------------------------------------------------------------------
+# Carga em lote: os dados de data_tuples são coletados em memória, validados
+# de uma vez e gravados com executemany, uma transação por tabela. Chaves
+# estrangeiras (perícias dos antecedentes) são resolvidas por mapas nome → id.
+# ---------------------------------------------------------------------------
+
+SEED_TABLES = (
+    'races', 'monsters', 'name_components', 'items',
+    'classes', 'skills', 'backgrounds', 'background_skills'
+)
+
+VALID_COMPONENT_TYPES = ('prefix', 'middle', 'suffix')
+VALID_ITEM_CATEGORIES = ('weapon', 'armor', 'shield', 'consumable', 'misc', 'ammo')
+VALID_EQUIP_SLOTS = (None, 'main_hand', 'off_hand', 'head', 'body', 'hands', 'feet', 'ring', 'amulet')
+
+INSERT_RACE_SQL = '''
+    INSERT OR IGNORE INTO races (
+        name, strength_bonus, dexterity_bonus, constitution_bonus, 
+        intelligence_bonus, wisdom_bonus, charisma_bonus, description
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+INSERT_COMPONENT_SQL = '''
+    INSERT OR IGNORE INTO name_components (
+        culture, gender, component_type, value, weight, is_required
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+INSERT_CLASS_SQL = '''
+    INSERT OR IGNORE INTO classes (
+        name, hit_dice, mana_dice, base_ac, description, 
+        starting_weapon_id, starting_armor_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+INSERT_SKILL_SQL = "INSERT INTO skills (name, description, attribute) VALUES (?, ?, ?)"
+INSERT_BACKGROUND_SQL = "INSERT OR IGNORE INTO backgrounds (name, description) VALUES (?, ?)"
+INSERT_BACKGROUND_SKILL_SQL = '''
+    INSERT OR IGNORE INTO background_skills (background_id, skill_id, starting_level)
+    VALUES (?, ?, ?)
+'''
+
+def collect_seed_data():
+    """
+    Executa as funções populate_* de data_tuples com coletores no lugar das
+    funções de inserção e devolve as linhas de cada tabela: {tabela: [linhas]}.
+    """
+    try:
+        import data_tuples
+    except ImportError:
+        # Importado como pacote (data.populate_db), fora da pasta data/
+        from data import data_tuples
+
+    data = {table: [] for table in SEED_TABLES}
+
+    def collect_component(conn, culture, gender, component_type, value, weight=1, is_required=0):
+        data['name_components'].append((culture, gender, component_type, value, weight, is_required))
+
+    def collect_background(conn, name, description):
+        data['backgrounds'].append((name, description))
+        return name  # O id real é resolvido pelo nome depois da inserção
+
+    def collect_background_skill(conn, background_name, skill_name, starting_level=1):
+        data['background_skills'].append((background_name, skill_name, starting_level))
+
+    data_tuples.populate_races(None, lambda conn, *race: data['races'].append(race))
+    data_tuples.populate_monsters(None, lambda conn, monster: data['monsters'].append(_monster_row(monster)), Monster)
+    data_tuples.populate_components(None, collect_component)
+    data_tuples.populate_weapons(None, lambda conn, item: data['items'].append(item))
+    data_tuples.populate_armors_and_shields(None, lambda conn, item: data['items'].append(item))
+    data_tuples.populate_classes(None, lambda conn, *char_class: data['classes'].append(char_class))
+    data_tuples.populate_skills(None, lambda conn, name, description, attribute:
+                    data['skills'].append((name, description, attribute)))
+    data_tuples.populate_backgrounds(None, collect_background, collect_background_skill)
+    return data
+
+def _drop_duplicates(rows, key, label, warnings):
+    """Mantém a primeira ocorrência de cada chave (mesmo efeito do INSERT OR IGNORE)."""
+    seen = set()
+    unique_rows = []
+    for row in rows:
+        row_key = key(row)
+        if row_key in seen:
+            warnings.append(f"{label} '{row_key}' repetido(a). Mantida a primeira ocorrência.")
+            continue
+        seen.add(row_key)
+        unique_rows.append(row)
+    return unique_rows
+
+def _check_dice(expression, label, errors):
+    try:
+        compile_dice(expression)
+    except (ValueError, TypeError):
+        errors.append(f"{label}: expressão de dados inválida {expression!r}")
+
+def validate_seed_data(data):
+    """
+    Valida todos os dados antes de tocar no banco.
+    Remove duplicatas (com aviso) e retorna (dados limpos, erros, avisos).
+    """
+    errors = []
+    warnings = []
+    clean = dict(data)
+
+    clean['races'] = _drop_duplicates(data['races'], lambda r: r[0], "Raça", warnings)
+
+    clean['monsters'] = _drop_duplicates(data['monsters'], lambda m: m[0], "Monstro", warnings)
+    for monster in clean['monsters']:
+        _check_dice(monster[5], f"Monstro '{monster[0]}' (dano)", errors)
+        _check_dice(monster[7], f"Monstro '{monster[0]}' (ouro)", errors)
+        if not monster[1] or monster[1] < 1:
+            errors.append(f"Monstro '{monster[0]}': nível inválido {monster[1]!r}")
+
+    clean['name_components'] = _drop_duplicates(
+        data['name_components'], lambda c: c[:4], "Componente", warnings)
+    for component in clean['name_components']:
+        if component[2] not in VALID_COMPONENT_TYPES:
+            errors.append(f"Componente '{component[3]}': tipo inválido {component[2]!r}")
+
+    valid_items = []
+    for item in data['items']:
+        if None in (item.get('id'), item.get('name'), item.get('category')):
+            errors.append(f"Item {item!r}: ID, nome e categoria são obrigatórios.")
+            continue
+        if item['category'] not in VALID_ITEM_CATEGORIES:
+            errors.append(f"Item '{item['name']}': categoria inválida {item['category']!r}")
+        if item.get('equip_slot') not in VALID_EQUIP_SLOTS:
+            errors.append(f"Item '{item['name']}': slot inválido {item.get('equip_slot')!r}")
+        if item['category'] == 'weapon':
+            _check_dice(item.get('damage_dice'), f"Item '{item['name']}'", errors)
+        valid_items.append(item)
+    valid_items = _drop_duplicates(valid_items, lambda i: i['id'], "Item (ID)", warnings)
+    clean['items'] = _drop_duplicates(valid_items, lambda i: i['name'], "Item", warnings)
+    item_ids = {item['id'] for item in clean['items']}
+
+    clean['classes'] = _drop_duplicates(data['classes'], lambda c: c[0], "Classe", warnings)
+    for name, hit_dice, mana_dice, _, _, weapon_id, armor_id in clean['classes']:
+        _check_dice(hit_dice, f"Classe '{name}' (vida)", errors)
+        _check_dice(mana_dice, f"Classe '{name}' (mana)", errors)
+        for item_id in (weapon_id, armor_id):
+            if item_id is not None and item_id not in item_ids:
+                errors.append(f"Classe '{name}': item inicial {item_id} não existe")
+
+    clean['skills'] = _drop_duplicates(data['skills'], lambda s: s[0], "Perícia", warnings)
+    skill_names = {skill[0] for skill in clean['skills']}
+
+    clean['backgrounds'] = _drop_duplicates(data['backgrounds'], lambda b: b[0], "Antecedente", warnings)
+    background_skills = []
+    for background_name, skill_name, level in data['background_skills']:
+        if skill_name not in skill_names:
+            # Mesmo comportamento da inserção linha a linha: a associação é ignorada
+            warnings.append(f"Antecedente '{background_name}': perícia '{skill_name}' não encontrada. Pulando...")
+            continue
+        background_skills.append((background_name, skill_name, level))
+    clean['background_skills'] = _drop_duplicates(
+        background_skills, lambda b: b[:2], "Perícia de antecedente", warnings)
+
+    return clean, errors, warnings
+
+def bulk_seed(conn, data):
+    """Grava os dados já validados: executemany em uma transação por tabela."""
+    cursor = conn.cursor()
+    counts = {}
+
+    def insert_table(table, sql, rows):
+        with conn:
+            cursor.executemany(sql, rows)
+        counts[table] = len(rows)
+
+    insert_table('races', INSERT_RACE_SQL, data['races'])
+    insert_table('monsters', INSERT_MONSTER_SQL, data['monsters'])
+    insert_table('name_components', INSERT_COMPONENT_SQL, data['name_components'])
+
+    # Itens têm colunas variáveis por categoria: um executemany por conjunto de colunas
+    item_groups = {}
+    for item in data['items']:
+        columns, values = _item_columns(item)
+        item_groups.setdefault(columns, []).append(values)
+    with conn:
+        for columns, rows in item_groups.items():
+            placeholders = ', '.join(['?'] * len(columns))
+            cursor.executemany(f"INSERT INTO items ({', '.join(columns)}) VALUES ({placeholders})", rows)
+    counts['items'] = len(data['items'])
+
+    insert_table('classes', INSERT_CLASS_SQL, data['classes'])
+    insert_table('skills', INSERT_SKILL_SQL, data['skills'])
+    insert_table('backgrounds', INSERT_BACKGROUND_SQL, data['backgrounds'])
+
+    # Mapas nome → id para as chaves estrangeiras (primeira perícia com o nome vence)
+    skill_ids = {}
+    for skill_id, name in cursor.execute("SELECT id, name FROM skills ORDER BY id"):
+        skill_ids.setdefault(name, skill_id)
+    background_ids = {name: bg_id for bg_id, name in cursor.execute("SELECT id, name FROM backgrounds")}
+    insert_table('background_skills', INSERT_BACKGROUND_SKILL_SQL, [
+        (background_ids[background_name], skill_ids[skill_name], level)
+        for background_name, skill_name, level in data['background_skills']
+    ])
+    return counts
+
+def seed_database(conn):
+    """
+    Recria e popula todas as tabelas na conexão informada (arquivo ou :memory:).
+    Retorna False, sem alterar o banco, se os dados de data_tuples forem inválidos.
+    """
+    # Valida tudo antes de apagar qualquer tabela
+    data, errors, warnings = validate_seed_data(collect_seed_data())
+    for warning in warnings:
+        print(f"Aviso: {warning}")
+    if errors:
+        print("\nDados inválidos em data_tuples; o banco não foi alterado:")
+        for error in errors:
+            print(f" - {error}")
+        return False
 
     # --------------------------------
     drop_tables(conn)     # Remove tabelas existentes
     create_tables(conn)   # Cria novas tabelas
     # --------------------------------
 
-    # Popule passando as funções de inserção:
-    from data_tuples import (
-        populate_races, 
-        populate_monsters,
-        populate_components,
-        populate_armors_and_shields,
-        populate_weapons,
-        populate_classes,
-        populate_skills,
-        populate_backgrounds
-    )
-
-    print("\nPopulando raças...")
-    populate_races(conn, insert_race)  # Passe insert_race como argumento
-
-    print("\nPopulando monstros...")
-    populate_monsters(conn, insert_monster, Monster)  # Passe insert_monster
-
-    print("\nPopulando componentes...")
-    populate_components(conn, insert_component)  # Passe insert_component
+    try:
+        counts = bulk_seed(conn, data)
+    except sqlite3.Error as e:
+        print(f"Erro ao popular o banco: {e}")
+        return False
+    for table, count in counts.items():
+        print(f"{table}: {count} registro(s) inserido(s).")
 
-    print("\nPopulando itens...")
-    populate_weapons(conn, insert_item)  # Passe insert_item
-    populate_armors_and_shields(conn, insert_item)  # Passe insert_item
+    # Índices secundários só depois dos dados (e demais migrações do esquema)
+    migrate(conn)
+    return True
 
-    print("\nPopulando classes...")
-    populate_classes(conn, insert_class)  # Passe insert_class
+def populate_initial_data():
+    conn = create_connection(DB_PATH)
+    success = seed_database(conn)
+    conn.close()
 
-    print("\nPopulando Skills(pericias)...")
-    populate_skills(conn, insert_skills)  # Passe insert_skills
-    
-    print("\nPopulando Antecedentes (Backgrounds)...")
-    populate_backgrounds(conn, insert_background, add_background_starting_skill)
+    # Dados de referência mudaram: descarta o cache em memória
+    if success:
+        invalidate_reference_data()
+    return success
 
 if __name__ == "__main__":
     populate_initial_data()
@@ -0,0 +1,294 @@
+# game/balance_sim.py
+"""
+Simulador de balanceamento Monte Carlo vetorizado com NumPy.
+
+Roda N lutas paralelas por célula (nível do jogador, classe, raça, monstro,
+dificuldade) rolando todos os d20 e dados de dano como arrays, com as mesmas
+regras de game.combat_engine. Para cada célula informa taxa de vitória,
+rodadas esperadas e HP perdido.
+
+NumPy é opcional: o jogo não depende dele, só este simulador.
+
+Uso:
+    python -m game.balance_sim --levels 1 3 5 --fights 2000 --csv balance.csv
+"""
+import argparse
+import csv
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só o simulador em lote depende dele
+    np = None
+
+from .combat_engine import MAX_ROUNDS
+from .config import DIFFICULTY_MODIFIERS
+from .connection import get_shared_connection
+from .monster_index import get_monster_index
+from .dice import compile_dice
+from .reference_data import get_reference_data
+from .utils import modifier, roll_dice_max, calculate_enhanced_damage
+
+RESULT_COLUMNS = (
+    'level', 'class', 'race', 'monster', 'difficulty', 'fights',
+    'win_rate', 'defeat_rate', 'flee_rate', 'avg_rounds', 'avg_hp_lost', 'avg_hp_lost_pct'
+)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "game.balance_sim requer NumPy (pip install numpy). "
+            "Sem NumPy, use game.combat_engine.simulate_fights para simulações menores."
+        )
+
+
+def build_player_snapshot(class_data, race_data, level, difficulty, base_attribute=10):
+    """
+    Monta um snapshot de jogador (mesmo formato de combat_engine.snapshot_character)
+    para um personagem recém-criado da classe e raça informadas, com atributos
+    base fixos, equipamento inicial da classe e HP/AC calculados como em Character.
+    """
+    mods = DIFFICULTY_MODIFIERS.get(difficulty, {})
+    reduction = mods.get("attribute_reduction", 0)
+    reference = get_reference_data()
+
+    attributes = {}
+    for attr in ('strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma'):
+        attributes[attr] = base_attribute + race_data.get(f"{attr}_bonus", 0)
+
+    weapon = None
+    if class_data.get('starting_weapon'):
+        weapon = reference.get_item(class_data['starting_weapon']['id'])
+    armor = class_data.get('starting_armor') or {}
+
+    dexterity_penalty = armor.get('dexterity_penalty') or 0
+
+    def effective(attr):
+        value = max(1, attributes[attr] - reduction)
+        if attr == 'dexterity':
+            value = max(1, value - dexterity_penalty)
+        return value
+
+    hit_dice = class_data.get('hit_dice') or "1d8"
+    hp_max = roll_dice_max(hit_dice)
+    if level > 1:
+        hp_max += ((int(hit_dice.split('d')[1]) + 1) // 2) * (level - 1)
+    hp_max = max(1, hp_max + modifier(effective('constitution')))
+
+    if weapon:
+        main_attribute = weapon.get('main_attribute') or 'strength'
+        attack_mod = modifier(effective(main_attribute))
+        weapon_dice = calculate_enhanced_damage(weapon)
+        damage_bonus = attack_mod
+        damage_type = weapon.get('damage_type') or 'physical'
+        crit_multiplier = 2
+    else:
+        attack_mod = modifier(effective('strength'))
+        weapon_dice = '1d4'
+        damage_bonus = 0
+        damage_type = 'physical'
+        crit_multiplier = 1
+
+    return {
+        'name': f"{race_data['name']} {class_data['name']}",
+        'level': level,
+        'hp': hp_max,
+        'hp_max': hp_max,
+        'ac': (class_data.get('base_ac') or 10) + modifier(attributes['dexterity'] - dexterity_penalty),
+        'physical_resistance': armor.get('physical_resistance') or 0,
+        'magical_resistance': armor.get('magical_resistance') or 0,
+        'attack_bonus': attack_mod,
+        'weapon_dice': weapon_dice,
+        'damage_bonus': damage_bonus,
+        'damage_type': damage_type,
+        'crit_multiplier': crit_multiplier,
+        'flee_bonus': modifier(effective('intelligence')),
+        'difficulty': difficulty,
+    }
+
+
+def simulate_cell(player, monster_data, difficulty, fights, rng, flee_fraction=None, max_rounds=MAX_ROUNDS):
+    """
+    Simula 'fights' lutas paralelas entre o snapshot do jogador e o monstro.
+    Retorna taxas de vitória/derrota/fuga, rodadas médias e HP perdido médio.
+    """
+    _require_numpy()
+    mods = DIFFICULTY_MODIFIERS.get(difficulty, DIFFICULTY_MODIFIERS["Desafio Justo"])
+
+    # Monstro como em combat_engine.monster_from_data / Monster.__init__
+    monster_hp_max = int(monster_data.get('hp', 10) * mods.get("monster_hp_multiplier", 1.0))
+    monster_hp_max += modifier(monster_data.get('constitution', 10))
+    monster_ac = monster_data.get('ac', 10)
+    monster_attack_bonus = monster_data.get('attack_bonus', 0)
+    monster_damage_mod = modifier(monster_data.get(monster_data.get('main_attack_attribute') or 'strength', 10))
+    monster_attack_type = monster_data.get('attack_type', 'physical')
+    monster_flee_mod = modifier(monster_data.get('dexterity', 10))
+    if player['damage_type'] == "physical":
+        monster_resistance = monster_data.get('physical_resistance', 0)
+    else:
+        monster_resistance = monster_data.get('magical_resistance', 0)
+
+    if monster_attack_type == "physical":
+        player_resistance = player['physical_resistance']
+    elif monster_attack_type == "magical":
+        player_resistance = player['magical_resistance']
+    else:
+        player_resistance = 0
+
+    damage_dealt_mult = mods.get("damage_dealt", 1.0)
+    damage_received_mult = mods.get("damage_received", 1.0)
+    crit_chance_bonus = mods.get("enemy_crit_chance_bonus", 0)
+    has_crit_bonus_key = "enemy_crit_chance_bonus" in mods
+
+    player_dice = compile_dice(player['weapon_dice'])
+    monster_dice = compile_dice(monster_data['damage_dice'])
+
+    player_hp = np.full(fights, player['hp'], dtype=np.float64)
+    monster_hp = np.full(fights, monster_hp_max, dtype=np.float64)
+    rounds = np.zeros(fights, dtype=np.int64)
+    # 0 = em andamento, 1 = vitória, 2 = derrota, 3 = fuga
+    result = np.zeros(fights, dtype=np.int8)
+
+    flee_threshold = player['hp_max'] * flee_fraction if flee_fraction is not None else None
+
+    for _ in range(max_rounds):
+        active = np.flatnonzero(result == 0)
+        if active.size == 0:
+            break
+        rounds[active] += 1
+
+        # --- Ação do jogador: fuga ou ataque -------------------------------
+        if flee_threshold is not None:
+            fleeing = player_hp[active] < flee_threshold
+            fleers = active[fleeing]
+            if fleers.size:
+                player_roll = rng.integers(1, 21, size=fleers.size) + player['flee_bonus']
+                monster_roll = rng.integers(1, 21, size=fleers.size) + monster_flee_mod
+                result[fleers[player_roll > monster_roll]] = 3
+            attackers = active[~fleeing]
+        else:
+            attackers = active
+
+        if attackers.size:
+            roll = rng.integers(1, 21, size=attackers.size)
+            critical = roll == 20
+            hit = (roll + player['attack_bonus'] >= monster_ac) | critical
+
+            damage = player_dice.roll_many(attackers.size, rng) + player['damage_bonus']
+            damage = np.where(critical, damage * player['crit_multiplier'], damage)
+            damage = np.floor(np.maximum(1, damage) * damage_dealt_mult)
+            if has_crit_bonus_key:
+                damage = np.where(critical, damage * 1.15, damage)
+            damage = np.maximum(1, damage - monster_resistance)
+
+            monster_hp[attackers] -= np.where(hit, damage, 0)
+            result[attackers[monster_hp[attackers] <= 0]] = 1
+
+        # --- Ataque do monstro contra quem continua na luta ----------------
+        defenders = active[result[active] == 0]
+        if defenders.size == 0:
+            continue
+
+        crit_bonus = rng.random(defenders.size) < crit_chance_bonus
+        roll = rng.integers(1, 21, size=defenders.size)
+        critical = (roll == 20) | crit_bonus
+        hit = (roll + monster_attack_bonus >= player['ac']) | critical
+
+        damage = monster_dice.roll_many(defenders.size, rng) + monster_damage_mod
+        damage += np.where(critical, monster_dice.roll_many(defenders.size, rng), 0)
+        damage = np.floor(np.maximum(1, damage) * damage_received_mult)
+        damage = np.maximum(0, damage - player_resistance)
+
+        player_hp[defenders] -= np.where(hit, damage, 0)
+        result[defenders[player_hp[defenders] <= 0]] = 2
+
+    hp_lost = player['hp'] - np.maximum(player_hp, 0)
+    return {
+        'fights': fights,
+        'win_rate': float(np.mean(result == 1)),
+        'defeat_rate': float(np.mean(result == 2)),
+        'flee_rate': float(np.mean(result == 3)),
+        'avg_rounds': float(rounds.mean()),
+        'avg_hp_lost': float(hp_lost.mean()),
+        'avg_hp_lost_pct': float(hp_lost.mean() / max(1, player['hp_max'])),
+    }
+
+
+def run_balance_grid(levels=(1,), class_names=None, race_names=None, difficulties=None,
+                     monsters=None, fights=1000, flee_fraction=None, seed=None, conn=None):
+    """
+    Percorre a grade nível × classe × raça × monstro × dificuldade e retorna uma
+    lista de linhas (dicionários com RESULT_COLUMNS). Sem 'monsters', usa os
+    monstros que o jogo sortearia para cada nível (índice de monstros).
+    """
+    _require_numpy()
+    conn = conn or get_shared_connection()
+    reference = get_reference_data(conn)
+    rng = np.random.default_rng(seed)
+
+    classes = [c for c in reference.all_classes() if class_names is None or c['name'] in class_names]
+    races = [r for r in reference.all_races() if race_names is None or r['name'] in race_names]
+    difficulties = list(difficulties or DIFFICULTY_MODIFIERS)
+
+    rows = []
+    for level in levels:
+        level_monsters = monsters if monsters is not None else get_monster_index(conn).monsters_for_level(level)
+        for class_data in classes:
+            for race_data in races:
+                for difficulty in difficulties:
+                    player = build_player_snapshot(class_data, race_data, level, difficulty)
+                    for monster_data in level_monsters:
+                        stats = simulate_cell(player, monster_data, difficulty, fights, rng, flee_fraction)
+                        row = {
+                            'level': level,
+                            'class': class_data['name'],
+                            'race': race_data['name'],
+                            'monster': monster_data['name'],
+                            'difficulty': difficulty,
+                        }
+                        row.update(stats)
+                        rows.append(row)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de balanceamento (Monte Carlo, NumPy).")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--classes", nargs="+", help="Classes a simular (padrão: todas)")
+    parser.add_argument("--races", nargs="+", help="Raças a simular (padrão: todas)")
+    parser.add_argument("--difficulties", nargs="+", help="Dificuldades (padrão: todas de DIFFICULTY_MODIFIERS)")
+    parser.add_argument("--fights", type=int, default=1000, help="Lutas por célula")
+    parser.add_argument("--flee-below", type=float, default=None, help="Foge abaixo desta fração de HP")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--csv", help="Arquivo CSV de saída (padrão: tabela no terminal)")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = run_balance_grid(
+            levels=args.levels, class_names=args.classes, race_names=args.races,
+            difficulties=args.difficulties, fights=args.fights,
+            flee_fraction=args.flee_below, seed=args.seed
+        )
+    except ImportError as e:
+        print(e)
+        return 1
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"{len(rows)} células gravadas em {args.csv}")
+    else:
+        print(f"{'Nív':>3} {'Classe':<12} {'Raça':<10} {'Monstro':<18} {'Dificuldade':<17} "
+              f"{'Vitória':>7} {'Rodadas':>7} {'HP perdido':>10}")
+        for row in rows:
+            print(f"{row['level']:>3} {row['class']:<12} {row['race']:<10} {row['monster']:<18} "
+                  f"{row['difficulty']:<17} {row['win_rate']:>7.1%} {row['avg_rounds']:>7.2f} "
+                  f"{row['avg_hp_lost']:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
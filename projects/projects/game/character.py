@@ -6,6 +6,7 @@ from .db_queries import (
     get_character_inventory,
     get_equipped_items_for_character,
     add_item_to_inventory,
+    remove_item_from_inventory,
     equip_item_from_inventory,
     unequip_item_from_character,
     get_background_by_name,
@@ -15,6 +16,8 @@ from .db_queries import (
     get_item_by_id
 )
 from .utils import calculate_enhanced_damage, calculate_enhanced_value
+from .input_driver import read_input
+from .rng import stream
 
 
 
@@ -27,7 +30,49 @@ attr_map = {
     "car": "charisma"
 }
 
+# Estatísticas derivadas recalculadas sob demanda por Character.recalculate()
+DERIVED_STATS = ('hp_max', 'mana_max', 'resistances', 'ac', 'weapon')
+
+# Quais estatísticas derivadas ficam desatualizadas quando cada campo muda
+STAT_DEPENDENCIES = {
+    'level': ('hp_max', 'mana_max'),
+    'char_class': ('hp_max', 'mana_max', 'ac'),
+    'difficulty': ('hp_max', 'mana_max'),
+    'constitution': ('hp_max',),
+    'intelligence': ('mana_max',),
+    'wisdom': ('mana_max',),
+    'dexterity': ('ac',),
+    'equipment': ('resistances', 'ac', 'weapon'),
+}
+
+def _tracked_field(name):
+    """
+    Cria uma propriedade que marca como sujas as estatísticas derivadas
+    que dependem do campo sempre que ele é alterado.
+    """
+    private_name = f"_{name}"
+    dependent_stats = STAT_DEPENDENCIES.get(name, ())
+
+    def getter(self):
+        return getattr(self, private_name)
+
+    def setter(self, value):
+        setattr(self, private_name, value)
+        self.mark_dirty(*dependent_stats)
+
+    return property(getter, setter)
+
 class Character:
+    level = _tracked_field('level')
+    char_class = _tracked_field('char_class')
+    difficulty = _tracked_field('difficulty')
+    strength = _tracked_field('strength')
+    dexterity = _tracked_field('dexterity')
+    constitution = _tracked_field('constitution')
+    intelligence = _tracked_field('intelligence')
+    wisdom = _tracked_field('wisdom')
+    charisma = _tracked_field('charisma')
+
     @property
     def hp(self):
         return self._hp
@@ -68,6 +113,9 @@ class Character:
 
     def __init__(self, db_connection, id=None, name="", race="", char_class="", background="", level=1, exp=0, exp_max=100, hp=None, hp_max=None, mana=None, mana_max=None, gold=0, strength=None, dexterity=None,
                  constitution=None, intelligence=None, wisdom=None, charisma=None, ac=10, difficulty='Desafio Justo', permadeath=0):
+        # Tudo começa sujo: a primeira chamada a recalculate() calcula todas as estatísticas
+        self._dirty = set(DERIVED_STATS)
+        self._equipped_items = None
         self.conn = db_connection
         self.id = id
         self.name = name
@@ -198,6 +246,27 @@ class Character:
     def charisma_modifier(self):
         return modifier(self.get_effective_charisma())
     
+    def mark_dirty(self, *stats):
+        """
+        Marca estatísticas derivadas como desatualizadas (todas, se nenhuma for informada).
+        'equipment' é aceito como atalho para tudo que depende dos itens equipados.
+        """
+        if not stats:
+            stats = DERIVED_STATS
+        for stat in stats:
+            if stat in STAT_DEPENDENCIES and stat not in DERIVED_STATS:
+                self._dirty.update(STAT_DEPENDENCIES[stat])
+            else:
+                self._dirty.add(stat)
+        # A CA usa a penalidade de destreza calculada junto com as resistências
+        if 'resistances' in self._dirty:
+            self._dirty.add('ac')
+
+    def invalidate_equipment(self):
+        """Descarta os itens equipados em cache (após equipar, desequipar ou aprimorar)."""
+        self._equipped_items = None
+        self.mark_dirty('equipment')
+
     def get_physical_resistance(self):
         return self.physical_resistance
 
@@ -318,26 +387,33 @@ class Character:
     
     def recalculate(self):
         """
-        Recalcula todos os atributos derivados do personagem,
-        incluindo AC, dano da arma e atributo de ataque principal,
-        com base nos itens equipados e seus aprimoramentos.
+        Recalcula os atributos derivados do personagem que estiverem marcados
+        como sujos (HP/Mana máximos, resistências, AC e dados da arma).
+        Chamadas sem nenhuma alteração pendente não fazem nada.
         """
-        if not self.id:
+        if not self.id or not self._dirty:
             return
 
-        # Recalcula HP e Mana máximos (podem mudar com nível, raça, etc.)
-        self.hp_max = self.calculate_hp()
-        self.mana_max = self.calculate_mana()
+        dirty = self._dirty
+        if 'hp_max' in dirty:
+            self.hp_max = self.calculate_hp()
+        if 'mana_max' in dirty:
+            self.mana_max = self.calculate_mana()
+        if 'resistances' in dirty:
+            self._recalculate_resistances()
+        if 'ac' in dirty:
+            self.ac = self.calculate_ac()
+        if 'weapon' in dirty:
+            self._recalculate_weapon()
+        dirty.clear()
 
-        # Resetar resistências e penalidades
+    def _recalculate_resistances(self):
+        """Recalcula resistências e penalidade de destreza a partir dos itens equipados."""
         self.physical_resistance = 0
         self.magical_resistance = 0
         self.dexterity_penalty = 0
-        
-        equipped_items = get_equipped_items_for_character(self.conn, self.id)
-        
-        # Calcular resistências e penalidades
-        for item in equipped_items:
+
+        for item in self.get_equipped_items():
             if item.get('category') == 'armor':
                 # Aplica redução de penalidade com aprimoramento
                 penalty_reduction = item.get('enhancement_level', 0) // 3
@@ -354,20 +430,17 @@ class Character:
                 # Escudos também podem fornecer resistências
                 self.physical_resistance += item.get('physical_resistance', 0)
                 self.magical_resistance += item.get('magical_resistance', 0)
-        
-        # Recalcula AC com base nos itens equipados
-        self.ac = self.calculate_ac()
-        
+
+    def _recalculate_weapon(self):
+        """Atualiza dado de dano, tipo de dano e atributo de ataque da arma principal."""
         # Resetar arma e tipo de dano para valores padrão antes de aplicar itens
         self.weapon_dice = '1d4'
         self.damage_type = 'physical'  # Padrão para dano físico
         self.main_attack_attribute = 'strength'
         
-        equipped_items = get_equipped_items_for_character(self.conn, self.id)
-        
         # Encontra a arma principal equipada (se houver)
         equipped_weapon = None
-        for item in equipped_items:
+        for item in self.get_equipped_items():
             if item.get('category') == 'weapon' and item.get('equip_slot') == 'main_hand':
                 equipped_weapon = item
                 break
@@ -392,7 +465,7 @@ class Character:
                 weapon = item
                 break
         
-        roll = roll_dice("1d20")
+        roll = roll_dice("1d20", stream("combat"))
         is_critical = (roll == 20)
         
         # CORREÇÃO: Usa o valor efetivo do atributo de ataque para o cálculo do bônus
@@ -421,14 +494,14 @@ class Character:
         
         if not weapon:
             # Se não tiver arma equipada, usa dano desarmado
-            base_damage = roll_dice("1d4")
+            base_damage = roll_dice("1d4", stream("combat"))
             return base_damage, "physical"  # Retorna dano e tipo
         
         # Calcula o dano base da arma usando a função de utilidade que já considera aprimoramento
         dice_to_roll = calculate_enhanced_damage(weapon)
         
         # Rola os dados de dano
-        total_damage = roll_dice(dice_to_roll)
+        total_damage = roll_dice(dice_to_roll, stream("combat"))
         
         # CORREÇÃO: Usa o valor efetivo do atributo de ataque para o cálculo do bônus
         effective_attack_attribute = self.get_effective_attribute(self.main_attack_attribute)
@@ -495,7 +568,7 @@ class Character:
             dice_size = int(hit_dice.split('d')[1])
             roll_hp = (dice_size // 2) + 1
         else:
-            roll_hp = roll_dice(hit_dice)
+            roll_hp = roll_dice(hit_dice, stream("character"))
         
         con_mod = modifier(self.get_effective_constitution())
         hp_gain = max(1, roll_hp + con_mod)
@@ -509,7 +582,7 @@ class Character:
                 dice_size = int(mana_dice.split('d')[1])
                 roll_mana = (dice_size // 2) + 1
             else:
-                roll_mana = roll_dice(mana_dice)
+                roll_mana = roll_dice(mana_dice, stream("character"))
             
             int_mod = modifier(self.get_effective_intelligence())
             wis_mod = modifier(self.get_effective_wisdom())
@@ -541,7 +614,7 @@ class Character:
             choices = []
             for i in range(1, 4):
                 while True:
-                    choice = input(f"\nEscolha o {i}º atributo para aumentar (1-6): ")
+                    choice = read_input(f"\nEscolha o {i}º atributo para aumentar (1-6): ")
                     if choice in attributes and attributes[choice] not in choices:
                         choices.append(attributes[choice])
                         break
@@ -563,21 +636,39 @@ class Character:
         return get_character_inventory(self.conn, self.id) if self.id else []
     
     def get_equipped_items(self):
-        """Retorna a lista de itens equipados pelo personagem, com detalhes de aprimoramento."""
-        if self.id:
-            return get_equipped_items_for_character(self.conn, self.id)
-        return []  # Retorna lista vazia se não tiver ID
+        """
+        Retorna a lista de itens equipados pelo personagem, com detalhes de aprimoramento.
+        A lista fica em cache até invalidate_equipment() ser chamado.
+        """
+        if not self.id:
+            return []  # Retorna lista vazia se não tiver ID
+        if self._equipped_items is None:
+            self._equipped_items = get_equipped_items_for_character(self.conn, self.id)
+        return self._equipped_items
 
     def equip_item(self, inventory_id):
         success, message = equip_item_from_inventory(self.conn, self.id, inventory_id)
         if success:
-            self.recalculate()  # Já está presente
+            self.invalidate_equipment()
+            self.recalculate()
         return success, message
 
+    def remove_from_inventory(self, inventory_id, quantity=1):
+        """
+        Remove itens do inventário (venda, perda em combate). Se a linha some, o
+        banco desequipa o item (ON DELETE SET NULL), então o cache é descartado.
+        """
+        success = remove_item_from_inventory(self.conn, inventory_id, quantity)
+        if success:
+            self.invalidate_equipment()
+            self.recalculate()
+        return success
+
     def unequip_item(self, slot_technical_name):
         success, message = unequip_item_from_character(self.conn, self.id, slot_technical_name)
         if success:
-            self.recalculate()  # Já está presente
+            self.invalidate_equipment()
+            self.recalculate()
         return success, message
 
     def equip_starting_items(self):
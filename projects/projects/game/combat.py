@@ -1,29 +1,89 @@
 import random
-import time
-import os
 from .character import Character
 from .monster import Monster
-from .db_queries import load_monsters_by_level, add_item_to_inventory, remove_item_from_inventory
-from .utils import modifier, roll_dice, get_display_name, calculate_enhanced_damage, calculate_enhanced_armor_bonus
+from .db_queries import add_item_to_inventory
+from .monster_index import get_monster_index
+from .utils import get_display_name, calculate_enhanced_damage, calculate_enhanced_armor_bonus
 from .config import DIFFICULTY_MODIFIERS
 from .database import delete_character
+from .combat_engine import (CombatEngine, PackCombatEngine, snapshot_character, monster_from_data,
+                            pack_size, build_pack)
+from .combat_log import CombatLog, combat_setup
+from .screen import clear_screen, get_screen
+from .input_driver import read_input
+from .pacing import pause
+from .rng import stream
 
 class Combat:
+    """
+    Apresentação interativa do combate. As regras ficam em CombatEngine;
+    esta classe só exibe os eventos, lê as escolhas do jogador e aplica as
+    consequências (recompensas, perdas e permadeath).
+
+    Encontros com mais de um monstro usam um bando (self.pack, MonsterBatch)
+    e PackCombatEngine; nesse caso self.monster é None.
+
+    As rolagens do combate vêm de um random.Random com a semente self.seed
+    (tirada do fluxo "combat"), e cada evento vai para self.log
+    (game/combat_log.py), o que permite refazer a luta depois.
+    """
+    # Tipos de monstro listados no resumo do bando
+    PACK_SUMMARY_LINES = 6
+
     def __init__(self, player: Character, db_connection):
         self.player = player
         self.conn = db_connection
         self.difficulty_modifiers = DIFFICULTY_MODIFIERS.get(player.difficulty, DIFFICULTY_MODIFIERS["Desafio Justo"])
-        self.monster = self.generate_monster()
+        self.pack = self.generate_pack()
+        self.monster = None if self.pack else self.generate_monster()
         self.permadeath_active = player.permadeath
         player.recalculate()
-        print(f"\nUm {self.monster.name} selvagem aparece!")
-        time.sleep(2)
+        self.seed = stream("combat").getrandbits(63)
+        rng = random.Random(self.seed)
+        snapshot = snapshot_character(player)
+        enemies = self.pack or self.monster
+        # O ponto de partida é copiado antes da luta alterar o HP dos monstros
+        self.log = CombatLog(player, self.seed, combat_setup(snapshot, enemies, self.difficulty_modifiers))
+        if self.pack:
+            self.engine = PackCombatEngine(snapshot, self.pack, self.difficulty_modifiers, rng)
+            print(f"\nUm bando de {len(self.pack)} monstros aparece: {self.pack_composition()}!")
+        else:
+            self.engine = CombatEngine(snapshot, self.monster, self.difficulty_modifiers, rng)
+            print(f"\nUm {self.monster.name} selvagem aparece!")
+        pause(2)
+
+    @property
+    def enemy_name(self):
+        return "o bando" if self.pack else self.monster.name
+
+    def generate_pack(self):
+        """
+        Sorteia o tamanho do encontro pela região e dificuldade; com mais de um
+        monstro, monta o bando. Retorna None para encontros de um monstro só.
+        """
+        region = getattr(self.player, 'location', None)
+        size = pack_size(self.player.level, region, self.difficulty_modifiers)
+        if size <= 1:
+            return None
+        pack = build_pack(get_monster_index(self.conn), self.player.level, region,
+                          self.difficulty_modifiers, size)
+        return pack if len(pack) > 1 else None
+
+    def pack_composition(self, alive_only=False):
+        """Resumo do bando: '3x Goblin, 1x Lobo'."""
+        counts = {}
+        hp = self.pack.columns['hp']
+        for index in range(len(self.pack)):
+            if not alive_only or hp[index] > 0:
+                name = self.pack.name(index)
+                counts[name] = counts.get(name, 0) + 1
+        return ", ".join(f"{count}x {name}" for name, count in counts.items())
 
     def generate_monster(self) -> Monster:
-        """Gera um monstro apropriado para o nível do jogador."""
-        valid_monsters = load_monsters_by_level(self.conn, self.player.level)
+        """Gera um monstro apropriado para o nível e a região do jogador."""
+        monster_data = get_monster_index(self.conn).draw(self.player.level, getattr(self.player, 'location', None))
 
-        if not valid_monsters:
+        if not monster_data:
             print("Aviso: Nenhum monstro válido encontrado no DB. Usando um Rato Gigante como padrão.")
             return Monster(
                 name="Rato Gigante", 
@@ -36,43 +96,24 @@ class Combat:
                 attack_type="physical"
             )
 
-        monster_data = random.choice(valid_monsters)
-        
-        # Aplicar o multiplicador de HP do monstro com base na dificuldade
-        hp_max = int(monster_data.get('hp', 10) * self.difficulty_modifiers.get("monster_hp_multiplier", 1.0))
-        ac = monster_data.get('ac', 10)
-        
-        return Monster(
-            name=monster_data['name'],
-            level=monster_data['level'],
-            hp_max=hp_max,
-            ac=ac,
-            attack_bonus=monster_data.get('attack_bonus', 0),
-            damage_dice=monster_data['damage_dice'],
-            exp_reward=monster_data['exp_reward'],
-            gold_dice=monster_data['gold_dice'],
-            strength=monster_data.get('strength', 10),
-            dexterity=monster_data.get('dexterity', 10),
-            constitution=monster_data.get('constitution', 10),
-            intelligence=monster_data.get('intelligence', 10),
-            wisdom=monster_data.get('wisdom', 10),
-            charisma=monster_data.get('charisma', 10),
-            main_attack_attribute=monster_data.get('main_attack_attribute', 'strength'),
-            attack_type=monster_data.get('attack_type', 'physical'),
-            physical_resistance=monster_data.get('physical_resistance', 0),
-            magical_resistance=monster_data.get('magical_resistance', 0)
-        )
+        return monster_from_data(monster_data, self.difficulty_modifiers)
     
     def start(self):
         """Inicia e gerencia o combate até sua conclusão"""
+        result = self._fight()
+        # Morte permanente apaga o personagem: o registro do combate é gravado na hora
+        self.log.finish(self.conn, result, immediate=(result == "permadeath"))
+        return result
+
+    def _fight(self):
         print(f"\n{'='*50}")
-        print(f"     ☠ BATALHA CONTRA {self.monster.name.upper()} ☠")
+        print(f"     ☠ BATALHA CONTRA {self.enemy_name.upper()} ☠")
         print(f"{'='*50}")
         
         while True:
             # Turno do jogador
             self.display_status()
-            choice = input("\n1. Atacar\n2. Fugir\nEscolha: ").strip()
+            choice = read_input("\n1. Atacar\n2. Fugir\nEscolha: ").strip()
             
             if choice == "1":
                 monster_dead = self.player_attack()
@@ -85,11 +126,11 @@ class Combat:
                     return "fled"
             else:
                 print("Opção inválida!")
-                time.sleep(1)
+                pause(1)
                 continue
             
-            # Turno do monstro, apenas se o monstro não estiver morto
-            if not self.monster.hp <= 0:
+            # Turno do monstro, apenas se ainda houver monstro vivo
+            if not self.engine.enemies_defeated():
                 player_dead = self.monster_attack()
                 if player_dead:
                     permadeath_result = self.defeat()
@@ -97,7 +138,12 @@ class Combat:
             
     def display_status(self):
         """Mostra status do combate com informações de resistências."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Desenhado como quadro: entre turnos só as linhas alteradas (vida, mana) são reescritas
+        with get_screen().frame():
+            self._print_status()
+
+    def _print_status(self):
+        clear_screen()
         border = "═" * 52
         separator = "─" * 52
         skull = "☠"
@@ -110,7 +156,6 @@ class Combat:
         dex_penalty = self.player.dexterity_penalty
 
         player_hp_percent = min(100, int((self.player.hp / self.player.hp_max) * 100))
-        monster_hp_percent = min(100, int((self.monster.hp / self.monster.hp_max) * 100))
         
         player_mana_info = ""
         if self.player.mana_max > 0:
@@ -119,7 +164,7 @@ class Combat:
             player_mana_info += f"\n      [{'▓' * (mana_percent // 5)}{'░' * (20 - (mana_percent // 5))}] {mana_percent}%"
 
         print(f"\n{border}")
-        print(f"    {skull} BATALHA CONTRA {self.monster.name.upper()} {skull}")
+        print(f"    {skull} BATALHA CONTRA {self.enemy_name.upper()} {skull}")
         print(f"{border}")
         print(f"\n👤 {self.player.name} [Lvl {self.player.level}]")
         print(f"  {heart_drop} Vida: {self.player.hp}/{self.player.hp_max}")
@@ -153,6 +198,12 @@ class Combat:
             print(f"  🛡️ Escudo: {get_display_name(shield_item)} (+{shield_bonus} AC)")
         
         print(f"\n{separator}")
+        if self.pack:
+            self._print_pack_status()
+            print(f"{border}\n")
+            return
+
+        monster_hp_percent = min(100, int((self.monster.hp / self.monster.hp_max) * 100))
         print(f"👹 {self.monster.name} [Lvl {self.monster.level}]")
         print(f"  {heart_drop} Vida: {self.monster.hp}/{self.monster.hp_max}")
         print(f"      [{'█' * (monster_hp_percent // 5)}{'░' * (20 - (monster_hp_percent // 5))}] {monster_hp_percent}%")
@@ -163,136 +214,138 @@ class Combat:
         print(f"{border}\n")
 
 
+    def _print_pack_status(self):
+        """Resumo compacto do bando: uma linha por tipo de monstro vivo e o alvo atual."""
+        pack = self.pack
+        columns = pack.columns
+        groups = {}
+        for index in pack.alive_indices():
+            group = groups.setdefault(columns['template'][index], [0, 0, 0])
+            group[0] += 1
+            group[1] += columns['hp'][index]
+            group[2] += columns['hp_max'][index]
+
+        print(f"👹 Bando: {sum(g[0] for g in groups.values())}/{len(pack)} de pé")
+        for template, (count, hp, hp_max) in list(groups.items())[:self.PACK_SUMMARY_LINES]:
+            row = pack.templates[template]
+            print(f"  {count:>2}x {row['name']:<22} ❤️ {hp}/{hp_max}  🛡 AC {row.get('ac', 10)}")
+        if len(groups) > self.PACK_SUMMARY_LINES:
+            print(f"  ... e mais {len(groups) - self.PACK_SUMMARY_LINES} tipos")
+
+        target = self.engine.target()
+        if target is not None:
+            print(f"  🎯 Alvo: {pack.name(target)} ({columns['hp'][target]}/{columns['hp_max'][target]})")
+
     def player_attack(self):
         """Ataque do jogador com feedback melhorado."""
-        self.player.recalculate()
-        attack_roll, critical, dice_roll = self.player.attack()
+        event = self.engine.player_attack()
+        self.log.record(event)
+        dice_roll = event['roll']
         
-        print(f"\nSua rolagem de ataque: {attack_roll} (Dado: {dice_roll} + Bônus: {attack_roll - dice_roll})")
-        time.sleep(1.2)
+        print(f"\nSua rolagem de ataque: {event['attack_roll']} (Dado: {dice_roll} + Bônus: {event['attack_bonus']})")
+        pause(1.2)
 
-        if critical:
+        if event['critical']:
             print("⚡ CRÍTICO! Dano dobrado!")
-            time.sleep(1)
+            pause(1)
 
-        if attack_roll >= self.monster.ac or critical:
-            # Agora calculate_damage retorna (dano, tipo_de_dano)
-            damage, damage_type = self.player.calculate_damage(critical)
-            
-            # Aplica modificador de dificuldade ao dano causado pelo jogador
-            damage = int(damage * self.difficulty_modifiers.get("damage_dealt", 1.0))
-            
-            # Adicione o dano critico se o inimigo tiver chance de critico
-            if critical and "enemy_crit_chance_bonus" in self.difficulty_modifiers:
-                damage += damage * 0.15
-
-            # Aplica a resistência do monstro ao dano
-            if damage_type == "physical":
-                damage_after_resistance = max(1, damage - self.monster.physical_resistance)
-            else:
-                damage_after_resistance = max(1, damage - self.monster.magical_resistance)
-                
-            # Reduz o HP do monstro
-            self.monster.hp -= damage_after_resistance
-            
+        if event['hit']:
             # Exibe informações detalhadas
-            print(f"🔥 Você acerta o {self.monster.name} causando {damage_after_resistance} de dano {damage_type}!")
-            
-            if damage > damage_after_resistance:
-                resistance_value = damage - damage_after_resistance
-                print(f"  🛡️ Resistência do monstro reduziu {resistance_value} de dano!")
+            target_name = event.get('target_name', self.enemy_name)
+            print(f"🔥 Você acerta o {target_name} causando {event['damage']} de dano {event['damage_type']}!")
             
-            time.sleep(1.5)
+            if event['resisted'] > 0:
+                print(f"  🛡️ Resistência do monstro reduziu {event['resisted']} de dano!")
+            if self.pack and event['monster_dead'] and event['remaining']:
+                print(f"  ☠ {target_name} cai! Restam {event['remaining']} no bando.")
             
-            # Verifica se o monstro morreu
-            return self.monster.hp <= 0
+            pause(1.5)
         else:
-            print(f"Você erra o ataque! O {self.monster.name} tinha {self.monster.ac} de AC.")
-            time.sleep(1.5)
-            return False
+            print(f"Você erra o ataque! O {event.get('target_name', self.enemy_name)} tinha {event['target_ac']} de AC.")
+            pause(1.5)
+
+        return self.engine.enemies_defeated()
 
     def monster_attack(self):
         """Ataque do monstro com feedback visual aprimorado."""
-        # Se houver chance de crítico extra para inimigos, aplica aqui
-        crit_bonus_chance = self.difficulty_modifiers.get("enemy_crit_chance_bonus", 0)
-        is_crit_bonus_active = random.random() < crit_bonus_chance
-
-        attack_roll, critical, dice_roll = self.monster.attack()
-        attack_bonus = attack_roll - dice_roll
-
-        # Verifica se o crítico adicional foi ativado
-        if is_crit_bonus_active:
-            critical = True
+        event = self.engine.monster_attack()
+        self.log.record(event)
+        if self.pack:
+            return self._show_pack_attack(event)
 
         print(f"\n{self.monster.name} ataca!")
-        time.sleep(1)
+        pause(1)
         
-        print(f"Rolagem do monstro: {dice_roll} (dado) + {attack_bonus} (bônus) = {attack_roll}")
-        time.sleep(1.2)
+        print(f"Rolagem do monstro: {event['roll']} (dado) + {event['attack_bonus']} (bônus) = {event['attack_roll']}")
+        pause(1.2)
 
-        if critical:
+        if event['critical']:
             print("☠️  CRÍTICO DO MONSTRO! Você sente a dor profunda!")
-            time.sleep(1.5)
+            pause(1.5)
 
-        if attack_roll >= self.player.ac or critical:
-            # O monstro calcula o dano (sem tipo, pois o tipo já está definido)
-            raw_damage = self.monster.calculate_damage(critical)
-            
-            # Aplica modificador de dificuldade ao dano recebido pelo jogador
-            modified_damage = int(raw_damage * self.difficulty_modifiers.get("damage_received", 1.0))
-            
-            # O jogador toma dano com o tipo correto
-            is_player_dead, actual_damage, damage_reduced = self.player.take_damage(
-                modified_damage, 
-                self.monster.attack_type
-            )
+        if event['hit']:
+            # O HP do combate é a fonte da verdade; o personagem é sincronizado
+            self.player.hp = self.engine.player['hp']
             
             print(f"💥 O ataque ACERTOU!")
-            print(f"  Tipo de dano: {self.monster.attack_type}")
-            print(f"  Dano bruto: {modified_damage}")
+            print(f"  Tipo de dano: {event['damage_type']}")
+            print(f"  Dano bruto: {event['raw_damage']}")
             
-            if damage_reduced > 0:
-                print(f"  🛡️ Sua resistência reduziu {damage_reduced} de dano!")
+            if event['resisted'] > 0:
+                print(f"  🛡️ Sua resistência reduziu {event['resisted']} de dano!")
                 
-            print(f"  Dano efetivo: {actual_damage}")
-            time.sleep(3.5)
-            return is_player_dead
+            print(f"  Dano efetivo: {event['damage']}")
+            pause(3.5)
         else:
             print(f"🛡️ O ataque ERROU!")
             print(f"  Sua AC: {self.player.ac}")
-            print(f"  Ataque necessário: {self.player.ac} (rolagem: {attack_roll})")
-            time.sleep(1.3)
-            return False
+            print(f"  Ataque necessário: {self.player.ac} (rolagem: {event['attack_roll']})")
+            pause(1.3)
+
+        return event['player_dead']
             
+    def _show_pack_attack(self, event):
+        """Turno do bando em poucas linhas: acertos, críticos e o dano somado."""
+        self.player.hp = self.engine.player['hp']
+        print(f"\nO bando ataca! {event['hits']} de {event['attackers']} golpes acertam", end="")
+        print(f" ({event['criticals']} críticos)." if event['criticals'] else ".")
+        if event['hits']:
+            print(f"  Dano bruto: {event['raw_damage']}")
+            if event['resisted'] > 0:
+                print(f"  🛡️ Sua resistência reduziu {event['resisted']} de dano!")
+            print(f"  Dano efetivo: {event['damage']}")
+        pause(2)
+        return event['player_dead']
+
     def attempt_flee(self):
         """Tentativa de fuga com teste de destreza."""
         print("\nVocê tenta fugir...")
-        time.sleep(0.5)
+        pause(0.5)
 
-        self.player.recalculate()
-        
-        player_roll = roll_dice("1d20") + modifier(self.player.get_effective_intelligence())
-        monster_roll = roll_dice("1d20") + modifier(self.monster.dexterity)
+        event = self.engine.attempt_flee()
+        self.log.record(event)
 
-        print(f"Seu teste de fuga: {player_roll} vs. Teste do monstro: {monster_roll}")
-        time.sleep(1.5)
+        print(f"Seu teste de fuga: {event['player_roll']} vs. Teste do monstro: {event['monster_roll']}")
+        pause(1.5)
 
-        if player_roll > monster_roll:
+        if event['success']:
             return True
         else:
             print("A fuga falhou! O monstro bloqueia seu caminho!")
-            time.sleep(1)
+            pause(1)
             return False
 
     def get_random_item(self):
         """Retorna um item aleatório apropriado para o nível do jogador."""
+        # O sorteio usa o fluxo "loot" (e não RANDOM() do SQLite) para ser reproduzível
         cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM items 
-            WHERE category IN ('weapon', 'armor', 'shield', 'consumable', 'misc')
-            ORDER BY RANDOM() 
-            LIMIT 1
-        ''')
+        where = "WHERE category IN ('weapon', 'armor', 'shield', 'consumable', 'misc')"
+        cursor.execute(f"SELECT COUNT(*) FROM items {where}")
+        total = cursor.fetchone()[0]
+        if not total:
+            return None
+        cursor.execute(f"SELECT * FROM items {where} ORDER BY id LIMIT 1 OFFSET ?",
+                       (stream("loot").randrange(total),))
         item = cursor.fetchone()
         if not item:
             return None
@@ -309,14 +362,15 @@ class Combat:
             print("\nVocê não tem itens na mochila para perder!")
             return
             
-        item_to_lose = random.choice(unequipped_items)
-        success = remove_item_from_inventory(self.conn, item_to_lose['inventory_id'], quantity=1)
+        item_to_lose = stream("loot").choice(unequipped_items)
+        self.log.record({'type': 'item_lost', 'item_id': item_to_lose.get('item_base_id')})
+        success = self.player.remove_from_inventory(item_to_lose['inventory_id'], quantity=1)
         
         if success:
             print(f"\n⚠️ Você perdeu '{get_display_name(item_to_lose)}' durante a batalha!")
         else:
             print(f"\nNão foi possível remover '{get_display_name(item_to_lose)}' do seu inventário.")
-        time.sleep(1.5)
+        pause(1.5)
 
     def victory(self):
         """Recompensas por vitória com itens aleatórios."""
@@ -327,12 +381,20 @@ class Combat:
         heart_drop = "❤️ "
         mana_drop = "🔷"
 
-        exp_earned = int(self.monster.exp_reward * self.difficulty_modifiers.get("exp_multiplier", 1.0))
-        base_gold = self.monster.get_gold_reward()
+        if self.pack:
+            columns = self.pack.columns
+            base_exp = sum(columns['exp_reward'])
+            base_gold = sum(self.pack.gold_dice[template].roll(stream("loot")) for template in columns['template'])
+            epitaph = f" O bando ({self.pack_composition()}) foi derrotado. A vitória é sua."
+        else:
+            base_exp = self.monster.exp_reward
+            base_gold = self.monster.get_gold_reward()
+            epitaph = f" O {self.monster.name} desaba sem vida. A vitória é sua."
+        exp_earned = int(base_exp * self.difficulty_modifiers.get("exp_multiplier", 1.0))
         gold_earned = int(base_gold * self.difficulty_modifiers.get("gold_multiplier", 1.0))
 
         print(f"\n{border}")
-        print(f" O {self.monster.name} desaba sem vida. A vitória é sua.")
+        print(epitaph)
         print(f"{border}")
         
         print(f"\n{heart_drop} Vida: {self.player.hp}/{self.player.hp_max}")
@@ -346,16 +408,15 @@ class Combat:
         print(f"  {star} EXP Ganha: +{exp_earned}")
         print(f"  {coin} Ouro Encontrado: +{gold_earned}")
 
-        if random.random() < 0.4:
-            item_base_data = self.get_random_item()
-            if item_base_data:
-                try:
-                    add_item_to_inventory(self.conn, self.player.id, item_base_data['id'], quantity=1, enhancement_level=0, enhancement_type=None)
-                    print(f"  🎁 Item Encontrado: '{get_display_name(item_base_data)}'!")
-                except Exception as e:
-                    print(f"ERRO ao adicionar item: {str(e)}")
-            else:
-                print("  Nenhum item encontrado.")
+        item_base_data = self.get_random_item() if stream("loot").random() < 0.4 else None
+        self.log.record({'type': 'rewards', 'exp': exp_earned, 'gold': gold_earned,
+                         'item_id': item_base_data['id'] if item_base_data else 0})
+        if item_base_data:
+            try:
+                add_item_to_inventory(self.conn, self.player.id, item_base_data['id'], quantity=1, enhancement_level=0, enhancement_type=None)
+                print(f"  🎁 Item Encontrado: '{get_display_name(item_base_data)}'!")
+            except Exception as e:
+                print(f"ERRO ao adicionar item: {str(e)}")
         else:
             print("  Nenhum item encontrado.")
 
@@ -368,7 +429,7 @@ class Combat:
         self.player.recalculate()
         
         print(f"\n{border}")
-        input("Pressione Enter para continuar...")
+        read_input("Pressione Enter para continuar...")
 
     def defeat(self):
         """Derrota com perda de itens e tratamento de permadeath."""
@@ -377,7 +438,7 @@ class Combat:
 
         print(f"\n{border}")
         print(f" {skull} Você foi derrotado...")
-        print(f" {skull} Sua visão escurece enquanto o {self.monster.name} ruge em triunfo.")
+        print(f" {skull} Sua visão escurece enquanto {self.enemy_name if self.pack else 'o ' + self.monster.name} ruge em triunfo.")
         print(f"{border}")
 
         # Verifica se o modo permadeath está ativo (0 para não, 1 para sim)
@@ -393,10 +454,10 @@ class Combat:
             else:
                 print("Houve um erro ao deletar o personagem do banco de dados.")
                 
-            input("Pressione Enter para encerrar...")
+            read_input("Pressione Enter para encerrar...")
             return True
         else:
-            if random.random() < 0.3:
+            if stream("loot").random() < 0.3:
                 self.lose_random_item()
             
             # Multiplicador de cura recebida também afeta a cura ao ser derrotado
@@ -406,6 +467,6 @@ class Combat:
             self.player.recalculate()
             
             print(f"\nPor um triz, você sobrevive e acorda horas depois, com o corpo dolorido.")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
         
         return False # Retorna False se o personagem não tiver permadeath
\ No newline at end of file
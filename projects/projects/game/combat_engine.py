@@ -0,0 +1,512 @@
+# game/combat_engine.py
+"""
+Núcleo de combate sem interface (sem input, print, sleep ou banco de dados).
+
+Cada ação (ataque do jogador, ataque do monstro, fuga) devolve um dicionário
+de evento com as rolagens e o resultado. A classe Combat usa este núcleo para
+o combate interativo, e simulate_fights() roda lutas em lote para ajustar o
+balanceamento de DIFFICULTY_MODIFIERS.
+
+Encontros com vários monstros usam PackCombatEngine: o bando fica em um
+MonsterBatch e o turno dos monstros é resolvido de uma vez (rolagens contra a
+AC e as resistências do jogador, dano somado em um único evento), com NumPy
+quando o bando é grande e ele está instalado.
+"""
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o bando é resolvido em Python puro
+    np = None
+
+from .config import (DIFFICULTY_MODIFIERS, REGION_PACK_SIZES, DEFAULT_PACK_SIZE,
+                     PACK_LEVEL_STEP, MAX_PACK_SIZE)
+from .monster import Monster
+from .monster_batch import ATTACK_TYPES, MonsterBatch
+from .rng import stream
+from .utils import modifier, roll_dice, calculate_attack_bonus, calculate_enhanced_damage
+
+# Limite de segurança para lutas simuladas que nunca terminam
+MAX_ROUNDS = 500
+
+# A partir deste tamanho o turno do bando é vetorizado com NumPy. Abaixo disso
+# o custo fixo por tipo de monstro no NumPy supera o laço em Python puro.
+VECTORIZE_MIN_PACK = 256
+
+
+def get_difficulty_modifiers(difficulty):
+    """Modificadores da dificuldade informada (Desafio Justo como padrão)."""
+    return DIFFICULTY_MODIFIERS.get(difficulty, DIFFICULTY_MODIFIERS["Desafio Justo"])
+
+
+def snapshot_character(character):
+    """
+    Extrai do personagem tudo o que o combate precisa, como um dicionário simples.
+    O personagem deve estar recalculado (Combat faz isso ao iniciar).
+    """
+    weapon = next(
+        (item for item in character.get_equipped_items()
+         if item['category'] == 'weapon' and item.get('equip_slot') == 'main_hand'),
+        None
+    )
+    attack_attr_mod = modifier(character.get_effective_attribute(character.main_attack_attribute))
+
+    if weapon:
+        weapon_dice = calculate_enhanced_damage(weapon)
+        attack_bonus = attack_attr_mod + calculate_attack_bonus(weapon)
+        damage_bonus = attack_attr_mod
+        damage_type = character.damage_type
+        crit_multiplier = 2
+    else:
+        # Desarmado: 1d4 físico, sem modificador de atributo no dano
+        weapon_dice = '1d4'
+        attack_bonus = attack_attr_mod
+        damage_bonus = 0
+        damage_type = 'physical'
+        crit_multiplier = 1  # Character.calculate_damage não dobra o dano desarmado
+
+    return {
+        'name': character.name,
+        'level': character.level,
+        'hp': character.hp,
+        'hp_max': character.hp_max,
+        'ac': character.ac,
+        'physical_resistance': character.physical_resistance,
+        'magical_resistance': character.magical_resistance,
+        'attack_bonus': attack_bonus,
+        'weapon_dice': weapon_dice,
+        'damage_bonus': damage_bonus,
+        'damage_type': damage_type,
+        'crit_multiplier': crit_multiplier,
+        'flee_bonus': modifier(character.get_effective_intelligence()),
+        'difficulty': character.difficulty,
+    }
+
+
+def monster_from_data(monster_data, difficulty_modifiers):
+    """Cria um Monster a partir de uma linha da tabela monsters, aplicando o HP da dificuldade."""
+    return Monster.from_row(monster_data, difficulty_modifiers.get("monster_hp_multiplier", 1.0))
+
+
+# --- Políticas de decisão do jogador -------------------------------------
+# Uma política recebe (player, monster) e devolve "attack" ou "flee".
+
+def always_attack(player, monster):
+    return "attack"
+
+
+def flee_below(hp_fraction):
+    """Ataca enquanto o HP estiver acima da fração informada; abaixo dela, tenta fugir."""
+    def policy(player, monster):
+        if player['hp'] < player['hp_max'] * hp_fraction:
+            return "flee"
+        return "attack"
+    return policy
+
+
+class CombatEngine:
+    """Regras de um combate jogador contra monstro, sem nenhuma interface."""
+
+    def __init__(self, player, monster, difficulty_modifiers=None, rng=None):
+        self.player = player
+        self.monster = monster
+        self.difficulty_modifiers = difficulty_modifiers or get_difficulty_modifiers(player.get('difficulty'))
+        self.rng = rng or stream("combat")
+        self.rounds = 0
+        self.damage_dealt = 0
+        self.damage_taken = 0
+
+    def player_attack(self):
+        """Ataque do jogador contra o monstro."""
+        player = self.player
+        monster = self.monster
+
+        roll = self.rng.randint(1, 20)
+        critical = (roll == 20)
+        attack_roll = roll + player['attack_bonus']
+
+        event = {
+            'type': 'player_attack',
+            'roll': roll,
+            'attack_roll': attack_roll,
+            'attack_bonus': player['attack_bonus'],
+            'critical': critical,
+            'hit': attack_roll >= monster.ac or critical,
+            'target_ac': monster.ac,
+        }
+        if not event['hit']:
+            event['monster_dead'] = False
+            return event
+
+        damage = self._roll_player_damage(critical)
+        if player['damage_type'] == "physical":
+            final_damage = max(1, damage - monster.physical_resistance)
+        else:
+            final_damage = max(1, damage - monster.magical_resistance)
+
+        monster.hp -= final_damage
+        self.damage_dealt += final_damage
+
+        event.update({
+            'raw_damage': damage,
+            'damage': final_damage,
+            'damage_type': player['damage_type'],
+            'resisted': max(0, damage - final_damage),
+            'monster_dead': monster.hp <= 0,
+        })
+        return event
+
+    def _roll_player_damage(self, critical):
+        """Dano de um golpe do jogador que acertou, antes da resistência do alvo."""
+        player = self.player
+        mods = self.difficulty_modifiers
+        damage = roll_dice(player['weapon_dice'], self.rng) + player['damage_bonus']
+        if critical:
+            damage *= player['crit_multiplier']
+        damage = max(1, damage)
+
+        # Modificador de dificuldade sobre o dano causado pelo jogador
+        damage = int(damage * mods.get("damage_dealt", 1.0))
+        if critical and "enemy_crit_chance_bonus" in mods:
+            damage += damage * 0.15
+        return damage
+
+    def enemies_defeated(self):
+        return self.monster.hp <= 0
+
+    def monster_attack(self):
+        """Ataque do monstro contra o jogador."""
+        player = self.player
+        monster = self.monster
+        mods = self.difficulty_modifiers
+
+        # Chance extra de crítico dos inimigos em dificuldades altas
+        crit_bonus_active = self.rng.random() < mods.get("enemy_crit_chance_bonus", 0)
+
+        attack_roll, critical, roll = monster.attack(self.rng)
+        critical = critical or crit_bonus_active
+
+        event = {
+            'type': 'monster_attack',
+            'roll': roll,
+            'attack_roll': attack_roll,
+            'attack_bonus': attack_roll - roll,
+            'critical': critical,
+            'hit': attack_roll >= player['ac'] or critical,
+            'target_ac': player['ac'],
+            'damage_type': monster.attack_type,
+        }
+        if not event['hit']:
+            event['player_dead'] = False
+            return event
+
+        raw_damage = monster.calculate_damage(critical, self.rng)
+        damage = int(raw_damage * mods.get("damage_received", 1.0))
+
+        resistance = 0
+        if monster.attack_type == "physical":
+            resistance = player['physical_resistance']
+        elif monster.attack_type == "magical":
+            resistance = player['magical_resistance']
+
+        actual_damage = max(0, damage - resistance)
+        player['hp'] -= actual_damage
+        self.damage_taken += actual_damage
+
+        event.update({
+            'raw_damage': damage,
+            'damage': actual_damage,
+            'resisted': damage - actual_damage,
+            'player_dead': player['hp'] <= 0,
+        })
+        return event
+
+    def attempt_flee(self):
+        """Teste de fuga: 1d20 + Int do jogador contra 1d20 + Des do monstro."""
+        player_roll = roll_dice("1d20", self.rng) + self.player['flee_bonus']
+        monster_roll = roll_dice("1d20", self.rng) + modifier(self.monster.dexterity)
+        return {
+            'type': 'flee',
+            'player_roll': player_roll,
+            'monster_roll': monster_roll,
+            'success': player_roll > monster_roll,
+        }
+
+    def play_round(self, action):
+        """
+        Executa uma rodada completa: a ação do jogador e, se a luta continuar,
+        o ataque do monstro. Retorna (resultado ou None, eventos da rodada).
+        """
+        self.rounds += 1
+        events = []
+
+        if action == "flee":
+            event = self.attempt_flee()
+            events.append(event)
+            if event['success']:
+                return "fled", events
+        else:
+            event = self.player_attack()
+            events.append(event)
+            if self.enemies_defeated():
+                return "victory", events
+
+        event = self.monster_attack()
+        events.append(event)
+        if event['player_dead']:
+            return "defeat", events
+
+        return None, events
+
+    def run(self, policy=always_attack, max_rounds=MAX_ROUNDS, record_events=False):
+        """
+        Luta até o fim seguindo a política e retorna o resultado estruturado:
+        result ('victory', 'defeat', 'fled' ou 'timeout'), rounds, damage_dealt,
+        damage_taken, player_hp e, opcionalmente, a lista de eventos.
+        """
+        all_events = [] if record_events else None
+        result = None
+
+        while result is None:
+            if self.rounds >= max_rounds:
+                result = "timeout"
+                break
+            result, events = self.play_round(policy(self.player, self.monster))
+            if record_events:
+                all_events.extend(events)
+
+        outcome = {
+            'result': result,
+            'rounds': self.rounds,
+            'damage_dealt': self.damage_dealt,
+            'damage_taken': self.damage_taken,
+            'player_hp': self.player['hp'],
+        }
+        if record_events:
+            outcome['events'] = all_events
+        return outcome
+
+
+class PackCombatEngine(CombatEngine):
+    """
+    Regras de um combate contra um bando (MonsterBatch). O jogador ataca um
+    alvo por vez; os monstros vivos atacam juntos em monster_attack(), que
+    devolve um único evento com o total de acertos e de dano. As políticas
+    recebem o MonsterBatch no lugar do monstro.
+    """
+
+    def __init__(self, player, pack, difficulty_modifiers=None, rng=None):
+        super().__init__(player, pack, difficulty_modifiers, rng)
+        self.pack = pack
+
+    def target(self):
+        """Alvo padrão do jogador: o primeiro monstro vivo."""
+        for index, hp in enumerate(self.pack.columns['hp']):
+            if hp > 0:
+                return index
+        return None
+
+    def enemies_defeated(self):
+        return self.target() is None
+
+    def player_attack(self, target=None):
+        """Ataque do jogador contra um monstro do bando (padrão: target())."""
+        player = self.player
+        pack = self.pack
+        columns = pack.columns
+        target = self.target() if target is None else target
+
+        roll = self.rng.randint(1, 20)
+        critical = (roll == 20)
+        attack_roll = roll + player['attack_bonus']
+        target_ac = columns['ac'][target]
+
+        event = {
+            'type': 'player_attack',
+            'target': target,
+            'target_name': pack.name(target),
+            'roll': roll,
+            'attack_roll': attack_roll,
+            'attack_bonus': player['attack_bonus'],
+            'critical': critical,
+            'hit': attack_roll >= target_ac or critical,
+            'target_ac': target_ac,
+        }
+        if not event['hit']:
+            event['monster_dead'] = False
+            return event
+
+        damage = self._roll_player_damage(critical)
+        hp_before = columns['hp'][target]
+        dead = pack.take_damage(target, damage, player['damage_type'])
+        final_damage = hp_before - columns['hp'][target]
+        self.damage_dealt += final_damage
+
+        event.update({
+            'raw_damage': damage,
+            'damage': final_damage,
+            'damage_type': player['damage_type'],
+            'resisted': max(0, damage - final_damage),
+            'monster_dead': dead,
+            'remaining': pack.alive_count(),
+        })
+        return event
+
+    def monster_attack(self):
+        """Turno do bando: todos os monstros vivos atacam e o dano é somado."""
+        alive = self.pack.alive_indices()
+        if np is not None and len(alive) >= VECTORIZE_MIN_PACK:
+            hits, criticals, raw_damage, damage = self._volley_numpy(alive)
+        else:
+            hits, criticals, raw_damage, damage = self._volley(alive)
+
+        self.player['hp'] -= damage
+        self.damage_taken += damage
+        return {
+            'type': 'monster_volley',
+            'attackers': len(alive),
+            'hits': hits,
+            'criticals': criticals,
+            'raw_damage': raw_damage,
+            'damage': damage,
+            'resisted': raw_damage - damage,
+            'player_dead': self.player['hp'] <= 0,
+        }
+
+    def _player_resistances(self):
+        # Resistência do jogador por código de ATTACK_TYPES (-1 = nenhuma)
+        return [self.player['physical_resistance'] if name == "physical" else self.player['magical_resistance']
+                for name in ATTACK_TYPES] + [0]
+
+    def _volley(self, alive):
+        """Turno do bando em Python puro (mesmas regras de Monster.attack/calculate_damage)."""
+        columns = self.pack.columns
+        attack_bonus, damage_modifier = columns['attack_bonus'], columns['damage_modifier']
+        attack_type, template = columns['attack_type'], columns['template']
+        damage_dice = self.pack.damage_dice
+        resistances = self._player_resistances()
+        player_ac = self.player['ac']
+        crit_chance = self.difficulty_modifiers.get("enemy_crit_chance_bonus", 0)
+        damage_received = self.difficulty_modifiers.get("damage_received", 1.0)
+        rng = self.rng
+
+        hits = criticals = raw_total = damage_total = 0
+        for index in alive:
+            crit_bonus = rng.random() < crit_chance
+            roll = rng.randint(1, 20)
+            critical = roll == 20 or crit_bonus
+            if not (roll + attack_bonus[index] >= player_ac or critical):
+                continue
+            dice = damage_dice[template[index]]
+            raw = dice.roll(rng) + damage_modifier[index]
+            if critical:
+                raw += dice.roll(rng)
+            raw = int(max(1, raw) * damage_received)
+            hits += 1
+            criticals += critical
+            raw_total += raw
+            damage_total += max(0, raw - resistances[attack_type[index]])
+        return hits, criticals, raw_total, damage_total
+
+    def _volley_numpy(self, alive):
+        """Turno do bando vetorizado: um array por rolagem, dados agrupados por tipo de monstro."""
+        pack = self.pack
+        generator = np.random.default_rng(self.rng.getrandbits(64))  # Deriva do rng do combate
+        alive = np.asarray(alive)
+        count = alive.size
+
+        attack_bonus = pack.numpy_column('attack_bonus')[alive]
+        damage_modifier = pack.numpy_column('damage_modifier')[alive]
+        attack_type = pack.numpy_column('attack_type')[alive]
+        template = pack.numpy_column('template')[alive]
+
+        crit_chance = self.difficulty_modifiers.get("enemy_crit_chance_bonus", 0)
+        rolls = generator.integers(1, 21, size=count)
+        critical = (rolls == 20) | (generator.random(count) < crit_chance)
+        hit = (rolls + attack_bonus >= self.player['ac']) | critical
+
+        raw = np.zeros(count, dtype=np.int64)
+        for kind in np.unique(template[hit]):
+            selected = hit & (template == kind)
+            dice = pack.damage_dice[kind]
+            raw[selected] = dice.roll_many(int(selected.sum()), generator) + damage_modifier[selected]
+            doubled = selected & critical
+            if doubled.any():
+                raw[doubled] += dice.roll_many(int(doubled.sum()), generator)
+        raw = (np.maximum(1, raw) * self.difficulty_modifiers.get("damage_received", 1.0)).astype(np.int64)
+        raw = np.where(hit, raw, 0)
+
+        resistance = np.asarray(self._player_resistances())[attack_type]
+        damage = np.where(hit, np.maximum(0, raw - resistance), 0)
+        return int(hit.sum()), int((hit & critical).sum()), int(raw.sum()), int(damage.sum())
+
+    def attempt_flee(self):
+        """Teste de fuga contra o monstro vivo mais ágil do bando."""
+        flee_modifier = self.pack.columns['flee_modifier']
+        best = max((flee_modifier[i] for i in self.pack.alive_indices()), default=0)
+        player_roll = roll_dice("1d20", self.rng) + self.player['flee_bonus']
+        monster_roll = roll_dice("1d20", self.rng) + best
+        return {
+            'type': 'flee',
+            'player_roll': player_roll,
+            'monster_roll': monster_roll,
+            'success': player_roll > monster_roll,
+        }
+
+
+def pack_size(level, region, difficulty_modifiers, rng=None):
+    """
+    Quantos monstros aparecem em um encontro: faixa da região, com o máximo
+    crescendo com o nível do jogador e com o pack_size_bonus da dificuldade.
+    """
+    low, high = REGION_PACK_SIZES.get(region, DEFAULT_PACK_SIZE)
+    high += level // PACK_LEVEL_STEP + difficulty_modifiers.get("pack_size_bonus", 0)
+    high = min(high, MAX_PACK_SIZE)
+    if high <= low:
+        return low
+    return (rng or stream("encounters")).randint(low, high)
+
+
+def build_pack(monster_index, level, region, difficulty_modifiers, size, rng=None):
+    """Sorteia size monstros da região (como MonsterIndex.draw) em um MonsterBatch."""
+    rng = rng or stream("encounters")
+    pack = MonsterBatch(difficulty_modifiers.get("monster_hp_multiplier", 1.0))
+    for _ in range(size):
+        monster_data = monster_index.draw(level, region, rng)
+        if monster_data:
+            pack.add(monster_data)
+    return pack
+
+
+def simulate_fight(player, monster_data, policy=always_attack, difficulty=None, rng=None, record_events=False):
+    """Simula uma luta a partir de um snapshot do jogador e de uma linha de monstro."""
+    mods = get_difficulty_modifiers(difficulty or player.get('difficulty'))
+    engine = CombatEngine(dict(player), monster_from_data(monster_data, mods), mods, rng)
+    return engine.run(policy, record_events=record_events)
+
+
+def simulate_fights(player, monster_data, count, policy=always_attack, difficulty=None, seed=None):
+    """
+    Simula várias lutas independentes (o jogador começa cada uma com o HP do snapshot)
+    e retorna estatísticas agregadas.
+    """
+    rng = random.Random(seed)
+    totals = {'victory': 0, 'defeat': 0, 'fled': 0, 'timeout': 0}
+    rounds = damage_dealt = damage_taken = 0
+
+    for _ in range(count):
+        outcome = simulate_fight(player, monster_data, policy, difficulty, rng)
+        totals[outcome['result']] += 1
+        rounds += outcome['rounds']
+        damage_dealt += outcome['damage_dealt']
+        damage_taken += outcome['damage_taken']
+
+    fights = max(1, count)
+    return {
+        'fights': count,
+        'results': totals,
+        'win_rate': totals['victory'] / fights,
+        'avg_rounds': rounds / fights,
+        'avg_damage_dealt': damage_dealt / fights,
+        'avg_damage_taken': damage_taken / fights,
+    }
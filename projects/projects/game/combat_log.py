@@ -0,0 +1,302 @@
+# game/combat_log.py
+"""
+Registro de combates e replay.
+
+Cada combate vira uma linha da tabela combat_log (migração 3) com quem lutou,
+a semente do combate, o ponto de partida (snapshot do jogador, monstros e
+modificadores da dificuldade, em JSON) e os eventos em um BLOB compacto: um
+registro de tamanho fixo (EVENT_STRUCT) por evento, com o código do tipo e
+os campos de EVENT_FIELDS como inteiros.
+
+Durante a luta, record() só guarda o dicionário do evento em uma lista. A
+codificação acontece no fim do combate e a linha entra em uma fila gravada em
+lote (executemany) junto com os salvamentos adiados de game/database.py. Uma
+morte com permadeath é gravada na hora.
+
+Todas as rolagens do combate vêm de um random.Random com a semente do combate,
+então replay() refaz a luta a partir da semente e do ponto de partida, com as
+ações do jogador deduzidas dos eventos, sem tocar no banco, e aponta qualquer
+evento que não bata com o registrado.
+
+Uso:
+    python -m game.combat_log                   # últimos combates
+    python -m game.combat_log --character 3     # combates de um personagem
+    python -m game.combat_log --replay 42       # refaz e confere um combate
+"""
+import argparse
+import json
+import random
+import sqlite3
+import struct
+import sys
+
+from .combat_engine import CombatEngine, PackCombatEngine
+from .connection import get_shared_connection
+from .migrations import migrate
+from .monster import Monster
+from .monster_batch import MonsterBatch
+from .rng import get_rng_service
+
+# Tipo de evento -> campos gravados, na ordem (inteiros; booleanos viram 0/1)
+EVENT_FIELDS = {
+    'player_attack': ('target', 'roll', 'attack_roll', 'critical', 'hit', 'target_ac',
+                      'raw_damage', 'damage', 'resisted', 'monster_dead'),
+    'monster_attack': ('roll', 'attack_roll', 'critical', 'hit', 'target_ac',
+                       'raw_damage', 'damage', 'resisted', 'player_dead'),
+    'monster_volley': ('attackers', 'hits', 'criticals', 'raw_damage', 'damage', 'resisted',
+                       'player_dead'),
+    'flee': ('player_roll', 'monster_roll', 'success'),
+    'rewards': ('exp', 'gold', 'item_id'),
+    'item_lost': ('item_id',),
+}
+EVENT_TYPES = tuple(EVENT_FIELDS)
+EVENT_FIELD_COUNT = max(len(fields) for fields in EVENT_FIELDS.values())
+
+# Código do tipo (1 byte) + EVENT_FIELD_COUNT inteiros de 32 bits, little-endian
+EVENT_STRUCT = struct.Struct(f"<B{EVENT_FIELD_COUNT}i")
+
+# Tipo -> (código, campos, zeros que completam o registro)
+_EVENT_LAYOUT = {
+    kind: (code, fields, (0,) * (EVENT_FIELD_COUNT - len(fields)))
+    for code, (kind, fields) in enumerate(EVENT_FIELDS.items())
+}
+
+INSERT_COMBAT_SQL = '''
+    INSERT INTO combat_log (
+        character_id, character_name, difficulty, permadeath,
+        session_seed, seed, setup, events, result, rounds
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+COMBAT_SUMMARY_SQL = '''
+    SELECT id, character_id, character_name, difficulty, result, rounds,
+           length(events) / ? AS event_count, created_at
+    FROM combat_log
+'''
+
+# Fila de gravação: (conexão, linha de INSERT_COMBAT_SQL)
+_pending_combats = []
+
+
+def encode_events(events):
+    """Eventos (dicionários do CombatEngine) -> bytes, EVENT_STRUCT.size por evento."""
+    pack = EVENT_STRUCT.pack
+    records = []
+    for event in events:
+        code, fields, padding = _EVENT_LAYOUT[event['type']]
+        get = event.get
+        records.append(pack(code, *[int(get(name) or 0) for name in fields], *padding))
+    return b"".join(records)
+
+
+def decode_events(blob):
+    """Bytes de encode_events() -> lista de dicionários {'type': ..., campo: inteiro}."""
+    events = []
+    for code, *values in EVENT_STRUCT.iter_unpack(blob):
+        kind = EVENT_TYPES[code]
+        event = dict(zip(EVENT_FIELDS[kind], values))
+        event['type'] = kind
+        events.append(event)
+    return events
+
+
+def combat_setup(player, enemies, difficulty_modifiers):
+    """Ponto de partida do combate: tudo o que o replay precisa além da semente."""
+    setup = {'player': dict(player), 'modifiers': dict(difficulty_modifiers)}
+    if isinstance(enemies, MonsterBatch):
+        setup['pack'] = {
+            'hp_multiplier': enemies.hp_multiplier,
+            'templates': enemies.templates,
+            'layout': list(enemies.columns['template']),
+        }
+    else:
+        setup['monster'] = enemies.snapshot()
+    return setup
+
+
+def build_engine(setup, seed):
+    """CombatEngine (ou PackCombatEngine) no estado inicial do combate registrado."""
+    player = dict(setup['player'])
+    rng = random.Random(seed)
+    if 'pack' in setup:
+        pack_setup = setup['pack']
+        pack = MonsterBatch(pack_setup['hp_multiplier'])
+        for template in pack_setup['layout']:
+            pack.add(pack_setup['templates'][template])
+        return PackCombatEngine(player, pack, setup['modifiers'], rng)
+    return CombatEngine(player, Monster.from_snapshot(setup['monster']), setup['modifiers'], rng)
+
+
+class CombatLog:
+    """Eventos de um combate em andamento."""
+
+    def __init__(self, character, seed, setup):
+        self.character_id = character.id
+        self.character_name = character.name
+        self.difficulty = character.difficulty
+        self.permadeath = character.permadeath
+        self.seed = seed
+        self.setup = setup
+        self.events = []
+
+    def record(self, event):
+        self.events.append(event)
+
+    def rounds(self):
+        return sum(1 for event in self.events if event['type'] in ('player_attack', 'flee'))
+
+    def finish(self, conn, result, immediate=False):
+        """Codifica os eventos e põe o combate na fila de gravação (immediate grava já)."""
+        row = (
+            self.character_id, self.character_name, self.difficulty, self.permadeath,
+            get_rng_service().seed, self.seed, json.dumps(self.setup, separators=(",", ":")),
+            encode_events(self.events), result, self.rounds(),
+        )
+        _pending_combats.append((conn, row))
+        if immediate:
+            return flush_combat_log()
+        return True
+
+
+def flush_combat_log():
+    """Grava os combates da fila, um executemany e um commit por conexão."""
+    if not _pending_combats:
+        return True
+
+    by_connection = {}
+    for conn, row in _pending_combats:
+        by_connection.setdefault(id(conn), (conn, []))[1].append(row)
+    _pending_combats.clear()
+
+    success = True
+    for conn, rows in by_connection.values():
+        try:
+            with conn:
+                conn.executemany(INSERT_COMBAT_SQL, rows)
+        except sqlite3.Error as e:
+            print(f"Erro no banco de dados ao gravar o registro de combates: {e}")
+            _pending_combats.extend((conn, row) for row in rows)
+            success = False
+    return success
+
+
+def load_combat(conn, combat_id):
+    """Um combate registrado, com setup e eventos já decodificados (None se não existir)."""
+    flush_combat_log()
+    cursor = conn.execute("SELECT * FROM combat_log WHERE id = ?", (combat_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    record = dict(zip([col[0] for col in cursor.description], row))
+    record['setup'] = json.loads(record['setup'])
+    record['events'] = decode_events(record['events'])
+    return record
+
+
+def list_combats(conn, character_id=None, limit=20):
+    """Resumo dos últimos combates (de um personagem, se informado)."""
+    flush_combat_log()
+    query = COMBAT_SUMMARY_SQL
+    params = [EVENT_STRUCT.size]
+    if character_id is not None:
+        query += " WHERE character_id = ?"
+        params.append(character_id)
+    cursor = conn.execute(query + " ORDER BY id DESC LIMIT ?", params + [limit])
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def replay(record):
+    """
+    Refaz o combate de um registro (de load_combat) sem banco. Retorna
+    {'events': eventos refeitos, 'mismatches': [(posição, registrado, refeito)],
+    'player_hp': HP final do jogador}.
+
+    Recompensas e perdas de itens usam o fluxo "loot" da sessão, não a semente
+    do combate: são repetidas como foram registradas.
+    """
+    engine = build_engine(record['setup'], record['seed'])
+    is_pack = isinstance(engine, PackCombatEngine)
+    events = []
+    mismatches = []
+    for position, logged in enumerate(record['events']):
+        kind = logged['type']
+        if kind == 'player_attack':
+            event = engine.player_attack(logged['target']) if is_pack else engine.player_attack()
+        elif kind in ('monster_attack', 'monster_volley'):
+            event = engine.monster_attack()
+        elif kind == 'flee':
+            event = engine.attempt_flee()
+        else:
+            event = logged
+        if encode_events([event]) != encode_events([logged]):
+            mismatches.append((position, logged, event))
+        events.append(event)
+    return {'events': events, 'mismatches': mismatches, 'player_hp': engine.player['hp']}
+
+
+def describe_event(event):
+    """Uma linha de texto para o evento (usada no relatório do replay)."""
+    kind = event['type']
+    if kind == 'player_attack':
+        text = f"Jogador ataca (alvo {event.get('target', 0)}): d20={event['roll']} -> {event['attack_roll']} vs AC {event['target_ac']}"
+    elif kind == 'monster_attack':
+        text = f"Monstro ataca: d20={event['roll']} -> {event['attack_roll']} vs AC {event['target_ac']}"
+    elif kind == 'monster_volley':
+        return (f"Bando ataca: {event['hits']}/{event['attackers']} acertos, {event['criticals']} críticos, "
+                f"dano {int(event['damage'])} (bruto {int(event['raw_damage'])}, resistido {int(event['resisted'])})")
+    elif kind == 'flee':
+        return f"Fuga: {event['player_roll']} vs {event['monster_roll']} -> {'sucesso' if event['success'] else 'falhou'}"
+    elif kind == 'rewards':
+        return f"Recompensas: {event['exp']} EXP, {event['gold']} ouro, item {event['item_id'] or '-'}"
+    else:
+        return f"Item perdido: {event['item_id']}"
+
+    if event['critical']:
+        text += " CRÍTICO"
+    if not event['hit']:
+        return text + " -> erro"
+    return (f"{text} -> dano {int(event['damage'])} "
+            f"(bruto {int(event['raw_damage'])}, resistido {int(event['resisted'])})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Registro de combates: listagem e replay.")
+    parser.add_argument("--character", type=int, help="Só os combates deste personagem (id)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--replay", type=int, metavar="ID", help="Refaz e confere o combate ID")
+    args = parser.parse_args(argv)
+
+    conn = get_shared_connection()
+    migrate(conn)  # Bancos anteriores à tabela combat_log
+    if args.replay is None:
+        for combat in list_combats(conn, args.character, args.limit):
+            print(f"#{combat['id']:<5} {combat['created_at']}  {combat['character_name']} "
+                  f"(id {combat['character_id']}, {combat['difficulty']}): {combat['result']}, "
+                  f"{combat['rounds']} rodadas, {combat['event_count']} eventos")
+        return 0
+
+    record = load_combat(conn, args.replay)
+    if record is None:
+        print(f"Combate {args.replay} não encontrado.")
+        return 1
+
+    result = replay(record)
+    divergent = {position for position, _, _ in result['mismatches']}
+    print(f"Combate #{record['id']}: {record['character_name']} ({record['difficulty']}), "
+          f"semente {record['seed']}, resultado '{record['result']}'")
+    for position, event in enumerate(record['events']):
+        marker = "!!" if position in divergent else "  "
+        print(f"{marker} {position:>3}. {describe_event(event)}")
+        if position in divergent:
+            print(f"        refeito: {describe_event(result['events'][position])}")
+
+    if result['mismatches']:
+        print(f"\n{len(result['mismatches'])} evento(s) divergem do replay.")
+        return 1
+    print(f"\nReplay confere com o registro (HP final do jogador: {int(result['player_hp'])}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,8 @@ SETTINGS_FILE = "game_settings.json"
 
 # Configurações padrão
 DEFAULT_SETTINGS = {
-    "text_speed": 0.03
+    "text_speed": 0.03,
+    "pacing": "realtime"  # realtime, fast ou zero (veja game/pacing.py)
 }
 
 # As configurações começam vazias e são carregadas por uma função.
@@ -34,6 +35,10 @@ def get_db_path():
     # Para executável: dist/data/database.db
     return os.path.join(base_path, 'data', 'database.db')
 
+def get_template_db_path():
+    """Retorna o caminho do banco modelo (já populado) usado para criar mundos novos"""
+    return os.path.join(get_base_path(), 'data', 'database.template.db')
+
 def print_path_info():
     """Imprime informações de caminho para debug"""
     print("=" * 50)
@@ -96,7 +101,8 @@ DIFFICULTY_MODIFIERS = {
         "damage_dealt": 1.1,
         "healing_received": 1.2,
         "attribute_reduction": 0,
-        "monster_hp_multiplier": 0.8
+        "monster_hp_multiplier": 0.8,
+        "pack_size_bonus": 0
     },
     "Desafio Justo": {  # Antigo "Normal"
         "exp_multiplier": 1.0,
@@ -105,7 +111,8 @@ DIFFICULTY_MODIFIERS = {
         "damage_dealt": 1.0,
         "healing_received": 1.0,
         "attribute_reduction": 0,
-        "monster_hp_multiplier": 1.0
+        "monster_hp_multiplier": 1.0,
+        "pack_size_bonus": 0
     },
     "Provação Maldita": {  # Antigo "Difícil"
         "exp_multiplier": 0.8,
@@ -114,7 +121,8 @@ DIFFICULTY_MODIFIERS = {
         "damage_dealt": 0.9,
         "healing_received": 0.8,
         "attribute_reduction": 2,
-        "monster_hp_multiplier": 1.3
+        "monster_hp_multiplier": 1.3,
+        "pack_size_bonus": 1
     },
     "Caminho da Dor": {  # Antigo "Hardcore"
         "exp_multiplier": 0.6,
@@ -123,7 +131,8 @@ DIFFICULTY_MODIFIERS = {
         "damage_dealt": 0.8,
         "healing_received": 0.6,
         "attribute_reduction": 4,
-        "monster_hp_multiplier": 1.5
+        "monster_hp_multiplier": 1.5,
+        "pack_size_bonus": 1
     },
     "Maldição de Ferro": {  # NOVO – para os masoquistas
         "exp_multiplier": 0.5,
@@ -132,7 +141,8 @@ DIFFICULTY_MODIFIERS = {
         "damage_dealt": 0.75,
         "healing_received": 0.5,
         "attribute_reduction": 6,
-        "monster_hp_multiplier": 2.0
+        "monster_hp_multiplier": 2.0,
+        "pack_size_bonus": 2
     },
     "Inferno Vivo": {  # NOVO – insano
         "exp_multiplier": 0.3,
@@ -142,6 +152,7 @@ DIFFICULTY_MODIFIERS = {
         "healing_received": 0.4,
         "attribute_reduction": 8,
         "monster_hp_multiplier": 2.5,
+        "pack_size_bonus": 3,
         "enemy_crit_chance_bonus": 0.15  # inimigos têm mais chance de critar
     }
 }
@@ -174,4 +185,44 @@ locations = {
     "plains": "Planícies Ventosas",
     "swamp": "Pântano Assombrado",
     "desert": "Deserto Abrasador"
-}
\ No newline at end of file
+}
+
+# Tamanho dos bandos por região: (mínimo, máximo) de monstros por encontro.
+# O máximo cresce 1 a cada PACK_LEVEL_STEP níveis do jogador e com o
+# pack_size_bonus da dificuldade, até MAX_PACK_SIZE.
+REGION_PACK_SIZES = {
+    "forest": (1, 1),
+    "plains": (1, 2),
+    "mountains": (1, 2),
+    "desert": (1, 2),
+    "swamp": (1, 3),
+}
+DEFAULT_PACK_SIZE = (1, 1)
+PACK_LEVEL_STEP = 3
+MAX_PACK_SIZE = 64
+
+# Peso de cada monstro nos encontros de cada região (monstros ausentes não aparecem
+# nela). Se a região não tiver monstros na faixa de nível do jogador, o sorteio
+# usa todos os monstros da faixa.
+REGION_MONSTER_POOLS = {
+    "forest": {
+        "Rato Gigante": 3, "Goblin": 3, "Lobo": 3, "Batedor Kobold": 2, "Bandido": 2,
+        "Urso Pardo": 2, "Arqueiro Sombrio": 1, "Aranha Gigante": 2, "Draconato Selvagem": 1
+    },
+    "mountains": {
+        "Goblin": 2, "Lobo": 3, "Batedor Kobold": 3, "Urso Pardo": 2, "Golem de Pedra": 3,
+        "Cavaleiro Negro": 1, "Draconato Selvagem": 2, "Quimera": 1, "Dragão Vermelho Jovem": 1
+    },
+    "plains": {
+        "Rato Gigante": 2, "Goblin": 2, "Lobo": 2, "Bandido": 3, "Arqueiro Sombrio": 2,
+        "Feiticeiro Caótico": 1, "Cavaleiro Negro": 2, "Quimera": 1
+    },
+    "swamp": {
+        "Rato Gigante": 1, "Esqueleto": 2, "Zumbi": 3, "Slime Ácido": 3, "Espírito Atormentado": 2,
+        "Súcubo": 1, "Aranha Gigante": 2, "Feiticeiro Caótico": 1, "Lich": 1
+    },
+    "desert": {
+        "Esqueleto": 3, "Batedor Kobold": 2, "Slime Ácido": 1, "Bandido": 2, "Feiticeiro Caótico": 1,
+        "Golem de Pedra": 2, "Aranha Gigante": 2, "Quimera": 2, "Dragão Vermelho Jovem": 1
+    }
+}
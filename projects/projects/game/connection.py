@@ -0,0 +1,132 @@
+# game/connection.py
+"""
+Gerenciador central de conexões SQLite do jogo.
+
+Todos os módulos usam a mesma conexão compartilhada (get_shared_connection),
+configurada uma única vez com os PRAGMAs abaixo. Tarefas em segundo plano que
+precisam de conexões próprias usam um ConnectionPool, cujas conexões recebem a
+mesma configuração.
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from game.config import get_db_path
+
+# PRAGMAs aplicados a toda conexão aberta pelo jogo
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",        # Leitores não bloqueiam o escritor
+    "PRAGMA synchronous = NORMAL",      # Seguro com WAL e bem mais rápido que FULL
+    "PRAGMA foreign_keys = ON",         # Ativa os ON DELETE CASCADE / SET NULL do esquema
+    "PRAGMA cache_size = -8000",        # ~8 MB de cache de páginas
+    "PRAGMA mmap_size = 67108864",      # 64 MB lidos via memória mapeada
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Quantidade de instruções preparadas mantidas em cache por conexão
+STATEMENT_CACHE_SIZE = 256
+
+_shared_connection = None
+
+
+def configure_connection(conn):
+    """Aplica os PRAGMAs padrão do jogo a uma conexão."""
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def connect(db_path=None, check_same_thread=True):
+    """
+    Abre uma nova conexão configurada. Quem chama é responsável por fechá-la;
+    prefira get_shared_connection() sempre que possível.
+    """
+    conn = sqlite3.connect(
+        str(db_path or get_db_path()),
+        cached_statements=STATEMENT_CACHE_SIZE,
+        check_same_thread=check_same_thread
+    )
+    return configure_connection(conn)
+
+
+def get_shared_connection():
+    """Retorna a conexão compartilhada do processo, abrindo-a na primeira chamada."""
+    global _shared_connection
+    if _shared_connection is None:
+        _shared_connection = connect()
+    return _shared_connection
+
+
+def set_shared_connection(conn):
+    """
+    Usa conn como a conexão compartilhada (ex.: um banco em memória de
+    db_template.open_memory_database() em sessões automatizadas).
+    Retorna a conexão anterior, que não é fechada.
+    """
+    global _shared_connection
+    previous = _shared_connection
+    _shared_connection = conn
+    return previous
+
+
+def close_shared_connection():
+    """Fecha a conexão compartilhada (chamado ao encerrar o jogo)."""
+    global _shared_connection
+    if _shared_connection is not None:
+        _shared_connection.close()
+        _shared_connection = None
+
+
+class ConnectionPool:
+    """
+    Pequeno pool de conexões para tarefas em segundo plano. As conexões são
+    criadas sob demanda até o limite e reutilizadas entre as tarefas.
+    """
+
+    def __init__(self, size=4, db_path=None):
+        self.size = size
+        self.db_path = db_path
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """Obtém uma conexão livre, criando uma nova se o limite ainda não foi atingido."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            return connect(self.db_path, check_same_thread=False)
+
+        return self._idle.get(timeout=timeout)
+
+    def release(self, conn):
+        """Devolve uma conexão ao pool."""
+        self._idle.put_nowait(conn)
+
+    @contextmanager
+    def connection(self):
+        """Uso: with pool.connection() as conn: ..."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Fecha todas as conexões ociosas do pool."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
@@ -0,0 +1,126 @@
+# game/damage_calc.py
+"""
+Cálculo exato de dano de armas (sem amostragem).
+
+A partir da distribuição exata dos dados (game.dice), monta a PMF/CDF do dano
+de uma arma com aprimoramento e modificador de atributo, aplicando as mesmas
+regras de game.combat_engine (crítico, dificuldade, resistência do alvo).
+Também calcula a chance de acerto contra a CA do alvo e o dano esperado por
+rodada (DPR). Os resultados ficam em cache, então consultar a mesma
+combinação de novo é O(1).
+"""
+from functools import lru_cache
+
+from .dice import compile_dice
+from .utils import calculate_enhanced_damage, calculate_attack_bonus
+
+PMF_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PMF_CACHE_SIZE)
+def _damage_pmf(damage_dice, attribute_mod, critical, crit_multiplier, damage_dealt, crit_bonus, resistance):
+    pmf = {}
+    for value, probability in compile_dice(damage_dice).distribution().items():
+        damage = value + attribute_mod
+        if critical:
+            damage *= crit_multiplier
+        damage = int(max(1, damage) * damage_dealt)
+        if critical and crit_bonus:
+            damage += damage * 0.15
+        damage = max(1, damage - resistance)
+        pmf[damage] = pmf.get(damage, 0.0) + probability
+    return tuple(sorted(pmf.items()))
+
+
+def damage_pmf(damage_dice, attribute_mod=0, critical=False, crit_multiplier=2,
+               damage_dealt=1.0, crit_bonus=False, resistance=0):
+    """
+    Distribuição exata do dano de um golpe que acerta: {dano: probabilidade}.
+    damage_dealt e crit_bonus vêm dos modificadores de dificuldade; resistance
+    é a resistência do alvo ao tipo de dano da arma.
+    """
+    return dict(_damage_pmf(damage_dice, attribute_mod, critical, crit_multiplier,
+                            damage_dealt, crit_bonus, resistance))
+
+
+def cdf(pmf):
+    """CDF de uma PMF: lista de (dano, P(dano <= valor)) em ordem crescente."""
+    cumulative = 0.0
+    result = []
+    for value in sorted(pmf):
+        cumulative += pmf[value]
+        result.append((value, min(1.0, cumulative)))
+    return result
+
+
+def expected_value(pmf):
+    return sum(value * probability for value, probability in pmf.items())
+
+
+def hit_chances(attack_bonus, target_ac):
+    """
+    Probabilidades (acerto normal, crítico) de um ataque d20 + bônus contra a CA.
+    O 20 natural sempre acerta e é crítico.
+    """
+    normal_hits = sum(1 for roll in range(1, 20) if roll + attack_bonus >= target_ac)
+    return normal_hits / 20, 1 / 20
+
+
+def hit_probability(attack_bonus, target_ac):
+    """Chance total de acertar (incluindo o crítico)."""
+    normal, critical = hit_chances(attack_bonus, target_ac)
+    return normal + critical
+
+
+@lru_cache(maxsize=PMF_CACHE_SIZE)
+def expected_dpr(damage_dice, attack_bonus, attribute_mod, target_ac, resistance=0,
+                 damage_dealt=1.0, crit_multiplier=2, crit_bonus=False):
+    """Dano esperado por rodada (considerando erros, acertos e críticos)."""
+    normal, critical = hit_chances(attack_bonus, target_ac)
+    normal_damage = expected_value(damage_pmf(
+        damage_dice, attribute_mod, False, crit_multiplier, damage_dealt, crit_bonus, resistance))
+    critical_damage = expected_value(damage_pmf(
+        damage_dice, attribute_mod, True, crit_multiplier, damage_dealt, crit_bonus, resistance))
+    return normal * normal_damage + critical * critical_damage
+
+
+def target_defenses(target, damage_type="physical"):
+    """CA e resistência ao tipo de dano de um alvo (Monster ou dicionário com os mesmos campos)."""
+    if isinstance(target, dict):
+        get = target.get
+    else:
+        get = lambda name, default=0: getattr(target, name, default)
+    resistance_field = "physical_resistance" if damage_type == "physical" else "magical_resistance"
+    return get('ac', 10), get(resistance_field, 0) or 0
+
+
+def weapon_dpr(item, attribute_mod, target, difficulty_modifiers=None):
+    """
+    Dano esperado por rodada de uma arma (com seu nível de aprimoramento atual)
+    contra o alvo, usando as regras de combate do jogo.
+    """
+    mods = difficulty_modifiers or {}
+    target_ac, resistance = target_defenses(target, item.get('damage_type') or "physical")
+    return expected_dpr(
+        calculate_enhanced_damage(item),
+        attribute_mod + calculate_attack_bonus(item),
+        attribute_mod,
+        target_ac,
+        resistance,
+        mods.get("damage_dealt", 1.0),
+        2,
+        "enemy_crit_chance_bonus" in mods
+    )
+
+
+def enhancement_dpr_change(item, new_level, attribute_mod, target, difficulty_modifiers=None):
+    """
+    Compara o DPR da arma no nível atual e no novo nível de aprimoramento.
+    Retorna (dpr atual, novo dpr, variação percentual).
+    """
+    current = weapon_dpr(item, attribute_mod, target, difficulty_modifiers)
+    upgraded_item = dict(item)
+    upgraded_item['enhancement_level'] = new_level
+    upgraded = weapon_dpr(upgraded_item, attribute_mod, target, difficulty_modifiers)
+    change = (upgraded - current) / current * 100 if current else 0.0
+    return current, upgraded, change
@@ -1,46 +1,87 @@
 import sqlite3
+import time
 from .character import Character # Importa Character para uso em load_characters
 from game.config import get_db_path
+from .combat_log import flush_combat_log
 DB_PATH = get_db_path()
 
-def save_character(conn, character):
+# Intervalo máximo (em segundos) que um salvamento pode ficar pendente na fila
+SAVE_FLUSH_INTERVAL = 5.0
+
+UPDATE_CHARACTER_SQL = '''
+    UPDATE characters SET
+        name = ?, race = ?, class = ?, background = ?,
+        level = ?, exp = ?, exp_max = ?,
+        hp = ?, hp_max = ?, mana = ?, mana_max = ?, ac = ?, gold = ?, 
+        strength = ?, dexterity = ?, constitution = ?, intelligence = ?, 
+        wisdom = ?, charisma = ?, difficulty = ?, permadeath = ?
+    WHERE id = ?
+'''
+
+INSERT_CHARACTER_SQL = '''
+    INSERT INTO characters (
+        name, race, class, background,
+        level, exp, exp_max, 
+        hp, hp_max, mana, mana_max, ac, gold, 
+        strength, dexterity, constitution, intelligence, wisdom, charisma, difficulty, permadeath
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Colunas da listagem de saves (sem montar um Character por linha)
+CHARACTER_SUMMARY_SQL = '''
+    SELECT id, name, race, class, level, gold, difficulty
+    FROM characters
+'''
+
+# Ordenações aceitas pela listagem: nome -> expressão ORDER BY
+CHARACTER_SUMMARY_ORDER = {
+    "id": "id",
+    "name": "name COLLATE NOCASE",
+    "level": "level",
+    "gold": "gold",
+    "class": "class COLLATE NOCASE",
+}
+
+# Fila de escrita adiada: id do personagem -> (conexão, personagem).
+# Vários salvamentos do mesmo personagem se reduzem a um único UPDATE,
+# feito com o estado mais recente no momento do flush.
+_pending_saves = {}
+_last_flush = time.monotonic()
+
+def _character_row(character):
+    """Valores da tabela 'characters' na ordem usada pelo INSERT/UPDATE."""
+    return (
+        character.name, character.race, character.char_class,
+        character.background,
+        character.level, character.exp, character.exp_max,
+        character.hp, character.hp_max, character.mana, character.mana_max,
+        character.ac, character.gold, character.strength, character.dexterity,
+        character.constitution, character.intelligence, character.wisdom,
+        character.charisma, character.difficulty, character.permadeath
+    )
+
+def save_character(conn, character, immediate=False):
     """
     Salva ou atualiza os dados principais do personagem na tabela 'characters'.
     Inclui o campo 'permadeath'.
+
+    Personagens já existentes vão para a fila de escrita adiada e são gravados
+    no próximo flush (transição de estado, intervalo SAVE_FLUSH_INTERVAL ou
+    saída do jogo). Personagens novos, ou immediate=True, são gravados na hora.
     """
+    if character.id and not immediate:
+        _pending_saves[character.id] = (conn, character)
+        flush_if_due()
+        return True
+
     cursor = conn.cursor()
     
     try:
-        # 1. Salva/Atualiza os dados da tabela 'characters'
-        char_data = (
-            character.name, character.race, character.char_class,
-            character.background,
-            character.level, character.exp, character.exp_max,
-            character.hp, character.hp_max, character.mana, character.mana_max,
-            character.ac, character.gold, character.strength, character.dexterity,
-            character.constitution, character.intelligence, character.wisdom,
-            character.charisma, character.difficulty, character.permadeath # Adicionado permadeath aqui
-        )
-        
         if character.id:
-            cursor.execute('''
-                UPDATE characters SET
-                    name = ?, race = ?, class = ?, background = ?,
-                    level = ?, exp = ?, exp_max = ?,
-                    hp = ?, hp_max = ?, mana = ?, mana_max = ?, ac = ?, gold = ?, 
-                    strength = ?, dexterity = ?, constitution = ?, intelligence = ?, 
-                    wisdom = ?, charisma = ?, difficulty = ?, permadeath = ?
-                WHERE id = ?
-            ''', char_data + (character.id,))
+            _pending_saves.pop(character.id, None)
+            cursor.execute(UPDATE_CHARACTER_SQL, _character_row(character) + (character.id,))
         else:
-            cursor.execute('''
-                INSERT INTO characters (
-                    name, race, class, background,
-                    level, exp, exp_max, 
-                    hp, hp_max, mana, mana_max, ac, gold, 
-                    strength, dexterity, constitution, intelligence, wisdom, charisma, difficulty, permadeath
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', char_data)
+            cursor.execute(INSERT_CHARACTER_SQL, _character_row(character))
             character.id = cursor.lastrowid
 
         conn.commit()
@@ -55,42 +96,132 @@ def save_character(conn, character):
         print(f"Erro inesperado ao salvar personagem '{character.name}': {e}")
         conn.rollback()
         return False
+
+def flush_pending_saves():
+    """
+    Grava todos os salvamentos pendentes, um único commit por conexão, e a
+    fila do registro de combates. Em caso de erro, os salvamentos continuam
+    na fila para a próxima tentativa.
+    """
+    global _last_flush
+    _last_flush = time.monotonic()
+    flush_combat_log()
+    if not _pending_saves:
+        return True
+
+    by_connection = {}
+    for character_id, (conn, character) in list(_pending_saves.items()):
+        by_connection.setdefault(id(conn), (conn, []))[1].append(character)
+
+    success = True
+    for conn, characters in by_connection.values():
+        try:
+            with conn:
+                conn.executemany(
+                    UPDATE_CHARACTER_SQL,
+                    [_character_row(character) + (character.id,) for character in characters]
+                )
+        except sqlite3.Error as e:
+            print(f"Erro no banco de dados ao gravar salvamentos pendentes: {e}")
+            success = False
+            continue
+        for character in characters:
+            _pending_saves.pop(character.id, None)
+
+    return success
+
+def flush_if_due():
+    """Grava os salvamentos pendentes se o intervalo máximo já passou."""
+    if _pending_saves and time.monotonic() - _last_flush >= SAVE_FLUSH_INTERVAL:
+        return flush_pending_saves()
+    return True
+
     
+def _character_from_row(conn, char_data):
+    """Monta um Character a partir de uma linha (dict) da tabela 'characters'."""
+    # Corrige o campo reservado 'class' → 'char_class'
+    char_data["char_class"] = char_data.get("class", "Unknown") 
+    
+    char_data["background"] = char_data.get("background", None) 
+
+    char_data["difficulty"] = char_data.get("difficulty", "Desafio Justo")
+
+    # Adiciona a recuperação do valor de permadeath
+    char_data["permadeath"] = char_data.get("permadeath", 0)
+
+    if "class" in char_data:
+        del char_data["class"]
+    
+    return Character(conn, **char_data)
+
 def load_characters(conn):
     """
     Carrega todos os personagens do banco de dados e os retorna como objetos Character.
     Garanti que os status (como AC) sejam recalculados após o carregamento.
+    Para apenas listar os saves, prefira load_character_summaries.
     """
+    flush_pending_saves()  # Garante que a lista reflita os salvamentos adiados
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM characters')
-    characters = []
-    
     columns = [description[0] for description in cursor.description]
-    
-    for row in cursor.fetchall():
-        char_data = dict(zip(columns, row))
-        
-        # Corrige o campo reservado 'class' → 'char_class'
-        char_data["char_class"] = char_data.get("class", "Unknown") 
-        
-        char_data["background"] = char_data.get("background", None) 
+    return [_character_from_row(conn, dict(zip(columns, row))) for row in cursor.fetchall()]
 
-        char_data["difficulty"] = char_data.get("difficulty", "Desafio Justo")
+def load_character(conn, character_id):
+    """Carrega um único personagem completo pelo id (None se não existir)."""
+    flush_pending_saves()
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM characters WHERE id = ?', (character_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    columns = [description[0] for description in cursor.description]
+    return _character_from_row(conn, dict(zip(columns, row)))
 
-        # Adiciona a recuperação do valor de permadeath
-        char_data["permadeath"] = char_data.get("permadeath", 0)
+def _summary_from_row(row):
+    character_id, name, race, char_class, level, gold, difficulty = row
+    return {
+        "id": character_id, "name": name, "race": race, "char_class": char_class,
+        "level": level, "gold": gold, "difficulty": difficulty or "Desafio Justo",
+    }
 
-        if "class" in char_data:
-            del char_data["class"]
-        
-        char = Character(conn, **char_data)
-        characters.append(char)
-        
-    return characters
+def load_character_summaries(conn, limit=None, offset=0, order_by="id", descending=False):
+    """
+    Lista os saves sem carregar os personagens: dicionários com id, name, race,
+    char_class, level, gold e difficulty. Suporta paginação (limit/offset) e
+    ordenação por uma das chaves de CHARACTER_SUMMARY_ORDER.
+    """
+    if order_by not in CHARACTER_SUMMARY_ORDER:
+        raise ValueError(f"Ordenação inválida: {order_by!r}")
+    flush_pending_saves()
+
+    direction = "DESC" if descending else "ASC"
+    query = f"{CHARACTER_SUMMARY_SQL} ORDER BY {CHARACTER_SUMMARY_ORDER[order_by]} {direction}, id"
+    params = ()
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params = (limit, offset)
+
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    return [_summary_from_row(row) for row in cursor.fetchall()]
+
+def get_character_summary(conn, character_id):
+    """Resumo de um único save (None se o id não existir)."""
+    flush_pending_saves()
+    cursor = conn.cursor()
+    cursor.execute(CHARACTER_SUMMARY_SQL + " WHERE id = ?", (character_id,))
+    row = cursor.fetchone()
+    return _summary_from_row(row) if row else None
+
+def count_characters(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM characters")
+    return cursor.fetchone()[0]
 
 
 def delete_character(conn, character_id):
     """Exclui um personagem e reseta a sequência de IDs se necessário"""
+    _pending_saves.pop(character_id, None)  # Não há mais o que salvar
     cursor = conn.cursor()
     try:
         # 1. Exclui o personagem
@@ -122,6 +253,7 @@ def delete_character(conn, character_id):
     
 def rename_character(conn, character_id, new_name):
     """Renomeia um personagem no banco de dados"""
+    flush_pending_saves()  # Evita que um salvamento adiado sobrescreva o novo nome
     cursor = conn.cursor()
     try:
         cursor.execute("UPDATE characters SET name = ? WHERE id = ?", (new_name, character_id))
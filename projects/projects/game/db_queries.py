@@ -20,162 +20,49 @@ def get_application_base_path():
 # Constrói o caminho completo para o banco de dados.
 # db_queries.py
 from game.config import get_db_path
+from game.reference_data import get_reference_data
+from game.connection import connect, get_shared_connection
 DB_PATH = get_db_path()
 
 def get_connection():
-    print(f"Tentando conectar ao banco de dados em: {DB_PATH}")
-    return sqlite3.connect(DB_PATH)
+    """
+    Abre uma nova conexão configurada (o chamador deve fechá-la).
+    Para consultas comuns use a conexão compartilhada de game.connection.
+    """
+    return connect(DB_PATH)
 
 def get_all_classes():
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-    SELECT 
-        c.id, c.name, c.hit_dice, c.mana_dice, c.base_ac, c.description,
-        w.id AS weapon_id, w.name AS weapon_name, w.damage_dice, w.main_attribute, w.weapon_type,
-        a.id AS armor_id, a.name AS armor_name, 
-        a.physical_resistance,
-        a.magical_resistance,
-        a.dexterity_penalty,
-        a.armor_class
-    FROM classes c
-    LEFT JOIN items w ON c.starting_weapon_id = w.id
-    LEFT JOIN items a ON c.starting_armor_id = a.id
-    ''')
-    
-    classes = []
-    for row in cursor.fetchall():
-        class_data = {
-            'id': row[0],
-            'name': row[1],
-            'hit_dice': row[2],
-            'mana_dice': row[3],
-            'base_ac': row[4],
-            'description': row[5],
-            'starting_weapon': {
-                'id': row[6],
-                'name': row[7],
-                'damage_dice': row[8],
-                'main_attribute': row[9],
-                'weapon_type': row[10]
-            } if row[6] else None,
-            'starting_armor': {
-                'id': row[11],
-                'name': row[12],
-                'physical_resistance': row[13],
-                'magical_resistance': row[14],
-                'dexterity_penalty': row[15],
-                'armor_class': row[16]
-            } if row[11] else None
-        }
-        classes.append(class_data)
-    
-    conn.close()
-    return classes
+    """
+    Retorna todas as classes com arma e armadura iniciais (servidas pelo cache de referência).
+    """
+    return get_reference_data().all_classes()
 
 def get_class_by_name(conn, class_name):
-    cursor = conn.cursor()
-    cursor.execute('''
-    SELECT 
-        c.id, c.name, c.hit_dice, c.mana_dice, c.base_ac, c.description,
-        w.id AS weapon_id, w.name AS weapon_name, w.damage_dice, w.main_attribute, w.weapon_type,
-        a.id AS armor_id, a.name AS armor_name, 
-        a.physical_resistance,
-        a.magical_resistance,
-        a.dexterity_penalty,
-        a.armor_class
-    FROM classes c
-    LEFT JOIN items w ON c.starting_weapon_id = w.id
-    LEFT JOIN items a ON c.starting_armor_id = a.id
-    WHERE c.name = ?
-    ''', (class_name,))
-    
-    row = cursor.fetchone()
-    if not row:
-        return None
-    
-    class_data = {
-        'id': row[0],
-        'name': row[1],
-        'hit_dice': row[2],
-        'mana_dice': row[3],
-        'base_ac': row[4],
-        'description': row[5],
-        'starting_weapon': {
-            'id': row[6],
-            'name': row[7],
-            'damage_dice': row[8],
-            'main_attribute': row[9],
-            'weapon_type': row[10]
-        } if row[6] else None,
-        'starting_armor': {
-            'id': row[11],
-            'name': row[12],
-            'physical_resistance': row[13],
-            'magical_resistance': row[14],
-            'dexterity_penalty': row[15],
-            'armor_class': row[16]
-        } if row[11] else None
-    }
-    return class_data
+    return get_reference_data(conn).get_class(class_name)
+
 def get_race_by_name(conn, name):
     """
     Retorna os dados de uma raça específica pelo nome.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM races WHERE name = ?", (name,))
-    race_data = cursor.fetchone()
-    
-    if race_data:
-        columns = [description[0] for description in cursor.description]
-        return dict(zip(columns, race_data))
-    return None
+    return get_reference_data(conn).get_race(name)
 
 def load_races():
     """
-    Carrega todos os dados de raças do banco de dados.
+    Carrega todos os dados de raças (servidos pelo cache de referência).
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM races")
-    
-    columns = [col[0] for col in cursor.description]
-    rows = cursor.fetchall()
-    
-    races = []
-    for row in rows:
-        race = dict(zip(columns, row))
-        races.append(race)
-    
-    conn.close()
-    return races
+    return get_reference_data().all_races()
 
 def load_classes():
     """
-    Carrega todos os dados de classes do banco de dados (dados base, sem itens).
+    Carrega todos os dados de classes (dados base, sem itens), servidos pelo cache de referência.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM classes")
-    
-    columns = [col[0] for col in cursor.description]
-    rows = cursor.fetchall()
-    
-    classes = []
-    for row in rows:
-        cls = dict(zip(columns, row))
-        classes.append(cls)
-    
-    conn.close()
-    return classes
+    return get_reference_data().all_class_rows()
 
 def load_monsters():
     """
     Carrega todos os dados de monstros do banco de dados.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    cursor = get_shared_connection().cursor()
     cursor.execute("SELECT * FROM monsters")
     
     columns = [col[0] for col in cursor.description]
@@ -185,8 +72,6 @@ def load_monsters():
     for row in rows:
         monsters.append(dict(zip(columns, row)))
     
-    conn.close()
-    
     return monsters
 
 def load_monsters_by_level(conn, player_level, tolerance=2):    
@@ -265,143 +150,120 @@ def add_item_to_inventory(conn, character_id, item_id, quantity=1, enhancement_l
     conn.commit()
     return inventory_item_id
 
+# Slots de equipamento na ordem das colunas de character_equipment, com o nome exibido ao jogador
+EQUIPMENT_SLOTS = (
+    ('main_hand_inventory_id', "Mão Principal"),
+    ('off_hand_inventory_id', "Mão Secundária"),
+    ('head_inventory_id', "Cabeça"),
+    ('body_inventory_id', "Corpo"),
+    ('hands_inventory_id', "Mãos"),
+    ('feet_inventory_id', "Pés"),
+    ('ring1_inventory_id', "Anel 1"),
+    ('ring2_inventory_id', "Anel 2"),
+    ('amulet_inventory_id', "Amuleto"),
+)
+
+def _empty_equipment(character_id):
+    """Registro de equipamento com todos os slots vazios."""
+    equipment = {'character_id': character_id}
+    for slot_technical, _ in EQUIPMENT_SLOTS:
+        equipment[slot_technical] = None
+    return equipment
+
 def get_character_equipment(conn, character_id):
     cursor = conn.cursor()
-    
-    # Primeiro verifique se o personagem existe
+
+    # Caminho comum: o registro de equipamento já existe
+    cursor.execute("SELECT * FROM character_equipment WHERE character_id = ?", (character_id,))
+    row = cursor.fetchone()
+
+    if row:
+        columns = [col[0] for col in cursor.description]
+        return dict(zip(columns, row))
+
+    # Sem registro: verifique se o personagem existe antes de criá-lo
     cursor.execute("SELECT id FROM characters WHERE id = ?", (character_id,))
     char_exists = cursor.fetchone()
-    
+
     if not char_exists:
         print(f"[ERRO] Personagem com ID {character_id} não existe!")
-        return {
-            'character_id': character_id,
-            'main_hand_inventory_id': None,
-            'off_hand_inventory_id': None,
-            'head_inventory_id': None,
-            'body_inventory_id': None,
-            'hands_inventory_id': None,
-            'feet_inventory_id': None,
-            'ring1_inventory_id': None,
-            'ring2_inventory_id': None,
-            'amulet_inventory_id': None
-        }
-    
-    # Agora verifique o equipamento
+        return _empty_equipment(character_id)
+
+    # Usar INSERT OR IGNORE para evitar duplicatas
+    cursor.execute("""
+        INSERT OR IGNORE INTO character_equipment (character_id) 
+        VALUES (?)
+    """, (character_id,))
+    conn.commit()
+
+    # Buscar novamente após a inserção
     cursor.execute("SELECT * FROM character_equipment WHERE character_id = ?", (character_id,))
     row = cursor.fetchone()
-    
+
     if row:
         columns = [col[0] for col in cursor.description]
         return dict(zip(columns, row))
     else:
-        # Usar INSERT OR IGNORE para evitar duplicatas
-        cursor.execute("""
-            INSERT OR IGNORE INTO character_equipment (character_id) 
-            VALUES (?)
-        """, (character_id,))
-        conn.commit()
-        
-        # Buscar novamente após a inserção
-        cursor.execute("SELECT * FROM character_equipment WHERE character_id = ?", (character_id,))
-        row = cursor.fetchone()
-        
-        if row:
-            columns = [col[0] for col in cursor.description]
-            return dict(zip(columns, row))
-        else:
-            print(f"[ERRO] Falha ao criar registro de equipamento para char_id={character_id}")
-            return {
-                'character_id': character_id,
-                'main_hand_inventory_id': None,
-                'off_hand_inventory_id': None,
-                'head_inventory_id': None,
-                'body_inventory_id': None,
-                'hands_inventory_id': None,
-                'feet_inventory_id': None,
-                'ring1_inventory_id': None,
-                'ring2_inventory_id': None,
-                'amulet_inventory_id': None
-            }
+        print(f"[ERRO] Falha ao criar registro de equipamento para char_id={character_id}")
+        return _empty_equipment(character_id)
 
 def get_item_base_details(conn, item_id):
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM items WHERE id = ?", (item_id,))
-    row = cursor.fetchone()
-    if row:
-        columns = [col[0] for col in cursor.description]
-        item_details = dict(zip(columns, row))
-        return item_details
-    return None
+    return get_reference_data(conn).get_item(item_id)
+
+# Normaliza as nove colunas de slot em linhas (slot, inventory_id) para resolver
+# todos os itens equipados com um único JOIN.
+_EQUIPPED_SLOTS_UNION = '\n            UNION ALL\n'.join(
+    f"            SELECT {order} AS slot_order, '{slot_technical}' AS equipped_slot_technical, "
+    f"'{slot_friendly}' AS equipped_slot_friendly, {slot_technical} AS inventory_id "
+    f"FROM character_equipment WHERE character_id = :character_id"
+    for order, (slot_technical, slot_friendly) in enumerate(EQUIPMENT_SLOTS)
+)
+
+EQUIPPED_ITEMS_QUERY = f'''
+    SELECT 
+        ci.id AS inventory_id,
+        ci.quantity,
+        ci.enhancement_level,
+        ci.enhancement_type,
+        i.id AS item_base_id,
+        i.name,
+        i.category,
+        i.subcategory,
+        i.equip_slot,
+        i.level,
+        i.description,
+        i.weight,
+        i.value,
+        i.damage_dice,
+        i.damage_type,
+        i.weapon_type,
+        i.main_attribute,
+        i.two_handed,
+        i.physical_resistance,
+        i.magical_resistance,
+        i.dexterity_penalty,
+        i.armor_bonus,          -- Mantido para escudos
+        i.armor_class,
+        i.strength_requirement,
+        slots.equipped_slot_technical,
+        slots.equipped_slot_friendly
+    FROM (
+{_EQUIPPED_SLOTS_UNION}
+    ) AS slots
+    JOIN character_inventory ci ON ci.id = slots.inventory_id
+    JOIN items i ON ci.item_id = i.id
+    ORDER BY slots.slot_order
+'''
 
 def get_equipped_items_for_character(conn, character_id):
+    """
+    Retorna os itens equipados do personagem, na ordem dos slots, com os detalhes
+    do item base e do aprimoramento. Todos os slots são resolvidos em uma única consulta.
+    """
     cursor = conn.cursor()
-    slot_mapping = {
-        'main_hand_inventory_id': "Mão Principal",
-        'off_hand_inventory_id': "Mão Secundária",
-        'head_inventory_id': "Cabeça",
-        'body_inventory_id': "Corpo",
-        'hands_inventory_id': "Mãos",
-        'feet_inventory_id': "Pés", 
-        'ring1_inventory_id': "Anel 1",
-        'ring2_inventory_id': "Anel 2",
-        'amulet_inventory_id': "Amuleto"
-    }
-
-    equipped_items_details = []
-    equipped_slots_map = get_character_equipment(conn, character_id)
-    
-    if not equipped_slots_map or all(value is None for key, value in equipped_slots_map.items() if key != 'character_id'):
-        return []
-
-    for slot_technical, inventory_id in equipped_slots_map.items():
-        if slot_technical == 'character_id':
-            continue
-
-        if inventory_id is not None:
-            cursor.execute('''
-                SELECT 
-                    ci.id AS inventory_id,
-                    ci.quantity,
-                    ci.enhancement_level,
-                    ci.enhancement_type,
-                    i.id AS item_base_id,
-                    i.name,
-                    i.category,
-                    i.subcategory,
-                    i.equip_slot,
-                    i.level,
-                    i.description,
-                    i.weight,
-                    i.value,
-                    i.damage_dice,
-                    i.damage_type,
-                    i.weapon_type,
-                    i.main_attribute,
-                    i.two_handed,
-                    i.physical_resistance,  -- Novo campo
-                    i.magical_resistance,   -- Novo campo
-                    i.dexterity_penalty,    -- Novo campo
-                    i.armor_bonus,          -- Mantido para escudos
-                    i.armor_class,
-                    i.strength_requirement
-                FROM character_inventory ci
-                JOIN items i ON ci.item_id = i.id
-                WHERE ci.id = ?
-            ''', (inventory_id,))
-            
-            item_full_details = cursor.fetchone()
-
-            if item_full_details:
-                columns = [description[0] for description in cursor.description]
-                item_data = dict(zip(columns, item_full_details))
-                
-                item_data['equipped_slot_technical'] = slot_technical
-                item_data['equipped_slot_friendly'] = slot_mapping.get(slot_technical, slot_technical)
-                
-                equipped_items_details.append(item_data)
-    
-    return equipped_items_details
+    cursor.execute(EQUIPPED_ITEMS_QUERY, {'character_id': character_id})
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
     
 def unequip_item_from_character(conn, character_id, slot_name):
@@ -504,14 +366,8 @@ def get_class_starting_items(conn, class_name):
     """
     Obtém os IDs dos itens iniciais (arma e armadura base) para uma classe.
     """
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT starting_weapon_id, starting_armor_id 
-        FROM classes 
-        WHERE name = ?
-    ''', (class_name,))
-    row = cursor.fetchone()
-    return row if row else (None, None)
+    row = get_reference_data(conn).class_rows_by_name.get(class_name)
+    return (row['starting_weapon_id'], row['starting_armor_id']) if row else (None, None)
 
 def remove_item_from_inventory(conn, inventory_id, quantity=1):
     """
@@ -660,14 +516,7 @@ def get_background_by_name(conn, background_name):
     """
     Retorna os dados de um background específico pelo nome.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM backgrounds WHERE name = ?", (background_name,))
-    background_data = cursor.fetchone()
-
-    if background_data:
-        columns = [description[0] for description in cursor.description]
-        return dict(zip(columns, background_data))
-    return None
+    return get_reference_data(conn).get_background(background_name)
 
 def get_background_starting_skills(conn, background_id):
     """
@@ -746,51 +595,22 @@ def get_skill_by_name(conn, skill_name):
     """
     Obtém os detalhes de uma habilidade base pelo nome.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM skills WHERE name = ?", (skill_name,))
-    skill_data = cursor.fetchone()
-
-    if skill_data:
-        columns = [description[0] for description in cursor.description]
-        return dict(zip(columns, skill_data))
-    return None
+    return get_reference_data(conn).get_skill_by_name(skill_name)
 
 def get_skill_by_id(conn, skill_id):
     """
     Obtém os detalhes de uma habilidade base pelo ID.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM skills WHERE id = ?", (skill_id,))
-    skill_data = cursor.fetchone()
-
-    if skill_data:
-        columns = [description[0] for description in cursor.description]
-        return dict(zip(columns, skill_data))
-    return None
+    return get_reference_data(conn).get_skill_by_id(skill_id)
 
 def load_backgrounds(conn):
     """
-    Carrega todos os dados de antecedentes do banco de dados.
+    Carrega todos os dados de antecedentes (servidos pelo cache de referência).
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM backgrounds")
-    
-    columns = [col[0] for col in cursor.description]
-    rows = cursor.fetchall()
-    
-    backgrounds = []
-    for row in rows:
-        backgrounds.append(dict(zip(columns, row)))
-    
-    return backgrounds
+    return get_reference_data(conn).all_backgrounds()
 
 def get_all_skills(conn):
     """
     Retorna todas as habilidades base do sistema.
     """
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM skills")
-    
-    columns = [col[0] for col in cursor.description]
-    skills = [dict(zip(columns, row)) for row in cursor.fetchall()]
-    return skills
\ No newline at end of file
+    return get_reference_data(conn).all_skills()
@@ -0,0 +1,189 @@
+# game/db_template.py
+"""
+Banco modelo para criar mundos (e bancos de teste) novos sem repopular tudo.
+
+O banco de referência é populado uma única vez (data/populate_db.seed_database)
+e gravado em get_template_db_path(). A partir dele:
+
+- clone_database(destino) copia o modelo para um arquivo com a API de backup;
+- open_memory_database() abre uma cópia em memória a partir da imagem
+  serializada do modelo (Connection.deserialize), mantida em cache no processo.
+
+O modelo é reconstruído sozinho quando está ausente, quando o esquema ficou
+para trás (PRAGMA user_version) ou quando os dados em data/ são mais novos
+que ele.
+
+Uso:
+    python -m game.db_template --rebuild
+"""
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+
+from .config import get_base_path, get_db_path, get_template_db_path
+from .connection import STATEMENT_CACHE_SIZE, configure_connection
+from .migrations import SCHEMA_VERSION, get_schema_version
+
+# Arquivos cujo conteúdo define o banco modelo
+TEMPLATE_SOURCES = (
+    os.path.join('data', 'data_tuples.py'),
+    os.path.join('data', 'populate_db.py'),
+    os.path.join('game', 'migrations.py'),
+)
+
+# Imagens serializadas dos modelos (caminho -> bytes), carregadas na primeira cópia em memória
+_template_images = {}
+
+
+def _build_seeded_connection(verbose=False):
+    """Popula um banco em memória com os dados de referência."""
+    from data.populate_db import seed_database
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("PRAGMA foreign_keys = ON")
+    output = sys.stdout if verbose else io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success = seed_database(conn)
+    if not success:
+        conn.close()
+        if not verbose:
+            print(output.getvalue())
+        raise RuntimeError("Não foi possível popular o banco modelo (veja os erros acima).")
+    return conn
+
+
+def build_template(template_path=None, verbose=False):
+    """(Re)constrói o banco modelo e retorna seu caminho."""
+    template_path = template_path or get_template_db_path()
+    os.makedirs(os.path.dirname(template_path), exist_ok=True)
+
+    source = _build_seeded_connection(verbose)
+    # Grava em um arquivo temporário e troca de uma vez: nunca há modelo pela metade
+    temporary_path = template_path + ".tmp"
+    if os.path.exists(temporary_path):
+        os.remove(temporary_path)
+    target = sqlite3.connect(temporary_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+    os.replace(temporary_path, template_path)
+
+    _template_images.pop(template_path, None)
+    if hasattr(source, "serialize"):
+        _template_images[template_path] = source.serialize()
+    source.close()
+    return template_path
+
+
+def is_template_stale(template_path=None):
+    """True se o modelo não existe, está em um esquema antigo ou é mais velho que os dados."""
+    template_path = template_path or get_template_db_path()
+    if not os.path.exists(template_path):
+        return True
+
+    template_mtime = os.path.getmtime(template_path)
+    base_path = get_base_path()
+    for source in TEMPLATE_SOURCES:
+        source_path = os.path.join(base_path, source)
+        # No executável os fontes não existem; vale o modelo distribuído
+        if os.path.exists(source_path) and os.path.getmtime(source_path) > template_mtime:
+            return True
+
+    conn = sqlite3.connect(template_path)
+    try:
+        return get_schema_version(conn) < SCHEMA_VERSION
+    except sqlite3.Error:
+        return True
+    finally:
+        conn.close()
+
+
+def ensure_template(template_path=None):
+    """Retorna o caminho do modelo, reconstruindo-o se necessário."""
+    template_path = template_path or get_template_db_path()
+    if is_template_stale(template_path):
+        build_template(template_path)
+    return template_path
+
+
+def clone_database(target_path=None, template_path=None, overwrite=False):
+    """
+    Cria um banco novo, já populado, em target_path (padrão: o banco do jogo)
+    copiando o modelo com a API de backup. Sem overwrite, não substitui um
+    banco existente e retorna None.
+    """
+    target_path = str(target_path or get_db_path())
+    if os.path.exists(target_path) and not overwrite:
+        print(f"O banco '{target_path}' já existe; use overwrite=True para substituí-lo.")
+        return None
+
+    template = sqlite3.connect(ensure_template(template_path))
+    # Arquivos auxiliares do WAL de um banco anterior não podem sobreviver à cópia
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(target_path + suffix):
+            os.remove(target_path + suffix)
+    target = sqlite3.connect(target_path)
+    try:
+        template.backup(target)
+    finally:
+        target.close()
+        template.close()
+    return target_path
+
+
+def _load_template_image(template_path=None):
+    template_path = ensure_template(template_path)
+    image = _template_images.get(template_path)
+    if image is None:
+        conn = sqlite3.connect(template_path)
+        try:
+            image = _template_images[template_path] = conn.serialize()
+        finally:
+            conn.close()
+    return image
+
+
+def open_memory_database(template_path=None):
+    """
+    Abre uma cópia do modelo em memória, já configurada como as conexões do jogo.
+    Cada chamada devolve um banco independente; alterações não tocam o modelo.
+    """
+    conn = sqlite3.connect(":memory:", cached_statements=STATEMENT_CACHE_SIZE)
+    if hasattr(conn, "deserialize"):
+        conn.deserialize(_load_template_image(template_path))
+    else:
+        # Python < 3.11: copia pela API de backup
+        template = sqlite3.connect(ensure_template(template_path))
+        try:
+            template.backup(conn)
+        finally:
+            template.close()
+    return configure_connection(conn)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banco modelo para mundos novos.")
+    parser.add_argument("--rebuild", action="store_true", help="Reconstrói o modelo mesmo se estiver atualizado")
+    parser.add_argument("--clone", metavar="DESTINO", help="Cria um banco novo a partir do modelo")
+    parser.add_argument("--overwrite", action="store_true", help="Permite substituir o destino do --clone")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        path = build_template(verbose=True)
+    else:
+        path = ensure_template()
+    print(f"Banco modelo: {path}")
+
+    if args.clone:
+        if not clone_database(args.clone, overwrite=args.overwrite):
+            return 1
+        print(f"Banco novo criado em {args.clone}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+# game/dice.py
+"""
+Compilador de expressões de dados ('1d20', '2d6-1', '1d8+1d2+1d6').
+
+compile_dice() analisa a expressão uma única vez e devolve um DiceExpression
+imutável, guardado em um cache LRU por texto da expressão. O objeto oferece
+rolagem simples, rolagem em lote, mínimo, máximo, média e a distribuição
+exata de probabilidades.
+"""
+import random
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+# Um termo: sinal opcional seguido de 'XdY' (X opcional) ou de uma constante
+TERM_PATTERN = re.compile(r"\s*([+-]?)\s*(?:(\d*)[dD](\d+)|(\d+))\s*")
+
+DICE_CACHE_SIZE = 256
+
+
+class DiceExpression:
+    """
+    Expressão de dados compilada. 'terms' é uma tupla de (quantidade, faces, sinal)
+    e 'constant' é a soma dos bônus fixos.
+    """
+    __slots__ = ('expression', 'terms', 'constant', 'min', 'max', 'mean', '_counts')
+
+    def __init__(self, expression, terms, constant):
+        set_attr = object.__setattr__
+        set_attr(self, 'expression', expression)
+        set_attr(self, 'terms', tuple(terms))
+        set_attr(self, 'constant', constant)
+
+        low = high = constant
+        mean = Fraction(constant)
+        for count, sides, sign in self.terms:
+            if sign > 0:
+                low += count
+                high += count * sides
+            else:
+                low -= count * sides
+                high -= count
+            mean += sign * count * Fraction(sides + 1, 2)
+        set_attr(self, 'min', low)
+        set_attr(self, 'max', high)
+        set_attr(self, 'mean', float(mean))
+        set_attr(self, '_counts', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DiceExpression é imutável")
+
+    def __repr__(self):
+        return f"DiceExpression({self.expression!r})"
+
+    def roll(self, rng=None):
+        """Rola a expressão uma vez (rng opcional, para rolagens reproduzíveis)."""
+        randint = (rng or random).randint
+        total = self.constant
+        for count, sides, sign in self.terms:
+            for _ in range(count):
+                total += sign * randint(1, sides)
+        return total
+
+    def roll_many(self, n, rng=None):
+        """
+        Rola a expressão n vezes. Com um numpy.random.Generator como rng, as
+        rolagens são feitas em lote e o resultado é um array; caso contrário,
+        uma lista.
+        """
+        if rng is not None and hasattr(rng, 'integers'):
+            if not self.terms:
+                return rng.integers(self.constant, self.constant + 1, size=n)
+            total = self.constant
+            for count, sides, sign in self.terms:
+                total = total + sign * rng.integers(1, sides + 1, size=(n, count)).sum(axis=1)
+            return total
+        return [self.roll(rng) for _ in range(n)]
+
+    def counts(self):
+        """
+        Número de combinações que resultam em cada total, como (menor total, lista de contagens).
+        Calculado por convolução uma única vez.
+        """
+        if self._counts is None:
+            offset, counts = self.constant, [1]
+            for count, sides, sign in self.terms:
+                die = [1] * sides
+                die_offset = 1 if sign > 0 else -sides
+                for _ in range(count):
+                    offset, counts = offset + die_offset, _convolve(counts, die)
+            object.__setattr__(self, '_counts', (offset, tuple(counts)))
+        return self._counts
+
+    def distribution(self, exact=False):
+        """Probabilidade de cada total: {total: probabilidade} (Fraction se exact=True)."""
+        offset, counts = self.counts()
+        outcomes = sum(counts)
+        if exact:
+            return {offset + i: Fraction(c, outcomes) for i, c in enumerate(counts) if c}
+        return {offset + i: c / outcomes for i, c in enumerate(counts) if c}
+
+
+def _convolve(a, b):
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+@lru_cache(maxsize=DICE_CACHE_SIZE)
+def compile_dice(expression):
+    """
+    Compila uma expressão de dados. Levanta ValueError se o formato for inválido.
+    O resultado fica em cache, então compilar a mesma expressão de novo é gratuito.
+    """
+    text = str(expression).strip()
+    if not text:
+        raise ValueError(f"Expressão de dados vazia: {expression!r}")
+
+    terms = []
+    constant = 0
+    position = 0
+    while position < len(text):
+        match = TERM_PATTERN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Formato de dado inválido: {expression!r}")
+        sign_text, count, sides, number = match.groups()
+        if not sign_text and position > 0:
+            raise ValueError(f"Formato de dado inválido: {expression!r}")
+        sign = -1 if sign_text == '-' else 1
+
+        if number is not None:
+            constant += sign * int(number)
+        else:
+            count = int(count) if count else 1
+            sides = int(sides)
+            if sides < 1:
+                raise ValueError(f"Dado sem faces em {expression!r}")
+            if count:
+                terms.append((count, sides, sign))
+        position = match.end()
+
+    return DiceExpression(text, terms, constant)
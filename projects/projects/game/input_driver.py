@@ -0,0 +1,104 @@
+# game/input_driver.py
+"""
+Fonte de entrada do jogo.
+
+Todos os estados e módulos leem teclas com read_input() (no lugar de input()).
+O driver ativo decide de onde vem a entrada:
+
+- ConsoleInput: o teclado, como antes (padrão);
+- ScriptedInput: uma lista de teclas repetida na ordem, sem TTY;
+- PolicyInput: uma função que escolhe a tecla a partir do prompt e do jogo.
+
+O Game recebe o driver no construtor; testes e benchmarks usam os dois
+últimos para jogar sessões inteiras sem ninguém digitando. Drivers headless
+também desligam as pausas de game/pacing.py.
+"""
+import builtins
+
+
+class ScriptExhausted(BaseException):
+    """
+    O roteiro de teclas (ou a política) terminou: a sessão deve ser encerrada.
+    Herda de BaseException, como KeyboardInterrupt, para atravessar os
+    'except Exception' dos estados até o loop do Game.
+    """
+
+
+class InputDriver:
+    """Base dos drivers. headless=True indica que não há ninguém olhando a tela."""
+    headless = False
+
+    def read(self, prompt=""):
+        raise NotImplementedError
+
+
+class ConsoleInput(InputDriver):
+    """Entrada pelo teclado."""
+
+    def read(self, prompt=""):
+        return builtins.input(prompt)
+
+
+class ScriptedInput(InputDriver):
+    """Repete uma sequência fixa de teclas; echo mostra prompt e tecla na saída."""
+    headless = True
+
+    def __init__(self, keys, echo=False):
+        self.keys = list(keys)
+        self.position = 0
+        self.echo = echo
+
+    def read(self, prompt=""):
+        if self.position >= len(self.keys):
+            raise ScriptExhausted(f"Roteiro terminou após {len(self.keys)} teclas")
+        key = self.keys[self.position]
+        self.position += 1
+        if self.echo:
+            print(f"{prompt}{key}")
+        return key
+
+
+class PolicyInput(InputDriver):
+    """
+    Entrada escolhida por uma política: policy(prompt, game) -> tecla.
+    A política retorna None para encerrar a sessão; max_steps limita o total.
+    """
+    headless = True
+
+    def __init__(self, policy, game=None, max_steps=10000, echo=False):
+        self.policy = policy
+        self.game = game
+        self.max_steps = max_steps
+        self.steps = 0
+        self.echo = echo
+
+    def read(self, prompt=""):
+        if self.steps >= self.max_steps:
+            raise ScriptExhausted(f"Política atingiu o limite de {self.max_steps} passos")
+        key = self.policy(prompt, self.game)
+        if key is None:
+            raise ScriptExhausted("Política encerrou a sessão")
+        self.steps += 1
+        if self.echo:
+            print(f"{prompt}{key}")
+        return key
+
+
+_driver = ConsoleInput()
+
+
+def get_input_driver():
+    return _driver
+
+
+def set_input_driver(driver):
+    """Troca o driver ativo e retorna o anterior."""
+    global _driver
+    previous = _driver
+    _driver = driver or ConsoleInput()
+    return previous
+
+
+def read_input(prompt=""):
+    """Substitui input(): lê a próxima entrada do driver ativo."""
+    return _driver.read(prompt)
@@ -2,6 +2,8 @@ from game.utils import roll_dice, modifier, roll_attribute, get_setting
 from game.character import Character
 from game.combat import Combat
 from game.db_queries import get_class_by_name, get_item_details # Adicionado get_item_details para mostrar info de itens
+from .input_driver import read_input
+from .rng import stream
 
 def show_race_options(races):
     """Mostra opções de raça disponíveis com formatação de tabela aprimorada"""
@@ -177,7 +179,7 @@ def game_menu(player):
         print("7. Deletar Personagem")
         print("=" * 50)
         
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         
         if choice == "1":
             explore(player)
@@ -191,25 +193,25 @@ def game_menu(player):
             # Se não, você precisará passar o game object ou refatorar
             # Por enquanto, apenas printa uma mensagem
             print("\nMenu de Inventário (funcionalidade a ser implementada via estados).")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
             # self.game.change_state(InventoryState(self.game, player)) # Exemplo de como seria com states
         elif choice == "5":
             save_character(player.conn, player) # Passa a conexão
             print("\nJogo salvo!")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
         elif choice == "6":
             save_character(player.conn, player) # Passa a conexão
             return
         elif choice == "7":
-            confirm = input(f"Tem certeza que deseja deletar {player.name}? (s/N): ").lower().strip()
+            confirm = read_input(f"Tem certeza que deseja deletar {player.name}? (s/N): ").lower().strip()
             if confirm == 's':
                 if delete_character(player.conn, player.id): # Passa a conexão
                     print("\nPersonagem deletado!")
-                    input("Pressione Enter para continuar...")
+                    read_input("Pressione Enter para continuar...")
                     return "deleted" # Retorna algo para indicar que o personagem foi deletado
             else:
                 print("\nOperação cancelada.")
-                input("Pressione Enter para continuar...")
+                read_input("Pressione Enter para continuar...")
 
 def explore(player):
     from game.database import save_character
@@ -220,7 +222,7 @@ def explore(player):
     print("=" * 50)
     
     # 70% chance de encontro
-    if roll_dice("1d10") > 3:
+    if roll_dice("1d10", stream("encounters")) > 3:
         print("\nVocê encontrou um inimigo!")
         combat = Combat(player, get_connection()) # Passa a conexão
         combat_result = combat.start()
@@ -228,7 +230,7 @@ def explore(player):
     else:
         print("\nVocê explorou a área mas não encontrou nada.")
     
-    input("\nPressione Enter para continuar...")
+    read_input("\nPressione Enter para continuar...")
 
 def rest(player):
     from game.database import save_character
@@ -239,7 +241,7 @@ def rest(player):
     print("=" * 50)
     
     # 30% chance de encontro durante descanso
-    if roll_dice("1d10") > 7:
+    if roll_dice("1d10", stream("encounters")) > 7:
         print("\nUm monstro te surpreendeu durante o descanso!")
         combat = Combat(player, get_connection()) # Passa a conexão
         combat_result = combat.start()
@@ -250,7 +252,7 @@ def rest(player):
         print(f"\nVocê descansou e recuperou {heal_amount} de HP!")
         print(f"HP atual: {player.hp}/{player.hp_max}")
         save_character(player.conn, player) # Salva após o descanso
-        input("\nPressione Enter para continuar...")
+        read_input("\nPressione Enter para continuar...")
 
 def show_attributes_full(player): # Renomeado para diferenciar da versão simplificada
     """Exibe atributos do personagem (versão completa e atualizada)"""
@@ -259,7 +261,7 @@ def show_attributes_full(player): # Renomeado para diferenciar da versão simpli
         player.show_attributes()
     else:
         print("\nErro: Personagem não carregado ou inválido.")
-    input("\nPressione Enter para voltar...")
+    read_input("\nPressione Enter para voltar...")
 
 # Importa get_connection aqui para que as funções de menu possam usá-lo
 from game.db_queries import get_connection
@@ -0,0 +1,180 @@
+# game/migrations.py
+"""
+Migrações versionadas do esquema (PRAGMA user_version).
+
+Cada migração tem um número de versão crescente e uma função que recebe a
+conexão. migrate() aplica, em ordem, as que ainda não rodaram no banco, cada
+uma em sua própria transação junto com a atualização de user_version; se uma
+falhar, o banco fica na última versão válida e os saves não são tocados.
+
+Para mudar o esquema, acrescente uma função ao final de MIGRATIONS em vez de
+apagar e repopular as tabelas. As migrações devem ser idempotentes
+(IF NOT EXISTS, checagem de colunas), pois um banco recém-criado por
+data/populate_db.py também passa por toda a escada.
+
+Uso:
+    python -m game.migrations            # aplica as pendentes
+    python -m game.migrations --check    # mostra versão e planos das consultas
+"""
+import argparse
+import sqlite3
+import sys
+
+from .connection import get_shared_connection
+
+
+def _table_exists(conn, table):
+    cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cursor.fetchone() is not None
+
+
+def _add_column_if_missing(conn, table, column, definition):
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+
+def _add_character_columns(conn):
+    """Colunas de 'characters' criadas depois da primeira versão do jogo."""
+    if not _table_exists(conn, "characters"):
+        return
+    _add_column_if_missing(conn, "characters", "background", "TEXT")
+    _add_column_if_missing(conn, "characters", "difficulty", "TEXT")
+    _add_column_if_missing(conn, "characters", "permadeath", "INTEGER DEFAULT 0")
+
+
+def _add_lookup_indexes(conn):
+    """
+    Índices das colunas filtradas pelo db_queries.
+    character_skills(character_id) e name_components(culture, gender, component_type)
+    já são atendidos pelos índices da PRIMARY KEY e do UNIQUE dessas tabelas.
+    """
+    statements = [
+        # Cobre 'WHERE character_id = ?' e a busca de pilha (character_id, item_id, enhancement_level)
+        "CREATE INDEX IF NOT EXISTS idx_character_inventory_character "
+        "ON character_inventory(character_id, item_id, enhancement_level)",
+        "CREATE INDEX IF NOT EXISTS idx_monsters_level ON monsters(level)",
+        "CREATE INDEX IF NOT EXISTS idx_skills_name ON skills(name)",
+        "CREATE INDEX IF NOT EXISTS idx_background_skills_skill ON background_skills(skill_id)",
+    ]
+    for statement in statements:
+        table = statement.split(" ON ")[1].split("(")[0]
+        if _table_exists(conn, table):
+            conn.execute(statement)
+
+
+def _create_combat_log(conn):
+    """
+    Registro de combates (game/combat_log.py). Sem chave estrangeira para
+    characters: o registro continua existindo depois de uma morte com permadeath.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS combat_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            character_id INTEGER,
+            character_name TEXT,
+            difficulty TEXT,
+            permadeath INTEGER DEFAULT 0,
+            session_seed INTEGER,
+            seed INTEGER NOT NULL,
+            setup TEXT NOT NULL,
+            events BLOB NOT NULL,
+            result TEXT,
+            rounds INTEGER,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_combat_log_character ON combat_log(character_id)")
+
+
+# (versão, descrição, função) em ordem crescente de versão
+MIGRATIONS = [
+    (1, "Colunas background/difficulty/permadeath em characters", _add_character_columns),
+    (2, "Índices das colunas de busca frequente", _add_lookup_indexes),
+    (3, "Tabela combat_log (registro de combates)", _create_combat_log),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Consultas quentes do jogo, usadas para conferir os planos (EXPLAIN QUERY PLAN)
+HOT_QUERIES = {
+    "inventário": "SELECT * FROM character_inventory WHERE character_id = 1 AND quantity > 0",
+    "pilha de item": "SELECT id FROM character_inventory "
+                     "WHERE character_id = 1 AND item_id = 1 AND enhancement_level = 0",
+    "perícias": "SELECT * FROM character_skills WHERE character_id = 1",
+    "monstros por nível": "SELECT * FROM monsters WHERE level BETWEEN 1 AND 3",
+    "componentes de nome": "SELECT value FROM name_components "
+                           "WHERE culture = 'medieval' AND gender = 'masc' AND component_type = 'prefix'",
+    "perícia por nome": "SELECT id FROM skills WHERE name = 'Atletismo'",
+    "combates do personagem": "SELECT id FROM combat_log WHERE character_id = 1",
+}
+
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, target=None):
+    """
+    Aplica as migrações pendentes até a versão target (padrão: a mais recente).
+    Retorna a versão final do banco.
+    """
+    target = SCHEMA_VERSION if target is None else target
+    current = get_schema_version(conn)
+    if conn.in_transaction:
+        conn.commit()
+
+    for version, description, apply in MIGRATIONS:
+        if version <= current or version > target:
+            continue
+        try:
+            conn.execute("BEGIN")
+            apply(conn)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Erro ao aplicar migração {version} ({description}): {e}")
+            break
+        current = version
+    return current
+
+
+def full_scans(conn, queries=None):
+    """
+    Consultas cujo plano ainda varre a tabela inteira: {nome: detalhes do plano}.
+    Uma consulta quente que volta a aparecer aqui é uma regressão de índice.
+    """
+    scans = {}
+    for name, query in (queries or HOT_QUERIES).items():
+        try:
+            plan = [row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + query)]
+        except sqlite3.Error:
+            continue  # Tabela ainda não existe neste banco
+        if any(detail.startswith("SCAN") for detail in plan):
+            scans[name] = plan
+    return scans
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Migrações do esquema do banco de dados.")
+    parser.add_argument("--check", action="store_true", help="Só mostra a versão e os planos das consultas")
+    args = parser.parse_args(argv)
+
+    conn = get_shared_connection()
+    if not args.check:
+        version = migrate(conn)
+        print(f"Esquema na versão {version} (mais recente: {SCHEMA_VERSION})")
+    else:
+        print(f"Esquema na versão {get_schema_version(conn)} (mais recente: {SCHEMA_VERSION})")
+
+    scans = full_scans(conn)
+    for name, plan in scans.items():
+        print(f"Varredura completa em '{name}': {'; '.join(plan)}")
+    if not scans:
+        print("Todas as consultas quentes usam índices.")
+    return 1 if scans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
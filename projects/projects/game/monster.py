@@ -1,8 +1,16 @@
 from .utils import roll_dice, modifier  # Certifique-se que modifier está importado
-import random
+from .rng import stream
 import re
 
 class Monster:
+    # Sem __dict__ por instância: um encontro pode ter muitos monstros vivos
+    __slots__ = (
+        'id', 'name', 'level', 'damage_dice', 'exp_reward', 'gold_dice',
+        'strength', 'dexterity', 'constitution', 'intelligence', 'wisdom', 'charisma',
+        'main_attack_attribute', 'attack_type', 'physical_resistance', 'magical_resistance',
+        'hp_max', 'hp', 'attack_bonus', 'ac',
+    )
+
     def __init__(self, id=None, name="", level=1, hp=None, hp_max=None, ac=None, 
                  attack_bonus=None, damage_dice="1d6", exp_reward=0, gold_dice="1d4",
                  strength=10, dexterity=10, constitution=10, intelligence=10, 
@@ -39,29 +47,67 @@ class Monster:
             self.attack_bonus = attack_bonus
         self.ac = ac  # Usa AC fornecido diretamente
             
+    @classmethod
+    def from_row(cls, row, hp_multiplier=1.0):
+        """Cria um Monster a partir de uma linha (dict) da tabela monsters."""
+        return cls(
+            id=row.get('id'),
+            name=row['name'],
+            level=row['level'],
+            hp_max=int(row.get('hp', 10) * hp_multiplier),
+            ac=row.get('ac', 10),
+            attack_bonus=row.get('attack_bonus', 0),
+            damage_dice=row['damage_dice'],
+            exp_reward=row['exp_reward'],
+            gold_dice=row['gold_dice'],
+            strength=row.get('strength', 10),
+            dexterity=row.get('dexterity', 10),
+            constitution=row.get('constitution', 10),
+            intelligence=row.get('intelligence', 10),
+            wisdom=row.get('wisdom', 10),
+            charisma=row.get('charisma', 10),
+            main_attack_attribute=row.get('main_attack_attribute', 'strength'),
+            attack_type=row.get('attack_type', 'physical'),
+            physical_resistance=row.get('physical_resistance', 0),
+            magical_resistance=row.get('magical_resistance', 0)
+        )
+
+    def snapshot(self):
+        """Todos os atributos como um dicionário simples (ex.: para o registro de combates)."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """Recria o Monster exatamente como em snapshot(), sem recalcular nada."""
+        monster = cls.__new__(cls)
+        for slot in cls.__slots__:
+            setattr(monster, slot, data[slot])
+        return monster
+
     def calculate_attack_bonus(self):
         """Calcula bônus de ataque usando atributo principal"""
         main_attr = getattr(self, self.main_attack_attribute)
         self.attack_bonus = modifier(main_attr) + self.level // 2
         
-    def attack(self):
+    def attack(self, rng=None):
         """Realiza um ataque retornando [total, crítico, rolagem]"""
-        roll = random.randint(1, 20)
+        roll = (rng or stream("combat")).randint(1, 20)
         is_critical = (roll == 20)
         is_fumble = (roll == 1)
         
         total = roll + self.attack_bonus
         return total, is_critical, roll
 
-    def calculate_damage(self, crit=False):
+    def calculate_damage(self, crit=False, rng=None):
         """Calcula dano baseado na arma e atributo principal"""
-        base_damage = roll_dice(self.damage_dice)
+        rng = rng or stream("combat")
+        base_damage = roll_dice(self.damage_dice, rng)
         
         main_attr = getattr(self, self.main_attack_attribute)
         damage = base_damage + modifier(main_attr)
         
         if crit:
-            damage += roll_dice(self.damage_dice)  # Dano extra no crítico
+            damage += roll_dice(self.damage_dice, rng)  # Dano extra no crítico
             
         return max(1, damage)
 
@@ -77,4 +123,4 @@ class Monster:
 
     def get_gold_reward(self):
         """Calcula a recompensa em ouro"""
-        return roll_dice(self.gold_dice)
\ No newline at end of file
+        return roll_dice(self.gold_dice, stream("loot"))
\ No newline at end of file
@@ -0,0 +1,169 @@
+# game/monster_batch.py
+"""
+Monstros em lote no formato struct-of-arrays.
+
+Em vez de um objeto Monster por monstro vivo, MonsterBatch guarda uma coluna
+array.array por atributo de combate (hp, ac, bônus de ataque, resistências...)
+e uma linha por monstro. O que é igual para todos os monstros do mesmo tipo
+(nome, dados de dano compilados, dados de ouro) fica uma única vez em
+'templates', e cada monstro aponta para o seu tipo pela coluna 'template'.
+
+Os valores seguem as mesmas regras de combat_engine.monster_from_data: HP
+da tabela multiplicado pela dificuldade, mais o modificador de Constituição.
+
+Com NumPy instalado, numpy_column() devolve as colunas como arrays NumPy
+sem cópia, para rolagens e danos vetorizados.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: as colunas continuam sendo array.array
+    np = None
+
+from .dice import compile_dice
+from .monster import Monster
+from .utils import modifier
+
+ATTACK_TYPES = ("physical", "magical")
+
+# Coluna -> typecode do array.array
+COLUMNS = {
+    'template': 'H',             # Índice em MonsterBatch.templates
+    'level': 'h',
+    'hp': 'i',
+    'hp_max': 'i',
+    'ac': 'h',
+    'attack_bonus': 'h',
+    'damage_modifier': 'h',      # Modificador do atributo principal somado ao dano
+    'physical_resistance': 'h',
+    'magical_resistance': 'h',
+    'flee_modifier': 'h',        # Modificador de Destreza no teste de fuga
+    'attack_type': 'b',          # Índice em ATTACK_TYPES (-1 = sem resistência aplicável)
+    'exp_reward': 'i',
+}
+
+# SELECT usado por from_table; o filtro de nível usa idx_monsters_level
+MONSTERS_SQL = "SELECT * FROM monsters"
+
+
+class MonsterBatch:
+    """Muitos monstros vivos, uma coluna por atributo."""
+
+    def __init__(self, hp_multiplier=1.0):
+        self.hp_multiplier = hp_multiplier
+        self.templates = []       # Linhas da tabela monsters (dicts), uma por tipo
+        self.damage_dice = []     # DiceExpression compilada por tipo
+        self.gold_dice = []
+        self.columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        self._template_keys = {}  # id da linha (ou nome) -> índice em templates
+
+    @classmethod
+    def from_rows(cls, rows, count=1, hp_multiplier=1.0):
+        """Lote com count monstros de cada linha (dicts no formato da tabela monsters)."""
+        batch = cls(hp_multiplier)
+        for row in rows:
+            batch.add(row, count)
+        return batch
+
+    @classmethod
+    def from_table(cls, conn, min_level=None, max_level=None, count=1, hp_multiplier=1.0):
+        """Lote lido direto da tabela monsters, opcionalmente filtrado por faixa de nível."""
+        query = MONSTERS_SQL
+        params = []
+        if min_level is not None or max_level is not None:
+            query += " WHERE level BETWEEN ? AND ?"
+            params = [min_level if min_level is not None else 0,
+                      max_level if max_level is not None else 2 ** 31]
+        cursor = conn.execute(query + " ORDER BY id", params)
+        columns = [col[0] for col in cursor.description]
+        return cls.from_rows((dict(zip(columns, row)) for row in cursor), count, hp_multiplier)
+
+    def __len__(self):
+        return len(self.columns['hp'])
+
+    def _template_index(self, row):
+        key = row.get('id') or row['name']
+        index = self._template_keys.get(key)
+        if index is None:
+            index = self._template_keys[key] = len(self.templates)
+            self.templates.append(dict(row))
+            self.damage_dice.append(compile_dice(row['damage_dice']))
+            self.gold_dice.append(compile_dice(row['gold_dice']))
+        return index
+
+    def add(self, row, count=1):
+        """Acrescenta count monstros do tipo da linha; retorna o range dos novos índices."""
+        start = len(self)
+        main_attr = row.get('main_attack_attribute') or 'strength'
+        hp_max = int(row.get('hp', 10) * self.hp_multiplier) + modifier(row.get('constitution', 10))
+        attack_type = row.get('attack_type', 'physical')
+        attack_bonus = row.get('attack_bonus')
+        if attack_bonus is None:
+            # Mesmo cálculo de Monster.calculate_attack_bonus
+            attack_bonus = modifier(row.get(main_attr, 10)) + row['level'] // 2
+        values = {
+            'template': self._template_index(row),
+            'level': row['level'],
+            'hp': hp_max,
+            'hp_max': hp_max,
+            'ac': row.get('ac', 10),
+            'attack_bonus': attack_bonus,
+            'damage_modifier': modifier(row.get(main_attr, 10)),
+            'physical_resistance': row.get('physical_resistance', 0),
+            'magical_resistance': row.get('magical_resistance', 0),
+            'flee_modifier': modifier(row.get('dexterity', 10)),
+            'attack_type': ATTACK_TYPES.index(attack_type) if attack_type in ATTACK_TYPES else -1,
+            'exp_reward': row.get('exp_reward', 0),
+        }
+        for name, column in self.columns.items():
+            column.extend([values[name]] * count)
+        return range(start, start + count)
+
+    def name(self, index):
+        return self.templates[self.columns['template'][index]]['name']
+
+    def attack_type(self, index):
+        code = self.columns['attack_type'][index]
+        return ATTACK_TYPES[code] if code >= 0 else self.templates[self.columns['template'][index]].get('attack_type')
+
+    def alive_indices(self):
+        return [i for i, hp in enumerate(self.columns['hp']) if hp > 0]
+
+    def alive_count(self):
+        return sum(1 for hp in self.columns['hp'] if hp > 0)
+
+    def take_damage(self, index, damage, damage_type):
+        """Mesmas regras de Monster.take_damage; retorna True se o monstro morreu."""
+        # As colunas são inteiras; o dano pode vir fracionado (bônus de crítico da dificuldade)
+        damage = int(damage)
+        if damage_type == "physical":
+            damage = max(1, damage - self.columns['physical_resistance'][index])
+        elif damage_type == "magical":
+            damage = max(1, damage - self.columns['magical_resistance'][index])
+        self.columns['hp'][index] -= damage
+        return self.columns['hp'][index] <= 0
+
+    def reset_hp(self):
+        hp = self.columns['hp']
+        hp[:] = array(hp.typecode, self.columns['hp_max'])
+
+    def monster(self, index):
+        """Monster equivalente ao monstro index (com o HP atual), para a interface."""
+        monster = Monster.from_row(self.templates[self.columns['template'][index]], self.hp_multiplier)
+        monster.hp = self.columns['hp'][index]
+        return monster
+
+    def numpy_column(self, name):
+        """
+        A coluna como array NumPy que compartilha a memória do array.array (sem
+        cópia). Enquanto a visão existir, o lote não pode crescer (add).
+        """
+        if np is None:
+            raise ImportError("MonsterBatch.numpy_column requer NumPy (pip install numpy).")
+        column = self.columns[name]
+        return np.frombuffer(column, dtype=np.dtype(column.typecode))
+
+    def nbytes(self):
+        """Memória ocupada pelas colunas (sem contar os templates)."""
+        return sum(column.itemsize * len(column) for column in self.columns.values())
@@ -0,0 +1,90 @@
+# game/monster_index.py
+"""
+Índice em memória dos monstros, agrupado por faixa de nível e por região.
+
+A tabela 'monsters' é lida uma única vez; para cada nível de jogador (e cada
+região de REGION_MONSTER_POOLS) é montada uma tabela de alias, de modo que
+sortear o monstro de um encontro é O(1) e não toca o banco. O índice é
+descartado junto com o cache de dados de referência.
+"""
+from .config import REGION_MONSTER_POOLS
+from .connection import get_shared_connection
+from .reference_data import register_invalidation_hook
+from .rng import stream
+from .sampling import AliasTable
+
+# Mesma faixa usada por db_queries.load_monsters_by_level
+LEVEL_TOLERANCE = 2
+
+_monster_index = None
+
+
+class MonsterIndex:
+    """Monstros indexados por nível, com sorteio ponderado por região."""
+
+    def __init__(self, monster_rows, region_pools=REGION_MONSTER_POOLS, tolerance=LEVEL_TOLERANCE):
+        self.monsters = list(monster_rows)
+        self.by_id = {m['id']: m for m in self.monsters}
+        self.by_name = {m['name']: m for m in self.monsters}
+        self.tolerance = tolerance
+        self.max_level = max((m['level'] for m in self.monsters), default=0)
+
+        # Faixas de nível: nível do jogador -> monstros entre nível-tol e nível+tol
+        self.bands = {}
+        for level in range(1, self.max_level + tolerance + 1):
+            low, high = max(1, level - tolerance), level + tolerance
+            self.bands[level] = [m for m in self.monsters if low <= m['level'] <= high]
+
+        # Tabelas de alias por (nível, região); região None = todos com o mesmo peso
+        self._samplers = {}
+        for level, band in self.bands.items():
+            if not band:
+                continue
+            self._samplers[(level, None)] = AliasTable(band, [1] * len(band))
+            for region, pool in region_pools.items():
+                regional = [m for m in band if pool.get(m['name'], 0) > 0]
+                if regional:
+                    self._samplers[(level, region)] = AliasTable(
+                        regional, [pool[m['name']] for m in regional]
+                    )
+
+    def monsters_for_level(self, level, region=None):
+        """Monstros possíveis para o nível (e região, se ela tiver monstros na faixa)."""
+        sampler = self._sampler(level, region)
+        return [dict(m) for m in sampler.items] if sampler else []
+
+    def draw(self, level, region=None, rng=None):
+        """
+        Sorteia um monstro para um encontro. Regiões sem monstros na faixa usam
+        a faixa completa. Retorna None se não houver monstros para o nível.
+        """
+        sampler = self._sampler(level, region)
+        return dict(sampler.sample(rng or stream("encounters"))) if sampler else None
+
+    def _sampler(self, level, region):
+        return self._samplers.get((level, region)) or self._samplers.get((level, None))
+
+
+def load_monster_index(conn):
+    """Lê a tabela de monstros e (re)constrói o índice."""
+    global _monster_index
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM monsters ORDER BY id")
+    columns = [col[0] for col in cursor.description]
+    _monster_index = MonsterIndex(dict(zip(columns, row)) for row in cursor.fetchall())
+    return _monster_index
+
+
+def get_monster_index(conn=None):
+    """Retorna o índice de monstros, carregando-o na primeira chamada."""
+    if _monster_index is not None:
+        return _monster_index
+    return load_monster_index(conn or get_shared_connection())
+
+
+def invalidate_monster_index():
+    global _monster_index
+    _monster_index = None
+
+
+register_invalidation_hook(invalidate_monster_index)
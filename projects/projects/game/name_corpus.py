@@ -0,0 +1,167 @@
+# game/name_corpus.py
+"""
+Geração de corpora de nomes em paralelo, uma tarefa por cultura.
+
+O processo principal lê a tabela name_components uma única vez e envia as
+linhas para cada worker do ProcessPoolExecutor, que monta seu próprio
+NameComponentTable somente leitura (sem abrir o banco). Cada cultura usa um
+random.Random semeado a partir de (seed, cultura), então a mesma seed produz
+o mesmo corpus independentemente do número de processos ou da ordem em que
+as tarefas terminam.
+
+Os resultados são unidos em uma saída sem repetições, com estatísticas por
+cultura: taxa de colisão e histograma de comprimento dos nomes.
+
+Uso:
+    python -m game.name_corpus --count 50000 --seed 42 --output nomes.txt
+"""
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import culturas_comuns, culturas_fantasiosas
+from .connection import get_shared_connection
+from .name_generator import NameComponentTable, NameGenerator, write_names
+
+DEFAULT_CULTURES = culturas_comuns + culturas_fantasiosas
+
+# Tamanho das faixas do histograma de comprimento (em caracteres)
+LENGTH_BUCKET = 4
+
+# Snapshot dos componentes no processo worker (montado pelo initializer)
+_worker_table = None
+
+
+def load_component_rows(conn):
+    """Linhas de name_components no formato esperado por NameComponentTable."""
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT culture, gender, component_type, value, weight, is_required
+        FROM name_components
+        ORDER BY id
+    ''')
+    return cursor.fetchall()
+
+
+def _init_worker(rows):
+    global _worker_table
+    _worker_table = NameComponentTable(rows)
+
+
+def _culture_seed(seed, culture):
+    # Semente textual: determinística entre processos (não depende de hash())
+    return f"{seed}:{culture.lower()}"
+
+
+def generate_culture(culture, count, seed, gender=None, table=None):
+    """
+    Gera count nomes (com repetições) de uma cultura e devolve
+    (cultura, nomes únicos na ordem em que surgiram, total gerado).
+    """
+    generator = NameGenerator(component_table=table or _worker_table)
+    rng = random.Random(_culture_seed(seed, culture))
+    unique_names = {}
+    total = 0
+    for name in generator.generate_many(count, culture, gender, unique=False, rng=rng):
+        total += 1
+        unique_names.setdefault(name.casefold(), name)
+    return culture, list(unique_names.values()), total
+
+
+def length_histogram(names, bucket=LENGTH_BUCKET):
+    """Quantidade de nomes por faixa de comprimento: {(mín, máx): quantidade}."""
+    histogram = {}
+    for name in names:
+        low = (len(name) // bucket) * bucket
+        key = (low, low + bucket - 1)
+        histogram[key] = histogram.get(key, 0) + 1
+    return dict(sorted(histogram.items()))
+
+
+def build_corpus(cultures=None, count=10000, seed=None, gender=None, workers=None, conn=None):
+    """
+    Gera count nomes por cultura em paralelo.
+    Retorna (nomes únicos no corpus inteiro, estatísticas por cultura).
+    Culturas sem componentes no banco aparecem nas estatísticas com zero nomes.
+    """
+    cultures = list(cultures or DEFAULT_CULTURES)
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    rows = load_component_rows(conn or get_shared_connection())
+    known = {row[0].lower() for row in rows}
+
+    results = {}
+    pending = [c for c in cultures if c.lower() in known]
+    if pending:
+        workers = workers or min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(rows,)) as executor:
+            futures = [executor.submit(generate_culture, c, count, seed, gender) for c in pending]
+            for future in futures:
+                culture, names, total = future.result()
+                results[culture] = (names, total)
+
+    # União na ordem das culturas pedidas, para a saída ser reproduzível
+    corpus = []
+    seen = set()
+    stats = {}
+    for culture in cultures:
+        names, total = results.get(culture, ([], 0))
+        cross_duplicates = 0
+        for name in names:
+            folded = name.casefold()
+            if folded in seen:
+                cross_duplicates += 1
+                continue
+            seen.add(folded)
+            corpus.append(name)
+        stats[culture] = {
+            'generated': total,
+            'unique': len(names),
+            'collision_rate': 1 - len(names) / total if total else 0.0,
+            'shared_with_other_cultures': cross_duplicates,
+            'length_histogram': length_histogram(names),
+        }
+    return corpus, stats
+
+
+def print_stats(stats):
+    print(f"{'Cultura':<14} {'Gerados':>8} {'Únicos':>8} {'Colisão':>8} {'Repetidos':>9}  Comprimentos")
+    for culture, data in stats.items():
+        if not data['generated']:
+            print(f"{culture:<14} {'-':>8} {'-':>8} {'-':>8} {'-':>9}  (sem componentes no banco)")
+            continue
+        histogram = ", ".join(f"{low}-{high}: {n}" for (low, high), n in data['length_histogram'].items())
+        print(f"{culture:<14} {data['generated']:>8} {data['unique']:>8} "
+              f"{data['collision_rate']:>8.1%} {data['shared_with_other_cultures']:>9}  {histogram}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gerador paralelo de corpora de nomes por cultura.")
+    parser.add_argument("--cultures", nargs="+", help="Culturas (padrão: culturas_comuns + culturas_fantasiosas)")
+    parser.add_argument("--all-db-cultures", action="store_true",
+                        help="Usa todas as culturas presentes em name_components")
+    parser.add_argument("--count", type=int, default=10000, help="Nomes gerados por cultura")
+    parser.add_argument("--gender", choices=["masc", "fem", "neutro"], help="Gênero (padrão: sorteado por nome)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="Processos (padrão: um por núcleo)")
+    parser.add_argument("--output", help="Arquivo de saída com um nome por linha")
+    args = parser.parse_args(argv)
+
+    cultures = args.cultures
+    if args.all_db_cultures:
+        cultures = sorted({row[0] for row in load_component_rows(get_shared_connection())})
+
+    corpus, stats = build_corpus(cultures, args.count, args.seed, args.gender, args.workers)
+    print_stats(stats)
+    if args.output:
+        written = write_names(corpus, args.output)
+        print(f"{written} nomes únicos gravados em {args.output}")
+    else:
+        print(f"{len(corpus)} nomes únicos no corpus")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
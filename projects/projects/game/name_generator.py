@@ -1,33 +1,155 @@
 import sqlite3
-import random
-from pathlib import Path
+
+from game.connection import connect, get_shared_connection
+from game.reference_data import register_invalidation_hook
+from game.rng import stream
+from game.sampling import AliasTable
+
+# Gêneros aceitos por cada gerador (além do gênero pedido)
+NAME_GENERATOR_GENDERS = ('unisex',)
+UNIVERSAL_GENERATOR_GENDERS = (None,)
+
+_component_table = None
+
+
+def _build_sampler(components):
+    """Tabela de alias para uma lista de (valor, peso); None se não houver peso positivo."""
+    components = [(value, weight) for value, weight in components if weight and weight > 0]
+    if not components:
+        return None
+    return AliasTable([value for value, _ in components], [weight for _, weight in components])
+
+
+class NameComponentTable:
+    """
+    Componentes de nome lidos uma única vez da tabela name_components.
+    Para cada combinação (cultura, gêneros, tipo de componente) são montadas,
+    na primeira consulta, tabelas de alias para os componentes obrigatórios e
+    opcionais; a partir daí cada sorteio é O(1) e não toca o banco.
+    """
+
+    def __init__(self, rows):
+        # rows: (culture, gender, component_type, value, weight, is_required)
+        self.cultures = sorted({row[0] for row in rows})
+        self._by_culture = {}
+        self._by_gender = {}
+        for culture, gender, component_type, value, weight, is_required in rows:
+            entry = (value, weight, bool(is_required))
+            self._by_culture.setdefault((culture.lower(), gender, component_type), []).append(entry)
+            self._by_gender.setdefault((gender, component_type), []).append(entry)
+        self._samplers = {}
+
+    @classmethod
+    def load(cls, conn):
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT culture, gender, component_type, value, weight, is_required
+            FROM name_components
+            ORDER BY id
+        ''')
+        return cls(cursor.fetchall())
+
+    def components(self, genders, component_type, culture=None):
+        """
+        Listas (obrigatórios, opcionais) de (valor, peso) para os gêneros informados.
+        culture=None considera todas as culturas; a comparação de cultura ignora maiúsculas.
+        """
+        required = []
+        optional = []
+        for gender in genders:
+            if culture is None:
+                entries = self._by_gender.get((gender, component_type), ())
+            else:
+                entries = self._by_culture.get((culture.lower(), gender, component_type), ())
+            for value, weight, is_required in entries:
+                if is_required:
+                    required.append((value, weight))
+                else:
+                    optional.append((value, weight))
+        return required, optional
+
+    def samplers(self, genders, component_type, culture=None):
+        """Tabelas de alias (obrigatórios, opcionais), compiladas na primeira chamada."""
+        key = (culture.lower() if culture else None, genders, component_type)
+        samplers = self._samplers.get(key)
+        if samplers is None:
+            required, optional = self.components(genders, component_type, culture)
+            samplers = (_build_sampler(required), _build_sampler(optional))
+            self._samplers[key] = samplers
+        return samplers
+
+
+def get_name_component_table(conn=None):
+    """Retorna a tabela de componentes do banco do jogo, carregando-a na primeira chamada."""
+    global _component_table
+    if _component_table is None:
+        _component_table = NameComponentTable.load(conn or get_shared_connection())
+    return _component_table
+
+
+def invalidate_name_components():
+    global _component_table
+    _component_table = None
+
+
+register_invalidation_hook(invalidate_name_components)
+
 
 class NameGenerator:
-    def __init__(self, db_path=None):
-        # Define o caminho padrão para o banco de dados na pasta data
-        if db_path is None:
-            base_dir = Path(__file__).parent.parent
-            self.db_path = base_dir / 'data' / 'database.db'
-        else:
-            self.db_path = db_path
-            
+    def __init__(self, db_path=None, component_table=None, rng=None):
+        # Sem caminho explícito, usa a conexão compartilhada do jogo.
+        # component_table permite gerar a partir de um snapshot já carregado.
+        # rng (random.Random) substitui o fluxo "names" do serviço de game/rng.py.
+        self.db_path = db_path
         self.conn = None
-        print(f"Usando banco de dados: {self.db_path}")  # Para depuração
+        self._table = component_table
+        self._rng = rng
+
+    @property
+    def rng(self):
+        return self._rng or stream("names")
     
     def get_connection(self):
         """Retorna uma conexão com o banco de dados"""
         if self.conn is None:
-            self.conn = sqlite3.connect(str(self.db_path))
-            # Habilita o acesso por nome de coluna
-            self.conn.row_factory = sqlite3.Row
+            if self.db_path is None:
+                self.conn = get_shared_connection()
+            else:
+                self.conn = connect(self.db_path)
         return self.conn
+
+    def get_cursor(self):
+        """Retorna um cursor com acesso por nome de coluna (sem alterar a conexão compartilhada)"""
+        cursor = self.get_connection().cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor
     
     def close_connection(self):
-        """Fecha a conexão com o banco"""
+        """Fecha a conexão própria (a compartilhada continua aberta para o jogo)"""
         if self.conn:
-            self.conn.close()
+            if self.db_path is not None:
+                self.conn.close()
             self.conn = None
 
+    def get_component_table(self):
+        """Componentes de nome em memória (compartilhados quando se usa o banco do jogo)"""
+        if self._table is None and self.db_path is None:
+            return get_name_component_table()
+        if self._table is None:
+            self._table = NameComponentTable.load(self.get_connection())
+        return self._table
+
+    def _pick_component(self, genero, component_type, cultura):
+        """Sorteia o componente: obrigatório e, com 50% de chance, um opcional no lugar dele"""
+        required, optional = self.get_component_table().samplers(
+            (genero,) + NAME_GENERATOR_GENDERS, component_type, cultura
+        )
+        rng = self.rng
+        value = required.sample(rng) if required else ""
+        if optional and rng.random() > 0.5:
+            value = optional.sample(rng)
+        return value
+
     def __enter__(self):
         """Para suportar o protocolo 'with'"""
         return self
@@ -39,65 +161,30 @@ class NameGenerator:
 
     def listar_culturas(self):
         """Retorna todas as culturas disponíveis no banco de dados"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("SELECT DISTINCT culture FROM name_components")
-            culturas = [row['culture'] for row in cursor.fetchall()]
-            return culturas
+            return list(self.get_component_table().cultures)
         except sqlite3.Error as e:
             print(f"Erro ao buscar culturas: {e}")
             return ['medieval']  # Fallback padrão
-        finally:
-            # Não fechar a conexão aqui! 
-            pass
         
     def get_components(self, gender, component_type, culture='medieval'):
         """Busca componentes priorizando gênero, depois cultura"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = '''
-            SELECT value, weight, is_required 
-            FROM name_components 
-            WHERE gender IN (?, 'unisex') 
-            AND component_type = ?
-            AND culture = ?
-            '''
-            cursor.execute(query, (gender, component_type, culture))
-            results = cursor.fetchall()
-            
-            # Separa obrigatórios e opcionais
-            required = []
-            optional = []
-            
-            for row in results:
-                if row['is_required']:
-                    required.append((row['value'], row['weight']))
-                else:
-                    optional.append((row['value'], row['weight']))
-            
-            return required, optional
-    
+            return self.get_component_table().components(
+                (gender,) + NAME_GENERATOR_GENDERS, component_type, culture
+            )
         except sqlite3.Error as e:
             print(f"Erro no banco de dados: {e}")
             return [], []  # Retorna listas vazias para evitar quebra
-        finally:
-            # Não fechar a conexão aqui!
-            pass
 
     def select_component(self, components):
         """Seleciona um componente considerando seu peso"""
         if not components:
             return ""
         
-        weighted_list = []
-        for value, weight in components:
-            weighted_list.extend([value] * weight)
-        
-        return random.choice(weighted_list)
+        values = [value for value, _ in components]
+        weights = [weight for _, weight in components]
+        return self.rng.choices(values, weights)[0]
     
     def insert_component(conn, culture, gender, component_type, value, 
                         weight=1, is_required=0):
@@ -146,13 +233,7 @@ class NameGenerator:
         
         try:
             for part in parts.keys():
-                required, optional = self.get_components(genero, part, cultura)
-                
-                if required:
-                    parts[part] = self.select_component(required)
-                
-                if optional and random.random() > 0.5:
-                    parts[part] = self.select_component(optional)
+                parts[part] = self._pick_component(genero, part, cultura)
         
         except Exception as e:
             print(f"Erro ao gerar nome base: {e}")
@@ -161,7 +242,7 @@ class NameGenerator:
                 'fem': ['Yennefer', 'Galadriel', 'Ciri', 'Guinevere'],
                 'neutro': ['Robin', 'Taylor', 'Alex', 'Jordan']
             }
-            return random.choice(fallback_names.get(genero, fallback_names['neutro']))
+            return self.rng.choice(fallback_names.get(genero, fallback_names['neutro']))
         
         name_parts = [parts['prefix'], parts['middle'], parts['suffix']]
         core_name = ' '.join(filter(None, name_parts))
@@ -170,20 +251,23 @@ class NameGenerator:
     def gerar_titulo(self, genero='masc', cultura='medieval'):
         """Gera apenas o título"""
         try:
-            required, optional = self.get_components(genero, 'title', cultura)
+            required, optional = self.get_component_table().samplers(
+                (genero,) + NAME_GENERATOR_GENDERS, 'title', cultura
+            )
             titulo = ""
+            rng = self.rng
             
             # Componente obrigatório
             if required:
-                titulo = self.select_component(required)
+                titulo = required.sample(rng)
             
             # Componente opcional (50% de chance)
-            if optional and random.random() > 0.5:
+            if optional and rng.random() > 0.5:
                 if titulo:
                     # Adiciona um segundo título
-                    titulo += " " + self.select_component(optional)
+                    titulo += " " + optional.sample(rng)
                 else:
-                    titulo = self.select_component(optional)
+                    titulo = optional.sample(rng)
             
             return titulo
         
@@ -198,8 +282,76 @@ class NameGenerator:
                 'japanese': ['o Samurai', 'o Honorável', 'o Sábio']
             }
             # Usar fallback específico para a cultura ou medieval como padrão
-            return random.choice(fallback_titles.get(cultura, fallback_titles['medieval']))
+            return self.rng.choice(fallback_titles.get(cultura, fallback_titles['medieval']))
     
+    def get_existing_character_names(self):
+        """Nomes já usados por personagens salvos (comparados sem diferenciar maiúsculas)"""
+        cursor = self.get_connection().cursor()
+        cursor.execute("SELECT name FROM characters")
+        return {row[0].casefold() for row in cursor.fetchall() if row[0]}
+
+    def generate_many(self, n, culture='medieval', gender='masc', unique=True,
+                      check_existing=True, max_failures=1000, rng=None):
+        """
+        Gera até n nomes base em lote (gerador preguiçoso, um nome por vez).
+
+        culture/gender None sorteiam a cultura/gênero de cada nome. Com unique=True
+        nenhum nome se repete, nem coincide com nomes de personagens salvos
+        (check_existing). Se max_failures sorteios seguidos só produzirem repetições,
+        a geração termina antes de n: as combinações daquela cultura se esgotaram.
+        rng (random.Random) substitui o fluxo aleatório do gerador neste lote.
+        """
+        table = self.get_component_table()
+        cultures = list(table.cultures) or ['medieval']
+        genders = ('masc', 'fem', 'neutro')
+        parts = ('prefix', 'middle', 'suffix')
+
+        seen = set()
+        if unique and check_existing:
+            seen = self.get_existing_character_names()
+
+        # Samplers resolvidos uma vez por (cultura, gênero) durante o lote
+        resolved = {}
+        rng = rng or self.rng
+        chance = rng.random
+        produced = 0
+        failures = 0
+
+        while produced < n and failures < max_failures:
+            active_culture = culture or rng.choice(cultures)
+            active_gender = gender or rng.choice(genders)
+            key = (active_culture, active_gender)
+            samplers = resolved.get(key)
+            if samplers is None:
+                samplers = [
+                    table.samplers((active_gender,) + NAME_GENERATOR_GENDERS, part, active_culture)
+                    for part in parts
+                ]
+                resolved[key] = samplers
+
+            name_parts = []
+            for required, optional in samplers:
+                value = required.sample(rng) if required else ""
+                if optional and chance() > 0.5:
+                    value = optional.sample(rng)
+                if value:
+                    name_parts.append(value)
+            name = ' '.join(' '.join(name_parts).split())
+
+            if not name:
+                failures += 1
+                continue
+            if unique:
+                folded = name.casefold()
+                if folded in seen:
+                    failures += 1
+                    continue
+                seen.add(folded)
+
+            failures = 0
+            produced += 1
+            yield name
+
     # Métodos de conveniência simplificados
     def gerar_nome(self, genero='masc', cultura='medieval'):
         return self.generate_name(genero, cultura)
@@ -213,54 +365,75 @@ class NameGenerator:
     def gerar_nome_neutro(self, cultura='medieval'):
         return self.generate_name('neutro', cultura)
     
+def write_names(names, destination):
+    """
+    Consome um iterável de nomes (ex.: generate_many) gravando-os à medida que chegam.
+    destination pode ser um caminho de arquivo, um arquivo aberto ou uma lista.
+    Retorna a quantidade de nomes gravados.
+    """
+    count = 0
+    if isinstance(destination, list):
+        for name in names:
+            destination.append(name)
+            count += 1
+        return count
+
+    if isinstance(destination, str):
+        with open(destination, 'w', encoding='utf-8') as f:
+            return write_names(names, f)
+
+    for name in names:
+        destination.write(name + "\n")
+        count += 1
+    return count
+
+
 class UniversalNameGenerator:
-    def __init__(self, db_path='rpg_data.db'):
+    def __init__(self, db_path=None, rng=None):
+        # Sem caminho explícito, usa a conexão compartilhada do jogo
         self.db_path = db_path
         self.conn = None
+        self._table = None
+        self._rng = rng
+
+    @property
+    def rng(self):
+        return self._rng or stream("names")
     
     def get_connection(self):
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
+            if self.db_path is None:
+                self.conn = get_shared_connection()
+            else:
+                self.conn = connect(self.db_path)
         return self.conn
     
     def close_connection(self):
         if self.conn:
-            self.conn.close()
+            if self.db_path is not None:
+                self.conn.close()
             self.conn = None
+
+    def get_component_table(self):
+        if self.db_path is None:
+            return get_name_component_table()
+        if self._table is None:
+            self._table = NameComponentTable.load(self.get_connection())
+        return self._table
     
     def get_components(self, gender, component_type):
-        """Busca componentes de TODAS as culturas"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        query = '''
-        SELECT value, weight, is_required 
-        FROM name_components 
-        WHERE gender = ? OR gender IS NULL
-          AND component_type = ?
-        '''
-        cursor.execute(query, (gender, component_type))
-        results = cursor.fetchall()
-        
-        required = []
-        optional = []
-        for value, weight, is_required in results:
-            if is_required:
-                required.append((value, weight))
-            else:
-                optional.append((value, weight))
-        
-        return required, optional
+        """Busca componentes de TODAS as culturas (do gênero pedido ou sem gênero)"""
+        return self.get_component_table().components(
+            (gender,) + UNIVERSAL_GENERATOR_GENDERS, component_type
+        )
     
     def select_component(self, components):
         if not components:
             return ""
         
-        weighted_list = []
-        for value, weight in components:
-            weighted_list.extend([value] * weight)
-        
-        return random.choice(weighted_list)
+        values = [value for value, _ in components]
+        weights = [weight for _, weight in components]
+        return self.rng.choices(values, weights)[0]
     
     def generate_name(self, gender='masc'):
         parts = {
@@ -270,19 +443,21 @@ class UniversalNameGenerator:
             'title': ""
         }
         
+        rng = self.rng
         try:
+            table = self.get_component_table()
             for part in parts.keys():
-                required, optional = self.get_components(gender, part)
+                required, optional = table.samplers((gender,) + UNIVERSAL_GENERATOR_GENDERS, part)
                 
                 if required:
-                    parts[part] = self.select_component(required)
+                    parts[part] = required.sample(rng)
                 
-                if optional and random.random() > 0.5:
-                    parts[part] = self.select_component(optional)
+                if optional and rng.random() > 0.5:
+                    parts[part] = optional.sample(rng)
         
         except Exception as e:
             print(f"Erro ao gerar nome: {e}")
-            return f"{gender.capitalize()}_{random.randint(1, 100)}"
+            return f"{gender.capitalize()}_{rng.randint(1, 100)}"
         
         finally:
             self.close_connection()
@@ -291,7 +466,7 @@ class UniversalNameGenerator:
         name_parts = [parts['prefix'], parts['middle'], parts['suffix']]
         core_name = ' '.join(filter(None, name_parts))
         
-        if parts['title'] and random.random() > 0.3:  # 70% de chance de título
+        if parts['title'] and rng.random() > 0.3:  # 70% de chance de título
             return f"{core_name} {parts['title']}"
         return core_name
     
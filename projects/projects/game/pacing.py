@@ -0,0 +1,119 @@
+# game/pacing.py
+"""
+Ritmo do jogo: todas as pausas dramáticas passam por pause() em vez de
+time.sleep().
+
+O modo vem de GAME_SETTINGS["pacing"]:
+- "realtime": pausas com a duração original;
+- "fast": pausas encurtadas (PACING_MODES["fast"] da duração);
+- "zero": sem pausas (bots e testes).
+
+Com um driver de entrada headless (game/input_driver.py) as pausas são
+sempre ignoradas. No terminal, qualquer tecla encerra a pausa na hora; a
+tecla é descartada.
+"""
+import os
+import sys
+import time
+
+from . import config
+from .input_driver import get_input_driver
+
+# Modo -> fração da duração original de cada pausa
+PACING_MODES = {
+    "realtime": 1.0,
+    "fast": 0.25,
+    "zero": 0.0,
+}
+
+PACING_LABELS = {
+    "realtime": "Normal",
+    "fast": "Rápido",
+    "zero": "Sem pausas",
+}
+
+DEFAULT_PACING = "realtime"
+
+# Intervalo entre as verificações de tecla no console do Windows
+_KEY_POLL_INTERVAL = 0.02
+
+
+def get_pacing_mode():
+    """Modo atual (valores desconhecidos nas configurações valem como o padrão)."""
+    mode = config.GAME_SETTINGS.get("pacing", config.DEFAULT_SETTINGS.get("pacing"))
+    return mode if mode in PACING_MODES else DEFAULT_PACING
+
+
+def set_pacing_mode(mode):
+    """Troca o modo e grava nas configurações."""
+    if mode not in PACING_MODES:
+        raise ValueError(f"Modo de ritmo desconhecido: {mode}")
+    config.update_setting("pacing", mode)
+
+
+def next_pacing_mode():
+    """Passa para o próximo modo da lista (usado pelo menu de configurações)."""
+    modes = list(PACING_MODES)
+    mode = modes[(modes.index(get_pacing_mode()) + 1) % len(modes)]
+    set_pacing_mode(mode)
+    return mode
+
+
+def scaled(seconds):
+    """Duração efetiva de uma pausa de seconds no modo atual."""
+    if get_input_driver().headless:
+        return 0.0
+    return seconds * PACING_MODES[get_pacing_mode()]
+
+
+def pause(seconds, skippable=True):
+    """Pausa de leitura; com skippable, qualquer tecla a encerra antes do fim."""
+    duration = scaled(seconds)
+    if duration <= 0:
+        return
+    if skippable and _wait_for_key(duration) is not None:
+        return
+    time.sleep(duration)
+
+
+def _wait_for_key(timeout):
+    """
+    Espera até timeout segundos ou até uma tecla ser pressionada.
+    Retorna True/False (tecla ou não), ou None se o terminal não permite
+    ler teclas sem Enter; nesse caso quem chama faz a pausa inteira.
+    """
+    if os.name == "nt":
+        try:
+            import msvcrt
+        except ImportError:
+            return None
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return True
+            time.sleep(_KEY_POLL_INTERVAL)
+        return False
+
+    try:
+        import select
+        import termios
+        import tty
+    except ImportError:
+        return None
+    try:
+        fd = sys.stdin.fileno()
+        if not os.isatty(fd):
+            return None
+        previous = termios.tcgetattr(fd)
+    except (AttributeError, ValueError, OSError, termios.error):
+        return None
+
+    try:
+        tty.setcbreak(fd)  # Lê a tecla sem esperar o Enter
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if ready:
+            os.read(fd, 1024)
+        return bool(ready)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, previous)
@@ -0,0 +1,178 @@
+# game/reference_data.py
+"""
+Cache em memória dos dados estáticos do jogo (classes, raças, itens, perícias
+e antecedentes).
+
+Esses dados só mudam quando o banco é populado novamente por
+data/populate_db.py, então são carregados uma única vez por processo e
+servidos a partir de dicionários indexados por id e por nome. Quem repopular o
+banco deve chamar invalidate_reference_data() para que a próxima consulta
+recarregue tudo.
+"""
+import copy
+
+from game.connection import get_shared_connection
+
+CLASS_QUERY = '''
+SELECT
+    c.id, c.name, c.hit_dice, c.mana_dice, c.base_ac, c.description,
+    w.id AS weapon_id, w.name AS weapon_name, w.damage_dice, w.main_attribute, w.weapon_type,
+    a.id AS armor_id, a.name AS armor_name,
+    a.physical_resistance,
+    a.magical_resistance,
+    a.dexterity_penalty,
+    a.armor_class
+FROM classes c
+LEFT JOIN items w ON c.starting_weapon_id = w.id
+LEFT JOIN items a ON c.starting_armor_id = a.id
+ORDER BY c.id
+'''
+
+_reference_data = None
+_invalidation_hooks = []
+
+
+def _class_row_to_dict(row):
+    """Converte uma linha da consulta de classes (com arma e armadura iniciais) em dicionário."""
+    return {
+        'id': row[0],
+        'name': row[1],
+        'hit_dice': row[2],
+        'mana_dice': row[3],
+        'base_ac': row[4],
+        'description': row[5],
+        'starting_weapon': {
+            'id': row[6],
+            'name': row[7],
+            'damage_dice': row[8],
+            'main_attribute': row[9],
+            'weapon_type': row[10]
+        } if row[6] else None,
+        'starting_armor': {
+            'id': row[11],
+            'name': row[12],
+            'physical_resistance': row[13],
+            'magical_resistance': row[14],
+            'dexterity_penalty': row[15],
+            'armor_class': row[16]
+        } if row[11] else None
+    }
+
+
+def _fetch_table(cursor, table):
+    """Lê uma tabela inteira como lista de dicionários, na ordem dos ids."""
+    cursor.execute(f"SELECT * FROM {table} ORDER BY id")
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _index_by(rows, key):
+    """Indexa linhas por uma coluna, mantendo a primeira ocorrência (como um fetchone)."""
+    index = {}
+    for row in rows:
+        index.setdefault(row[key], row)
+    return index
+
+
+class ReferenceData:
+    """Fotografia imutável dos dados de referência, indexada por id e por nome."""
+
+    def __init__(self, conn):
+        cursor = conn.cursor()
+
+        self.races = _fetch_table(cursor, "races")
+        self.class_rows = _fetch_table(cursor, "classes")
+        self.items = _fetch_table(cursor, "items")
+        self.skills = _fetch_table(cursor, "skills")
+        self.backgrounds = _fetch_table(cursor, "backgrounds")
+
+        cursor.execute(CLASS_QUERY)
+        self.classes = [_class_row_to_dict(row) for row in cursor.fetchall()]
+
+        self.races_by_id = _index_by(self.races, 'id')
+        self.races_by_name = _index_by(self.races, 'name')
+        self.classes_by_id = _index_by(self.classes, 'id')
+        self.classes_by_name = _index_by(self.classes, 'name')
+        self.class_rows_by_name = _index_by(self.class_rows, 'name')
+        self.items_by_id = _index_by(self.items, 'id')
+        self.items_by_name = _index_by(self.items, 'name')
+        self.skills_by_id = _index_by(self.skills, 'id')
+        self.skills_by_name = _index_by(self.skills, 'name')
+        self.backgrounds_by_id = _index_by(self.backgrounds, 'id')
+        self.backgrounds_by_name = _index_by(self.backgrounds, 'name')
+
+    # Os métodos abaixo devolvem cópias: vários chamadores alteram os
+    # dicionários recebidos (ex.: a loja grava 'buy_price' no item).
+    def get_class(self, name):
+        class_data = self.classes_by_name.get(name)
+        return copy.deepcopy(class_data) if class_data else None
+
+    def get_race(self, name):
+        race = self.races_by_name.get(name)
+        return dict(race) if race else None
+
+    def get_item(self, item_id):
+        item = self.items_by_id.get(item_id)
+        return dict(item) if item else None
+
+    def get_skill_by_id(self, skill_id):
+        skill = self.skills_by_id.get(skill_id)
+        return dict(skill) if skill else None
+
+    def get_skill_by_name(self, name):
+        skill = self.skills_by_name.get(name)
+        return dict(skill) if skill else None
+
+    def get_background(self, name):
+        background = self.backgrounds_by_name.get(name)
+        return dict(background) if background else None
+
+    def all_classes(self):
+        return copy.deepcopy(self.classes)
+
+    def all_class_rows(self):
+        return [dict(row) for row in self.class_rows]
+
+    def all_races(self):
+        return [dict(row) for row in self.races]
+
+    def all_skills(self):
+        return [dict(row) for row in self.skills]
+
+    def all_backgrounds(self):
+        return [dict(row) for row in self.backgrounds]
+
+
+def load_reference_data(conn):
+    """Carrega (ou recarrega) os dados de referência a partir da conexão informada."""
+    global _reference_data
+    _reference_data = ReferenceData(conn)
+    return _reference_data
+
+
+def get_reference_data(conn=None):
+    """
+    Retorna o cache de dados de referência, carregando-o na primeira chamada.
+    Sem conexão, usa a conexão compartilhada do jogo.
+    """
+    if _reference_data is not None:
+        return _reference_data
+
+    return load_reference_data(conn or get_shared_connection())
+
+
+def register_invalidation_hook(hook):
+    """Registra uma função chamada sempre que o cache de referência é invalidado."""
+    if hook not in _invalidation_hooks:
+        _invalidation_hooks.append(hook)
+
+
+def invalidate_reference_data():
+    """
+    Descarta o cache de dados de referência (e os caches derivados registrados).
+    Deve ser chamado depois de repopular o banco.
+    """
+    global _reference_data
+    _reference_data = None
+    for hook in _invalidation_hooks:
+        hook()
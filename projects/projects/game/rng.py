@@ -0,0 +1,103 @@
+# game/rng.py
+"""
+Serviço de números aleatórios do jogo.
+
+Nenhum módulo usa o estado global de 'random': cada subsistema pede o seu
+fluxo (stream) ao serviço ativo. Todos os fluxos derivam da semente da
+sessão, mas são independentes entre si: uma rolagem a mais no combate não
+muda o saque, os nomes ou os encontros seguintes.
+
+Fluxos:
+- "combat": ataques, dano e fuga;
+- "loot": itens encontrados e perdidos;
+- "names": geradores de nomes;
+- "encounters": sorteio de monstros, tamanho dos bandos e chance de encontro;
+- "character": atributos e ganhos de nível;
+- "world": o resto (descanso, eventos fora do combate).
+
+A mesma semente reproduz a sessão inteira (dadas as mesmas teclas), o que
+permite repetir um relatório de bug e comparar otimizações do motor com os
+mesmos números aleatórios. snapshot()/restore() guardam e voltam o estado
+de todos os fluxos.
+
+Uso:
+    from game.rng import stream
+    roll = stream("combat").randint(1, 20)
+"""
+import random
+
+STREAMS = ("combat", "loot", "names", "encounters", "character", "world")
+
+# Fluxo usado por quem não diz qual quer (ex.: roll_dice sem rng)
+DEFAULT_STREAM = "world"
+
+
+def _stream_seed(seed, name):
+    # Semente textual: determinística entre processos (não depende de hash())
+    return f"{seed}:{name}"
+
+
+class RandomService:
+    """
+    Semente da sessão e um random.Random por fluxo, criados sob demanda.
+    reseed() e restore() alteram os fluxos no lugar, então quem guardou a
+    referência de um fluxo (ex.: CombatEngine.rng) continua em sincronia.
+    """
+
+    def __init__(self, seed=None):
+        self._streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Começa uma sessão nova; sem semente, sorteia uma (e a guarda em self.seed)."""
+        self.seed = random.SystemRandom().randrange(2 ** 63) if seed is None else seed
+        for name, rng in self._streams.items():
+            rng.seed(_stream_seed(self.seed, name))
+
+    def stream(self, name):
+        """O random.Random do fluxo name."""
+        rng = self._streams.get(name)
+        if rng is None:
+            if name not in STREAMS:
+                raise ValueError(f"Fluxo aleatório desconhecido: {name}")
+            rng = self._streams[name] = random.Random(_stream_seed(self.seed, name))
+        return rng
+
+    def snapshot(self):
+        """Estado de todos os fluxos já usados (fluxos ainda não usados recomeçam da semente)."""
+        return {
+            'seed': self.seed,
+            'streams': {name: rng.getstate() for name, rng in self._streams.items()},
+        }
+
+    def restore(self, snapshot):
+        """Volta ao estado de um snapshot()."""
+        self.reseed(snapshot['seed'])
+        for name, state in snapshot['streams'].items():
+            self.stream(name).setstate(state)
+
+
+_service = RandomService()
+
+
+def get_rng_service():
+    return _service
+
+
+def set_rng_service(service):
+    """Troca o serviço ativo e retorna o anterior."""
+    global _service
+    previous = _service
+    _service = service or RandomService()
+    return previous
+
+
+def new_session(seed=None):
+    """Reinicia o serviço ativo com a semente da sessão; retorna a semente usada."""
+    _service.reseed(seed)
+    return _service.seed
+
+
+def stream(name=DEFAULT_STREAM):
+    """Atalho para get_rng_service().stream(name)."""
+    return _service.stream(name)
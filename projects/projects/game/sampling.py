@@ -0,0 +1,61 @@
+# game/sampling.py
+"""
+Amostragem ponderada em O(1) pelo método de alias de Walker (variante de Vose).
+
+A tabela é montada uma vez a partir dos pesos; cada sorteio custa um número
+aleatório inteiro e um real, sem alocar listas.
+"""
+import random
+
+
+class AliasTable:
+    """Sorteia itens proporcionalmente aos pesos informados."""
+
+    __slots__ = ('items', '_probability', '_alias', '_size')
+
+    def __init__(self, items, weights):
+        items = tuple(items)
+        weights = [float(w) for w in weights]
+        if not items or len(items) != len(weights):
+            raise ValueError("AliasTable precisa de itens e pesos em mesma quantidade")
+        total = sum(weights)
+        if total <= 0 or any(w < 0 for w in weights):
+            raise ValueError("Os pesos devem ser não negativos e somar mais que zero")
+
+        size = len(items)
+        scaled = [w * size / total for w in weights]
+        probability = [0.0] * size
+        alias = [0] * size
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            probability[low] = scaled[low]
+            alias[low] = high
+            scaled[high] = (scaled[high] + scaled[low]) - 1.0
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+
+        # Sobras (por arredondamento) ficam com probabilidade 1
+        for index in large + small:
+            probability[index] = 1.0
+
+        self.items = items
+        self._probability = probability
+        self._alias = alias
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def sample(self, rng=None):
+        """Sorteia um item."""
+        rng = rng or random
+        column = rng.randrange(self._size)
+        if rng.random() < self._probability[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
@@ -0,0 +1,165 @@
+# game/screen.py
+"""
+Saída de tela por quadros, sem chamar 'clear' em um subprocesso.
+
+Um estado com frame_render = True tem tudo o que imprime no render()
+capturado como um quadro (lista de linhas). O Screen compara o quadro com o
+anterior e reescreve só as linhas que mudaram, posicionando o cursor com
+códigos ANSI, em um único sys.stdout.write. Quando a comparação não é
+confiável (primeiro quadro, terminal redimensionado, linhas que quebram ou
+saída demais entre quadros, que faz o terminal rolar) o quadro é redesenhado
+inteiro.
+
+clear_screen() substitui os.system('cls'/'clear'): fora de um quadro limpa o
+terminal com ANSI; dentro de um quadro apenas descarta o que já foi capturado.
+"""
+import io
+import os
+import re
+import shutil
+import sys
+import unicodedata
+from contextlib import contextmanager, redirect_stdout
+
+CLEAR = "\033[H\033[2J"
+CLEAR_LINE_END = "\033[K"
+CLEAR_BELOW = "\033[J"
+
+# Sequências ANSI (cores, cursor) não ocupam colunas na tela
+ANSI_PATTERN = re.compile(r"\033\[[0-9;?]*[A-Za-z]")
+
+_screen = None
+
+
+def display_width(line):
+    """Colunas ocupadas por uma linha (emojis e ideogramas ocupam duas)."""
+    width = 0
+    for char in ANSI_PATTERN.sub("", line):
+        if unicodedata.combining(char) or char in "\u200d\ufe0f":
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+class _OutputCounter:
+    """Repassa a escrita ao stream original contando as linhas impressas fora dos quadros."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.newlines = 0
+
+    def write(self, text):
+        self.newlines += text.count("\n")
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class Screen:
+    """Renderizador por diferença de quadros."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.interactive = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.previous = None  # Linhas do último quadro na tela (None = redesenhar tudo)
+        self.previous_size = None
+        self._capture = None
+        self._counter = None
+        if self.interactive and os.name == "nt":
+            os.system("")  # Ativa o processamento de ANSI no console do Windows (uma única vez)
+
+    def install(self):
+        """Passa a contar o que é impresso entre quadros (para detectar rolagem)."""
+        if self._counter is None and sys.stdout is self.stream:
+            self._counter = _OutputCounter(self.stream)
+            sys.stdout = self._counter
+        return self
+
+    def invalidate(self):
+        """Faz o próximo quadro ser desenhado por inteiro."""
+        self.previous = None
+
+    def redraw(self):
+        """Reapresenta o último quadro sem chamar render() de novo."""
+        if self.previous is not None:
+            self.present(self.previous)
+
+    def clear(self):
+        if self._capture is not None:
+            # Dentro de um quadro: recomeça a captura
+            self._capture.seek(0)
+            self._capture.truncate()
+            return
+        if self.interactive:
+            self.stream.write(CLEAR)
+            self.stream.flush()
+        self.invalidate()
+
+    @contextmanager
+    def frame(self):
+        """Captura o que for impresso no bloco e apresenta como um quadro."""
+        if self._capture is not None:
+            # Quadro aninhado: a saída já está sendo capturada pelo de fora
+            yield
+            return
+        self._capture = io.StringIO()
+        try:
+            with redirect_stdout(self._capture):
+                yield
+        finally:
+            text = self._capture.getvalue()
+            self._capture = None
+            self.present(text.split("\n")[:-1] if text.endswith("\n") else text.split("\n"))
+
+    def present(self, lines):
+        """Escreve o quadro (lista de linhas), reescrevendo só as linhas alteradas."""
+        lines = [line.rstrip("\r") for line in lines]
+        if not self.interactive:
+            self.stream.write("".join(line + "\n" for line in lines))
+            self.stream.flush()
+            return
+
+        size = shutil.get_terminal_size()
+        if self._needs_full_redraw(lines, size):
+            output = CLEAR + "".join(line + "\n" for line in lines)
+        else:
+            previous = self.previous
+            parts = [
+                f"\033[{row};1H{line}{CLEAR_LINE_END}"
+                for row, line in enumerate(lines, 1)
+                if row > len(previous) or previous[row - 1] != line
+            ]
+            # Apaga o resto do quadro anterior e o que foi impresso abaixo dele
+            parts.append(f"\033[{len(lines) + 1};1H{CLEAR_BELOW}")
+            output = "".join(parts)
+
+        self.stream.write(output)
+        self.stream.flush()
+        self.previous = lines
+        self.previous_size = size
+        if self._counter is not None:
+            self._counter.newlines = 0
+
+    def _needs_full_redraw(self, lines, size):
+        if self.previous is None or size != self.previous_size:
+            return True
+        if any(display_width(line) >= size.columns for line in lines):
+            return True  # Linhas que quebram deslocam as posições das seguintes
+        # Se o quadro anterior mais o que veio depois (prompt, mensagens, a linha
+        # do Enter) passou da altura do terminal, a tela rolou
+        printed_after = (self._counter.newlines if self._counter is not None else 0) + 1
+        return max(len(self.previous), len(lines)) + printed_after >= size.lines
+
+
+def get_screen():
+    """Screen compartilhado do jogo (escreve no stdout do processo)."""
+    global _screen
+    if _screen is None:
+        _screen = Screen()
+    return _screen
+
+
+def clear_screen():
+    """Substitui os.system('cls'/'clear') sem criar um subprocesso."""
+    get_screen().clear()
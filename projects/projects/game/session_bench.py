@@ -0,0 +1,236 @@
+# game/session_bench.py
+"""
+Benchmark de ponta a ponta: joga uma sessão inteira sem terminal.
+
+O Game roda com um PolicyInput e um banco em memória copiado do modelo
+(db_template.open_memory_database), com as pausas desativadas e a saída do
+jogo descartada. A sessão padrão cria um personagem, explora, luta, descansa,
+vai à cidade (loja e estalagem), salva, volta ao menu, carrega o save e sai.
+
+As teclas vêm de um roteiro (DEFAULT_SESSION); os prompts que dependem da
+sorte (turnos de combate, confirmações, telas de "Pressione Enter") são
+respondidos por AUTO_ANSWERS sem consumir o roteiro, então a mesma sessão
+continua válida quando os dados mudam o resultado das rolagens.
+
+Para cada tecla são medidos o tempo de processamento até o próximo prompt e
+as consultas SQL executadas; para cada change/push/pop_state, o tempo e as
+consultas da transição.
+
+Uso:
+    python -m game.session_bench --seed 2 --repeat 5
+    python -m game.session_bench --script roteiro.txt   # uma tecla por linha
+"""
+import argparse
+import io
+import re
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+
+from .db_template import open_memory_database
+from .input_driver import PolicyInput, set_input_driver
+
+# (fase, teclas) na ordem em que são digitadas
+DEFAULT_SESSION = (
+    ("criação", ["2", "1", "1", "1", "", "1", "1", "2", "1", "1", "1", "1", ""]),
+    ("exploração", ["1", "1", "1"]),
+    ("personagem", ["4", "d", "d", "", "5", "4"]),
+    ("descanso", ["2"]),
+    ("viagem", ["3", "2"]),
+    ("loja", ["1", "1", "1", "0", "3"]),
+    ("estalagem", ["8", "1", "3"]),
+    ("volta", ["12"]),
+    ("salvar", ["6", "3", "4"]),
+    ("carregar", ["3", "1", "1"]),
+    ("saída", ["6", "4", "7"]),
+)
+
+# (estado ou None para qualquer um, padrão do prompt, resposta)
+AUTO_ANSWERS = (
+    ("CombatState", r"Atacar", "1"),
+    ("CombatState", r"", ""),           # Telas de resultado do combate
+    ("InnState", r"^$", "s"),            # Confirmação da estalagem (sem prompt)
+    (None, r"\(s/n\)", "s"),
+    (None, r"Quantos deseja vender", "1"),
+    (None, r"(?i)pressione enter", ""),
+)
+
+
+def session_keys(session=DEFAULT_SESSION):
+    return [key for _, keys in session for key in keys]
+
+
+class SessionPolicy:
+    """Política do PolicyInput: respostas automáticas primeiro, depois o roteiro."""
+
+    def __init__(self, keys, auto_answers=AUTO_ANSWERS):
+        self.keys = list(keys)
+        self.position = 0
+        self.auto_answers = [(state, re.compile(pattern), answer)
+                             for state, pattern, answer in auto_answers]
+
+    @property
+    def remaining(self):
+        return len(self.keys) - self.position
+
+    def __call__(self, prompt, game):
+        state = type(game.current_state()).__name__ if game and game.current_state() else None
+        for state_name, pattern, answer in self.auto_answers:
+            if state_name in (None, state) and pattern.search(prompt):
+                return answer
+        if self.position >= len(self.keys):
+            return None
+        key = self.keys[self.position]
+        self.position += 1
+        return key
+
+
+class SessionRecorder(PolicyInput):
+    """
+    PolicyInput que mede o trabalho feito entre uma leitura e a seguinte
+    (passos) e dentro de cada troca de estado do Game (transições).
+    """
+
+    def __init__(self, policy, game, conn, echo=False):
+        super().__init__(policy, game, echo=echo)
+        self.step_times = []        # (estado, tecla, segundos, consultas)
+        self.transition_times = []  # (tipo, de, para, segundos, consultas)
+        self.queries = 0
+        self._pending = None
+        self._transition_depth = 0  # change_state chama push_state: mede só a externa
+        conn.set_trace_callback(self._count_query)
+        for kind in ("change_state", "push_state", "pop_state"):
+            setattr(game, kind, self._timed_transition(kind, getattr(game, kind)))
+
+    def _count_query(self, statement):
+        self.queries += 1
+
+    def _state_name(self):
+        state = self.game.current_state()
+        return type(state).__name__ if state else "-"
+
+    def _timed_transition(self, kind, method):
+        def timed(*args):
+            source = self._state_name()
+            queries = self.queries
+            started = time.perf_counter()
+            self._transition_depth += 1
+            try:
+                method(*args)
+            finally:
+                self._transition_depth -= 1
+            if not self._transition_depth:
+                self.transition_times.append((kind, source, self._state_name(),
+                                              time.perf_counter() - started, self.queries - queries))
+        return timed
+
+    def _close_step(self):
+        if self._pending is not None:
+            state, key, started, queries = self._pending
+            self.step_times.append((state, key, time.perf_counter() - started, self.queries - queries))
+            self._pending = None
+
+    def read(self, prompt=""):
+        self._close_step()
+        key = super().read(prompt)
+        self._pending = (self._state_name(), key, time.perf_counter(), self.queries)
+        return key
+
+
+def run_session(keys=None, seed=2, game_output=None):
+    """
+    Joga uma sessão e retorna (recorder, teclas do roteiro não usadas, segundos totais).
+    game_output recebe o que o jogo imprime (padrão: descartado).
+    """
+    from main import Game
+
+    conn = open_memory_database()
+    policy = SessionPolicy(session_keys() if keys is None else keys)
+    output = game_output or io.StringIO()
+    with redirect_stdout(output):
+        game = Game(db_conn=conn, seed=seed)
+        recorder = SessionRecorder(policy, game, conn, echo=game_output is not None)
+        previous = set_input_driver(recorder)
+        started = time.perf_counter()
+        try:
+            game.run()
+        finally:
+            recorder._close_step()
+            set_input_driver(previous)
+    return recorder, policy.remaining, time.perf_counter() - started
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples):
+    """{chave: lista de (segundos, consultas)} -> linhas do relatório, mais lentas primeiro."""
+    rows = []
+    for key, values in samples.items():
+        times = [seconds * 1000 for seconds, _ in values]
+        queries = [count for _, count in values]
+        rows.append((key, len(values), statistics.mean(times), _percentile(times, 0.95),
+                     max(times), statistics.mean(queries), max(queries)))
+    rows.sort(key=lambda row: row[2] * row[1], reverse=True)
+    return rows
+
+
+def print_report(recorders, totals):
+    steps = {}
+    transitions = {}
+    for recorder in recorders:
+        for state, _, seconds, queries in recorder.step_times:
+            steps.setdefault(state, []).append((seconds, queries))
+        for kind, source, target, seconds, queries in recorder.transition_times:
+            transitions.setdefault(f"{kind} {source} -> {target}", []).append((seconds, queries))
+
+    header = f"{'n':>5} {'média ms':>9} {'p95 ms':>8} {'máx ms':>8} {'consultas':>9} {'máx':>5}"
+    for title, samples in (("Passos (por estado que leu a tecla)", steps),
+                           ("Transições de estado", transitions)):
+        rows = summarize(samples)
+        width = max([len(title)] + [len(row[0]) for row in rows])
+        print(f"\n{title:<{width}} {header}")
+        print("-" * (width + len(header) + 1))
+        for key, count, mean, p95, peak, mean_queries, max_queries in rows:
+            print(f"{key:<{width}} {count:>5} {mean:>9.3f} {p95:>8.3f} {peak:>8.3f} "
+                  f"{mean_queries:>9.1f} {max_queries:>5}")
+
+    total_queries = sum(recorder.queries for recorder in recorders)
+    total_steps = sum(len(recorder.step_times) for recorder in recorders)
+    print(f"\n{len(recorders)} sessão(ões), {total_steps} teclas, {total_queries} consultas, "
+          f"{statistics.mean(totals) * 1000:.1f} ms por sessão (mín {min(totals) * 1000:.1f} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de uma sessão completa do jogo, sem terminal.")
+    parser.add_argument("--script", help="Arquivo com uma tecla por linha (padrão: sessão embutida)")
+    parser.add_argument("--seed", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3, help="Quantas vezes repetir a sessão")
+    parser.add_argument("--show-output", action="store_true", help="Mostra a saída do jogo da primeira sessão")
+    args = parser.parse_args(argv)
+
+    keys = None
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            keys = f.read().splitlines()
+
+    recorders = []
+    totals = []
+    for run in range(args.repeat):
+        show = args.show_output and run == 0
+        recorder, remaining, total = run_session(keys, args.seed,
+                                                 game_output=sys.stdout if show else None)
+        if remaining:
+            print(f"Aviso: a sessão {run + 1} terminou com {remaining} tecla(s) do roteiro sem uso.")
+        recorders.append(recorder)
+        totals.append(total)
+
+    print_report(recorders, totals)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,30 @@
-import random
-import re
-import os
 import json
-import time
 from .config import GAME_SETTINGS, DEFAULT_SETTINGS, SETTINGS_FILE, save_settings # Importa diretamente
-
-def roll_dice(dice_str):
-    """Rola dados no formato 'XdY+Z'"""
-    match = re.match(r"(\d+)d(\d+)([+-]\d+)?", dice_str)
-    if not match:
+from .dice import compile_dice
+from .screen import clear_screen
+from .input_driver import read_input
+from .pacing import pause
+from .rng import stream
+
+def roll_dice(dice_str, rng=None):
+    """
+    Rola dados no formato 'XdY+Z', incluindo vários termos como '1d8+1d2'.
+    Sem rng, usa o fluxo padrão do serviço de números aleatórios (game/rng.py).
+    """
+    try:
+        expression = compile_dice(dice_str)
+    except ValueError:
         print(f"[WARN] Formato de dado inválido: {dice_str}. Retornando 0.")
         return 0
-        
-    num = int(match.group(1))
-    sides = int(match.group(2))
-    modifier = int(match.group(3)) if match.group(3) else 0
-    
-    total = sum(random.randint(1, sides) for _ in range(num)) + modifier
-    return total
+    return expression.roll(rng or stream())
 
-def roll_d6():
+def roll_d6(rng=None):
     """Rola um dado de 6 faces"""
-    return random.randint(1, 6)
+    return (rng or stream("character")).randint(1, 6)
 
-def roll_attribute():
+def roll_attribute(rng=None):
     """Rola um atributo usando o sistema 4d6 (descarta o menor)"""
-    rolls = [roll_d6() for _ in range(4)]
+    rolls = [roll_d6(rng) for _ in range(4)]
     rolls.sort(reverse=True)
     return sum(rolls[:3])  # Soma os 3 maiores valores
 
@@ -35,16 +34,11 @@ def modifier(score):
 
 def roll_dice_max(dice_str):
     """Retorna o valor máximo possível para um dado"""
-    match = re.match(r"(\d+)d(\d+)([+-]\d+)?", dice_str)
-    if not match:
+    try:
+        return compile_dice(dice_str).max
+    except ValueError:
         print(f"[WARN] Formato de dado inválido para max: {dice_str}. Retornando 0.")
         return 0
-        
-    num = int(match.group(1))
-    sides = int(match.group(2))
-    modifier_val = int(match.group(3)) if match.group(3) else 0 # Renomeado para evitar conflito
-    
-    return (num * sides) + modifier_val
 
 def get_setting(key):
     """Obtém uma configuração do jogo"""
@@ -170,7 +164,7 @@ def show_settings():
     from .interface import print_centered_menu
     from .menus import main_menu
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
         # Obter velocidade atual
         current_speed = get_setting("text_speed")
@@ -188,12 +182,12 @@ def show_settings():
         
         print_centered_menu(menu_options, border_color=C_PINK)
         
-        choice = input(C_PROMPT + "\n✨ Escolha: " + Style.RESET_ALL).strip()
+        choice = read_input(C_PROMPT + "\n✨ Escolha: " + Style.RESET_ALL).strip()
         
         if choice == '1':
             # Submenu de velocidade
             while True:
-                os.system('cls' if os.name == 'nt' else 'clear')
+                clear_screen()
                 animate_text(C_TITLE + "\n⏩ VELOCIDADE DE TEXTO")
                 
                 speed_options = [
@@ -206,51 +200,51 @@ def show_settings():
                 
                 print_centered_menu(speed_options, border_color=C_MINT)
                 
-                speed_choice = input(C_PROMPT + "\n✨ Escolha: " + Style.RESET_ALL).strip()
+                speed_choice = read_input(C_PROMPT + "\n✨ Escolha: " + Style.RESET_ALL).strip()
                 
                 if speed_choice == "1":
                     update_setting("text_speed", 0.01)
                     animate_text(C_SUCCESS + "\n✅ Velocidade definida para RÁPIDO!")
-                    time.sleep(1)
+                    pause(1)
                     save_settings()
                 elif speed_choice == "2":
                     update_setting("text_speed", 0.03)
                     animate_text(C_SUCCESS + "\n✅ Velocidade definida para NORMAL!")
-                    time.sleep(1)
+                    pause(1)
                     save_settings()
                 elif speed_choice == "3":
                     update_setting("text_speed", 0.05)
                     animate_text(C_SUCCESS + "\n✅ Velocidade definida para LENTO!")
-                    time.sleep(1)
+                    pause(1)
                     save_settings()
                 elif speed_choice == "4":
                     try:
-                        new_speed = float(input(C_PROMPT + "Digite a nova velocidade (ex: 0.02): " + Style.RESET_ALL))
+                        new_speed = float(read_input(C_PROMPT + "Digite a nova velocidade (ex: 0.02): " + Style.RESET_ALL))
                         if new_speed > 0:
                             update_setting("text_speed", new_speed)
                             animate_text(C_SUCCESS + f"\n✅ Velocidade definida para {new_speed}s!")
                             save_settings()
                         else:
                             animate_text(C_WARN + "\n⚠️ A velocidade deve ser maior que 0!")
-                        time.sleep(1.5)
+                        pause(1.5)
                     except ValueError:
                         animate_text(C_WARN + "\n⚠️ Valor inválido! Use números (ex: 0.03).")
-                        time.sleep(1.5)
+                        pause(1.5)
                 # Dentro do while True do submenu de velocidade:
                 elif speed_choice == "5":
                     break  # Sai do submenu e volta ao menu principal
                 else:
                     animate_text(C_WARN + "\n⚠️ Opção inválida!")
-                    time.sleep(1)
+                    pause(1)
 
         elif choice == '2':
             # Implementar lógica real aqui
             animate_text(C_WARN + "\n⚠️ Funcionalidade em desenvolvimento!")
-            time.sleep(1)
+            pause(1)
         elif choice == '3':
             # Implementar lógica real aqui
             animate_text(C_WARN + "\n⚠️ Funcionalidade em desenvolvimento!")
-            time.sleep(1)
+            pause(1)
         elif choice == '4':
             return  # Sai completamente do menu de configurações
 
@@ -427,7 +421,7 @@ Nível  XP necessário
     current_index = 0
     
     while True:
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         section = sections[current_index]
         
         # Título animado
@@ -463,7 +457,7 @@ Nível  XP necessário
         
         print("\n" + nav_str)
         
-        choice = input(C_PROMPT + "\n🌸 Escolha: " + Style.RESET_ALL).strip()
+        choice = read_input(C_PROMPT + "\n🌸 Escolha: " + Style.RESET_ALL).strip()
         
         if choice == "1" and current_index > 0:
             current_index -= 1
@@ -473,5 +467,5 @@ Nível  XP necessário
             return
         else:
             animate_text(C_WARN + "⚠️ Opção inválida! Tente novamente." + Style.RESET_ALL, delay=0.03)
-            time.sleep(1.5)
+            pause(1.5)
 '''
\ No newline at end of file
@@ -1,6 +1,15 @@
 from states.system.main_menu_state import MainMenuState
 from game.config import load_settings, get_db_path
-import sqlite3
+from game.connection import get_shared_connection, close_shared_connection, set_shared_connection
+from game.reference_data import load_reference_data
+from game.monster_index import load_monster_index
+from game.database import flush_pending_saves, flush_if_due
+from game.migrations import migrate
+from game.db_template import clone_database
+from game.screen import get_screen
+from game.input_driver import ScriptExhausted, set_input_driver
+from game.rng import new_session
+import argparse
 import os
 import sys
 
@@ -9,16 +18,26 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(BASE_DIR)
 
 class Game:
-    def __init__(self):
+    def __init__(self, db_conn=None, input_driver=None, seed=None):
+        """
+        db_conn: conexão já aberta a usar no lugar do banco do jogo (ex.: um banco em memória).
+        input_driver: fonte das teclas (padrão: teclado); veja game/input_driver.py.
+        seed: semente da sessão (padrão: sorteada); veja game/rng.py.
+        """
+        self.seed = new_session(seed)
         self.running = True
         self.states = []  # Pilha de estados
         self.player = None
-        self.db_conn = None
-        self.needs_render = True 
-        print(f"Usando banco de dados em: {get_db_path()}")
+        self.db_conn = db_conn
+        self.screen = get_screen()
+        if input_driver is not None:
+            set_input_driver(input_driver)
+        if db_conn is None:
+            print(f"Usando banco de dados em: {get_db_path()}")
 
     def change_state(self, new_state):
         """Substitui toda a pilha por um novo estado"""
+        flush_pending_saves()  # Transições de estado são pontos seguros para gravar
         while self.states:
             state = self.states.pop()
             state.exit()
@@ -26,18 +45,22 @@ class Game:
 
     def push_state(self, state):
         """Adiciona um novo estado à pilha"""
+        flush_pending_saves()
         if self.states:
             self.states[-1].exit()
         self.states.append(state)
         state.enter()
+        state.invalidate()
 
     def pop_state(self):
         """Remove o estado atual da pilha"""
+        flush_pending_saves()
         if self.states:
             state = self.states.pop()
             state.exit()
         if self.states:
             self.states[-1].enter()
+            self.states[-1].invalidate()  # Os dados podem ter mudado enquanto estava coberto
 
     def current_state(self):
         """Retorna o estado atual"""
@@ -50,7 +73,15 @@ class Game:
             
             # Configurações e conexão
             load_settings()
-            self.db_conn = sqlite3.connect(get_db_path())
+            self.screen.install()
+            if self.db_conn is not None:
+                set_shared_connection(self.db_conn)
+            elif not os.path.exists(get_db_path()):
+                clone_database(get_db_path())  # Mundo novo: copia o banco modelo já populado
+            self.db_conn = get_shared_connection()
+            migrate(self.db_conn)  # Atualiza o esquema sem apagar os saves
+            load_reference_data(self.db_conn)  # Dados estáticos ficam em memória
+            load_monster_index(self.db_conn)
             
             # Estado inicial
             self.change_state(MainMenuState(self))
@@ -59,23 +90,46 @@ class Game:
             while self.running:
                 current_state = self.current_state()
                 if current_state:
-                    current_state.render()
+                    self._render(current_state)
                     current_state.handle_input()
+                flush_if_due()
 
         except KeyboardInterrupt:
             self.running = False
+            flush_pending_saves()
             print("\n\nObrigado por jogar! Até à sua próxima aventura!")
+        except ScriptExhausted:
+            # Sessão automatizada chegou ao fim do roteiro
+            self.running = False
         except Exception as e:
             print(f"Erro crítico: {e}")
+            print(f"Semente da sessão: {self.seed} (reproduza com: python main.py --seed {self.seed})")
             import traceback
             traceback.print_exc()
         finally:
             if self.db_conn:
-                self.db_conn.close()
+                flush_pending_saves()
+                close_shared_connection()
+                self.db_conn = None
     
+    def _render(self, state):
+        """Desenha o estado só se ele estiver marcado como sujo (ou redesenhar após toda entrada)."""
+        if state.needs_render or state.redraw_after_input:
+            state.needs_render = False  # Antes do render: o próprio render pode pedir outro quadro
+            if state.frame_render:
+                with self.screen.frame():
+                    state.render()
+            else:
+                state.render()
+        elif state.frame_render:
+            # Nada mudou: reapresenta o último quadro, apagando prompts e mensagens abaixo dele
+            self.screen.redraw()
+
     def quit(self):
         self.running = False
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Rust Dice")
+    parser.add_argument("--seed", type=int, help="Semente da sessão, para reproduzir uma partida")
+    game = Game(seed=parser.parse_args().seed)
     game.run()
\ No newline at end of file
@@ -1,5 +1,13 @@
 #game/states/base_states.py
+from game.screen import clear_screen
+
+
 class BaseState:
+    # Com frame_render = True, o que render() imprime vira um quadro de game.screen
+    frame_render = False
+    # Com redraw_after_input = False, render() só roda quando o estado pede (invalidate)
+    redraw_after_input = True
+
     def __init__(self, game, title="RUST DICE"):
         self.game = game
         self.title = title
@@ -12,10 +20,17 @@ class BaseState:
     def enter(self):
         """Executado ao entrar neste estado"""
         pass
+
+    def invalidate(self, model_changed=True):
+        """
+        Marca a tela para ser redesenhada no próximo ciclo. model_changed=False
+        indica que só a apresentação mudou (os dados exibidos continuam válidos).
+        """
+        self.needs_render = True
     
     def clear_screen(self):
         """Limpa a tela de forma cross-platform"""
-        print("\033[H\033[J", end="")  # Códigos ANSI para limpar tela
+        clear_screen()
     
     def display_title(self):
         pass
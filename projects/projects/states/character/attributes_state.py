@@ -2,6 +2,7 @@
 from ..base_state import BaseState
 from game.utils import modifier, get_display_name
 import os
+from game.input_driver import read_input
 
 class AttributesState(BaseState):
     def __init__(self, game):
@@ -48,7 +49,7 @@ class AttributesState(BaseState):
             self.tab_changed = False
 
     def handle_input(self):
-        choice = input().strip().lower()
+        choice = read_input().strip().lower()
         
         if choice == 'd':  # Próxima aba
             self.current_tab = (self.current_tab + 1) % len(self.tabs)
@@ -303,6 +304,8 @@ class AttributesState(BaseState):
                 'damage_dealt': 'Dano Causado',
                 'healing_received': 'Cura Recebida',
                 'attribute_reduction': 'Redução de Atributos',
+                'monster_hp_multiplier': 'Vida dos Monstros',
+                'pack_size_bonus': 'Monstros extras por bando',
                 'permadeath': 'Morte Permanente'
             }.get(key, key)
             
@@ -313,6 +316,8 @@ class AttributesState(BaseState):
                 effect = f"+{effect}" if value > 1 else effect
             elif key == 'attribute_reduction':
                 effect = f"-{value}"
+            elif key == 'pack_size_bonus':
+                effect = f"+{value}"
             elif key == 'permadeath':
                 effect = "✅ Ativo" if value else "❌ Inativo"
             else:
@@ -1,9 +1,12 @@
 from ..base_state import BaseState
-import os
 # Importar a função para mostrar nomes aprimorados e o dano aprimorado
 from game.utils import get_display_name, calculate_enhanced_damage, calculate_enhanced_value
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 class InventoryState(BaseState):
+    frame_render = True
+
     def __init__(self, game):
         super().__init__(game)
         self._player = game.player  # Usar atributo privado
@@ -25,7 +28,6 @@ class InventoryState(BaseState):
     def enter(self):
         """Método chamado ao entrar neste estado."""
         self.feedback_message = ""
-        self.render()
         self.needs_render = True
 
     def go_back(self):
@@ -38,7 +40,7 @@ class InventoryState(BaseState):
             self.game.pop_state()
 
     def render(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
         print("\n" + "=" * 60)
         print(f"   🎒 INVENTÁRIO DE {self._player.name.upper()} 🎒".center(60))
@@ -173,7 +175,7 @@ class InventoryState(BaseState):
         
         print("\n0. ↩️ Voltar")
         
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         if choice == "0":
             self.current_menu = "main"
         elif choice.isdigit():
@@ -306,7 +308,7 @@ class InventoryState(BaseState):
         self.needs_render = True
 
     def handle_input(self):
-        choice = input("\nEscolha uma opção: ").strip().lower()
+        choice = read_input("\nEscolha uma opção: ").strip().lower()
         
         if self.current_menu == "main":
             if choice == "1":
@@ -2,10 +2,15 @@
 from ..base_state import BaseState
 from game.db_queries import update_character_gold, enhance_inventory_item # Importa nova função de aprimoramento
 from game.utils import get_display_name, calculate_enhanced_damage, calculate_enhanced_value # Importa funções de utilidade
-import os 
-from game.utils import calculate_attack_bonus, calculate_enhanced_resistances, calculate_enhanced_armor_bonus
+from game.utils import calculate_attack_bonus, calculate_enhanced_resistances, calculate_enhanced_armor_bonus, modifier
+from game.monster_index import get_monster_index
+from game.damage_calc import enhancement_dpr_change
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 class BlacksmithState(BaseState):
+    frame_render = True
+
     def __init__(self, game, shop_name, npc_greeting, shop_items):
         super().__init__(game)
         self.shop_name = shop_name
@@ -14,6 +19,7 @@ class BlacksmithState(BaseState):
         self.mode = "main"  # main, buy, enhance_list, enhance_detail
         self.selected_item = None
         self.items_to_enhance = []
+        self.reference_target = None  # Monstro "típico" do nível, usado para estimar o DPR
         self.feedback_message = ""
         self.item_icons = {
             'weapon': '⚔️',
@@ -27,10 +33,9 @@ class BlacksmithState(BaseState):
     def enter(self):
         self.feedback_message = ""
         self.mode = "main"
-        self.render()
 
     def render(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
         print("\n" + "=" * 60)
         print(f"FERRARIA - {self.shop_name.upper()}".center(60))
@@ -155,6 +160,31 @@ class BlacksmithState(BaseState):
         print(f"Bônus de ataque atual: +{current_attack_bonus}")
         print(f"Após aprimoramento: {new_damage} (+{new_attack_bonus - current_attack_bonus} ataque)")
 
+        # Dano esperado por rodada (cálculo exato) contra um monstro típico do nível
+        player = self.game.player
+        target = self._get_reference_target()
+        attribute_mod = modifier(player.get_effective_attribute(item.get('main_attribute') or 'strength'))
+        current_dpr, new_dpr, change = enhancement_dpr_change(
+            item, new_level, attribute_mod, target, player.get_difficulty_modifiers()
+        )
+        print(f"Dano esperado por rodada (alvo típico, CA {target['ac']}): "
+              f"{current_dpr:.2f} → {new_dpr:.2f} ({change:+.1f}%)")
+
+    def _get_reference_target(self):
+        """Média de CA e resistências dos monstros que o jogador encontra no seu nível."""
+        if self.reference_target is None:
+            monsters = get_monster_index(self.game.db_conn).monsters_for_level(self.game.player.level)
+            if monsters:
+                count = len(monsters)
+                self.reference_target = {
+                    'ac': round(sum(m.get('ac', 10) for m in monsters) / count),
+                    'physical_resistance': round(sum(m.get('physical_resistance', 0) for m in monsters) / count),
+                    'magical_resistance': round(sum(m.get('magical_resistance', 0) for m in monsters) / count),
+                }
+            else:
+                self.reference_target = {'ac': 10, 'physical_resistance': 0, 'magical_resistance': 0}
+        return self.reference_target
+
     def _render_armor_details(self, item, new_level):
         """Exibe detalhes específicos para armaduras"""
         current_res = calculate_enhanced_resistances(item)
@@ -194,7 +224,7 @@ class BlacksmithState(BaseState):
         return 50 * (2 ** current_level)
 
     def handle_input(self):
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         
         if self.mode == "main":
             self._handle_main_input(choice)
@@ -288,6 +318,8 @@ class BlacksmithState(BaseState):
             if enhancement_type:
                 self.selected_item['enhancement_type'] = enhancement_type
 
+            # O item pode estar equipado: descarta o cache de equipamentos antes de recalcular
+            player.invalidate_equipment()
             player.recalculate()
             self.feedback_message = f"'{get_display_name(self.selected_item)}' foi aprimorado para +{new_level}! ✅"
             self.mode = "enhance_detail" 
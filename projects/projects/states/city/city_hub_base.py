@@ -2,9 +2,12 @@
 from ..base_state import BaseState
 from .shop_state import ShopState
 from game.database import save_character
-import os
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 class CityHubBase(BaseState):
+    frame_render = True
+
     def __init__(self, game, city_name, description):
         super().__init__(game)
         self.city_name = city_name
@@ -21,7 +24,7 @@ class CityHubBase(BaseState):
         return []  # Implementação básica - pode ser sobrescrita
         
     def render(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         player = self.game.player
         
         # Cabeçalho com informações do jogador
@@ -71,7 +74,7 @@ class CityHubBase(BaseState):
         self.return_option = menu_start + 3  # CORREÇÃO: Armazene o índice de retorno
 
     def handle_input(self):
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         
         try:
             choice_idx = int(choice)
@@ -121,23 +124,23 @@ class CityHubBase(BaseState):
                 
             else:
                 print("Opção inválida!")
-                input("Pressione Enter para continuar...")
+                read_input("Pressione Enter para continuar...")
                 
         except ValueError:
             print("Por favor, digite um número válido.")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
 
     def _handle_service(self, service):
         """Lida com serviços específicos da cidade"""
         # Implementação básica - pode ser expandida por cidade
         print(f"\nServiço selecionado: {service['name']}")
-        input("Pressione Enter para continuar...")
+        read_input("Pressione Enter para continuar...")
 
     def _explore_city(self):
         """Exploração na cidade (eventos aleatórios)"""
         print("\nVocê explora as ruas da cidade...")
         # TODO: Implementar eventos aleatórios na cidade
-        input("Pressione Enter para continuar...")
+        read_input("Pressione Enter para continuar...")
 
     def _rest_at_inn(self):
         from .inn_state import InnState  # Importe o novo estado
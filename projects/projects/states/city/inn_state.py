@@ -1,5 +1,6 @@
 # states/city/inn_state.py
 from states.base_state import BaseState
+from game.input_driver import read_input
 
 class InnState(BaseState):
     def __init__(self, game):
@@ -20,7 +21,7 @@ class InnState(BaseState):
         print("=" * 50)
 
     def handle_input(self):
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         
         if choice == "1":
             self._sleep()
@@ -30,7 +31,7 @@ class InnState(BaseState):
             self.game.pop_state()
         else:
             print("Opção inválida!")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
 
     def _sleep(self):
         # Custo baseado no nível do jogador
@@ -38,12 +39,12 @@ class InnState(BaseState):
         
         if self.player.gold < cost:
             print(f"\nVocê não tem ouro suficiente! Custo: {cost}g")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
             return
             
         # Confirmação
         print(f"\nDormir na estalagem custará {cost}g. Confirmar? (s/n)")
-        if input().strip().lower() != 's':
+        if read_input().strip().lower() != 's':
             return
             
         # Recupera tudo
@@ -51,17 +52,17 @@ class InnState(BaseState):
         self.player.hp = self.player.hp_max
         self.player.mana = self.player.mana_max
         print("\nVocê dormiu profundamente e acordou totalmente recuperado!")
-        input("Pressione Enter para continuar...")
+        read_input("Pressione Enter para continuar...")
 
     def _meditate(self):
         cost = self.player.level * 25
         if self.player.gold < cost:
             print(f"\nVocê não tem ouro suficiente! Custo: {cost}g")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
             return
             
         print(f"\nMeditar custará {cost}g. Confirmar? (s/n)")
-        if input().strip().lower() != 's':
+        if read_input().strip().lower() != 's':
             return
             
         self.player.gold -= cost
@@ -72,4 +73,4 @@ class InnState(BaseState):
         )
         print("\nVocê medita profundamente e ganha uma visão clara das batalhas futuras.")
         print("Você ganhará 20% de XP extra nos próximos 5 combates!")
-        input("Pressione Enter para continuar...")
\ No newline at end of file
+        read_input("Pressione Enter para continuar...")
\ No newline at end of file
@@ -1,16 +1,18 @@
 # game/states/shop_state.py
 from ..base_state import BaseState
-from game.db_queries import get_item_by_id, add_item_to_inventory, remove_item_from_inventory, update_character_gold
-import os
+from game.db_queries import get_item_by_id, add_item_to_inventory, update_character_gold
 from game.utils import modifier
 
 # game/states/shop_state.py
 from ..base_state import BaseState
-from game.db_queries import get_item_by_id, add_item_to_inventory, remove_item_from_inventory, update_character_gold
-import os
+from game.db_queries import get_item_by_id, add_item_to_inventory, update_character_gold
 from game.utils import modifier
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 class ShopState(BaseState):
+    frame_render = True
+
     def __init__(self, game, shop_name, npc_greeting, shop_items):
         super().__init__(game)
         self.shop_name = shop_name
@@ -66,7 +68,7 @@ class ShopState(BaseState):
             item['sell_price'] = int(item['value'] * self.sell_modifier)
 
     def render(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print("\n" + "=" * 50)
         print(f"🏪  {self.shop_name}  🏪".center(50))
         print("=" * 50)
@@ -136,26 +138,26 @@ class ShopState(BaseState):
 
     def handle_input(self):
         if self.mode == 'browse':
-            choice = input("\nEscolha uma opção: ").strip()
+            choice = read_input("\nEscolha uma opção: ").strip()
             
             if choice == '1':
                 if not self.shop_items_data:
-                    input("\nA loja está sem estoque! Pressione Enter...")
+                    read_input("\nA loja está sem estoque! Pressione Enter...")
                 else:
                     self.mode = 'buy'
             elif choice == '2':
                 if not self.player_inventory:
-                    input("\nSeu inventário está vazio! Pressione Enter...")
+                    read_input("\nSeu inventário está vazio! Pressione Enter...")
                 else:
                     self.mode = 'sell'
             elif choice == '3':
                 self.game.pop_state()  # Volta para o estado anterior (hub da cidade)
             else:
                 print("Opção inválida!")
-                input("Pressione Enter para continuar...")
+                read_input("Pressione Enter para continuar...")
                 
         elif self.mode == 'buy':
-            choice = input("\nDigite o ID do item que deseja comprar (0 para voltar): ").strip()
+            choice = read_input("\nDigite o ID do item que deseja comprar (0 para voltar): ").strip()
             
             if choice == '0':
                 self.mode = 'browse'
@@ -165,13 +167,13 @@ class ShopState(BaseState):
                     self._buy_item(idx - 1)
                 else:
                     print("ID inválido!")
-                    input("Pressione Enter para continuar...")
+                    read_input("Pressione Enter para continuar...")
             else:
                 print("Entrada inválida!")
-                input("Pressione Enter para continuar...")
+                read_input("Pressione Enter para continuar...")
                 
         elif self.mode == 'sell':
-            choice = input("\nDigite o ID do item que deseja vender (0 para voltar): ").strip()
+            choice = read_input("\nDigite o ID do item que deseja vender (0 para voltar): ").strip()
             
             if choice == '0':
                 self.mode = 'browse'
@@ -181,10 +183,10 @@ class ShopState(BaseState):
                     self._sell_item(idx - 1)
                 else:
                     print("ID inválido!")
-                    input("Pressione Enter para continuar...")
+                    read_input("Pressione Enter para continuar...")
             else:
                 print("Entrada inválida!")
-                input("Pressione Enter para continuar...")
+                read_input("Pressione Enter para continuar...")
 
     def _buy_item(self, item_idx):
         item_data = self.shop_items_data[item_idx]
@@ -196,10 +198,10 @@ class ShopState(BaseState):
         
         if self.player.gold < buy_price:
             print("\nVocê não tem ouro suficiente!")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
             return
             
-        confirm = input("\nConfirmar compra? (s/n): ").strip().lower()
+        confirm = read_input("\nConfirmar compra? (s/n): ").strip().lower()
         if confirm == 's':
             # Atualiza ouro do jogador
             self.player.gold -= buy_price
@@ -216,7 +218,7 @@ class ShopState(BaseState):
         else:
             print("Compra cancelada!")
             
-        input("Pressione Enter para continuar...")
+        read_input("Pressione Enter para continuar...")
 
     def _sell_item(self, item_idx):
         inv_item = self.player_inventory[item_idx]
@@ -229,7 +231,7 @@ class ShopState(BaseState):
         quantity = 1
         if inv_item['quantity'] > 1:
             try:
-                quantity = int(input(f"Quantos deseja vender (1-{inv_item['quantity']})? "))
+                quantity = int(read_input(f"Quantos deseja vender (1-{inv_item['quantity']})? "))
                 quantity = max(1, min(quantity, inv_item['quantity']))
             except ValueError:
                 quantity = 1
@@ -237,14 +239,14 @@ class ShopState(BaseState):
         
         total_price = sell_price * quantity
         
-        confirm = input(f"\nVender {quantity}x {inv_item['name']} por {total_price}g? (s/n): ").strip().lower()
+        confirm = read_input(f"\nVender {quantity}x {inv_item['name']} por {total_price}g? (s/n): ").strip().lower()
         if confirm == 's':
             # Atualiza ouro do jogador
             self.player.gold += total_price
             update_character_gold(self.game.db_conn, self.player.id, self.player.gold)
             
             # Remove item do inventário
-            remove_item_from_inventory(self.game.db_conn, inv_item['inventory_id'], quantity)
+            self.player.remove_from_inventory(inv_item['inventory_id'], quantity)
             
             print(f"\nVocê vendeu {quantity}x {inv_item['name']} por {total_price}g!")
             
@@ -253,4 +255,4 @@ class ShopState(BaseState):
         else:
             print("Venda cancelada!")
             
-        input("Pressione Enter para continuar...")
\ No newline at end of file
+        read_input("Pressione Enter para continuar...")
\ No newline at end of file
@@ -2,6 +2,7 @@
 from states.city.city_hub_base import CityHubBase
 from states.city.blacksmith_state import BlacksmithState  # Importe o novo estado
 from game.config import CITY_DATA
+from game.input_driver import read_input
 
 class VallengarHub(CityHubBase):
     def __init__(self, game):
@@ -54,7 +55,7 @@ class VallengarHub(CityHubBase):
         if service['type'] == 'arena':
             print("\nVocê entra na Arena de Combate de Vallengar!")
             # TODO: Implementar sistema de arena
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
         elif service['type'] == 'blacksmith':
             # Direciona para a ferraria principal
             self._go_to_blacksmith()
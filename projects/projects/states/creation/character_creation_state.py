@@ -1,5 +1,4 @@
 # game/states/character_creation_state.py
-import os
 import traceback
 
 from game.character import Character
@@ -16,6 +15,8 @@ from game.utils import roll_attribute
 
 from ..base_state import BaseState
 from .character_name_creator_state import CharacterNameCreator
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 # Mapeia as opções de entrada do usuário para os nomes dos atributos
 attr_map = {
@@ -62,7 +63,7 @@ class CharacterCreationState(BaseState):
         Renderiza a tela de criação de personagem com base na etapa atual.
         Apenas exibe as informações, a entrada do usuário é tratada em handle_input().
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
 
         print("\n" + "=" * 40)
         print("=== CRIAÇÃO DE PERSONAGEM ===")
@@ -140,7 +141,7 @@ class CharacterCreationState(BaseState):
             # Captura qualquer erro inesperado e exibe para depuração
             self.feedback_message = f"Erro inesperado: {str(e)}. Por favor, reporte este erro."
             traceback.print_exc()
-            input("\nPressione ENTER para continuar após o erro...")
+            read_input("\nPressione ENTER para continuar após o erro...")
             self.step = "start"
 
     # --- Métodos de Renderização Privados ---
@@ -200,7 +201,7 @@ class CharacterCreationState(BaseState):
         for i, race in enumerate(self.races, 1):
             print(f"{i}. {race.get('name', 'Raça Desconhecida')}")
         
-        choice = input("\nEscolha uma raça para detalhes: ").strip()
+        choice = read_input("\nEscolha uma raça para detalhes: ").strip()
         if choice == '0':
             self.step = "race"
         elif choice.isdigit():
@@ -229,7 +230,7 @@ class CharacterCreationState(BaseState):
         print(f"Sabedoria: {format_bonus(race.get('wisdom_bonus', 0))}")
         print(f"Carisma: {format_bonus(race.get('charisma_bonus', 0))}")
         
-        input("\nPressione ENTER para voltar...")
+        read_input("\nPressione ENTER para voltar...")
     
     def _render_class_options(self):
         """Exibe as opções de classe disponíveis."""
@@ -250,7 +251,7 @@ class CharacterCreationState(BaseState):
         for i, cls in enumerate(self.classes, 1):
             print(f"{i}. {cls.get('name', 'Classe Desconhecida')}")
         
-        choice = input("\nEscolha uma classe para detalhes: ").strip()
+        choice = read_input("\nEscolha uma classe para detalhes: ").strip()
         if choice == '0':
             self.step = "class"
         elif choice.isdigit():
@@ -286,7 +287,7 @@ class CharacterCreationState(BaseState):
                 print(f"\nArmadura Inicial: {armor_details.get('name')}")
                 print(f"Bônus CA: +{armor_details.get('armor_bonus')}")
 
-        input("\nPressione ENTER para voltar...")
+        read_input("\nPressione ENTER para voltar...")
 
     def _render_background_options(self):
         """Exibe as opções de antecedente disponíveis."""
@@ -307,7 +308,7 @@ class CharacterCreationState(BaseState):
         for i, bg in enumerate(self.backgrounds, 1):
             print(f"{i}. {bg.get('name', 'Antecedente Desconhecido')}")
 
-        choice = input("\nEscolha um antecedente para detalhes: ").strip()
+        choice = read_input("\nEscolha um antecedente para detalhes: ").strip()
         if choice == '0':
             self.step = "background"
         elif choice.isdigit():
@@ -333,7 +334,7 @@ class CharacterCreationState(BaseState):
         else:
             print("- Nenhuma perícia inicial definida para este antecedente.")
         
-        input("\nPressione ENTER para voltar...")
+        read_input("\nPressione ENTER para voltar...")
 
     def _render_attribute_options(self):
         """Exibe os atributos atuais e as opções de ação."""
@@ -375,7 +376,7 @@ class CharacterCreationState(BaseState):
     # --- Métodos de Manipulação de Entrada Privados ---
     def _handle_start_input(self):
         """Processa a entrada na tela inicial."""
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         if choice == "1":
             self.step = "name"
         elif choice == "2":
@@ -396,7 +397,7 @@ class CharacterCreationState(BaseState):
 
     def _handle_difficulty_input(self):
         """Processa a seleção de dificuldade."""
-        choice = input("\nEscolha a dificuldade: ").strip()
+        choice = read_input("\nEscolha a dificuldade: ").strip()
         if choice == "0":
             self.step = "name"
         elif choice.isdigit():
@@ -414,7 +415,7 @@ class CharacterCreationState(BaseState):
     # Novo manipulador de entrada para permadeath
     def _handle_permadeath_input(self):
         """Processa a seleção de morte permanente."""
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         if choice == "1":
             self.character_data["permadeath"] = 1
             self.feedback_message = "Morte Permanente ATIVADA!"
@@ -430,7 +431,7 @@ class CharacterCreationState(BaseState):
 
     def _handle_race_input(self):
         """Processa a seleção de raça."""
-        choice = input("\nEscolha uma raça: ").strip().lower()
+        choice = read_input("\nEscolha uma raça: ").strip().lower()
         if choice == 'd':
             self.step = "race_detail"
         elif choice == 'v':
@@ -449,7 +450,7 @@ class CharacterCreationState(BaseState):
     
     def _handle_class_input(self):
         """Processa a seleção de classe."""
-        choice = input("\nEscolha uma classe: ").strip().lower()
+        choice = read_input("\nEscolha uma classe: ").strip().lower()
         if choice == 'd':
             self.step = "class_detail"
         elif choice == 'v':
@@ -468,7 +469,7 @@ class CharacterCreationState(BaseState):
 
     def _handle_background_input(self):
         """Processa a seleção de antecedente."""
-        choice = input("\nEscolha um antecedente: ").strip().lower()
+        choice = read_input("\nEscolha um antecedente: ").strip().lower()
         if choice == 'd':
             self.step = "background_detail"
         elif choice == 'v':
@@ -499,7 +500,7 @@ class CharacterCreationState(BaseState):
 
     def _handle_attributes_input(self):
         """Processa a entrada para a etapa de atributos."""
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
 
         if choice == "1":
             self._finalize_character()
@@ -551,7 +552,7 @@ class CharacterCreationState(BaseState):
     
     def _handle_attribute_reroll_input(self):
         """Processa a escolha de qual atributo rerolar."""
-        choice = input("\nEscolha um atributo para rerolar: ").strip().lower()
+        choice = read_input("\nEscolha um atributo para rerolar: ").strip().lower()
         if choice == "0":
             self.step = "attributes"
         elif choice in attr_map:
@@ -567,6 +568,6 @@ class CharacterCreationState(BaseState):
 
     def _handle_complete_input(self):
         """Processa a entrada na tela final, avançando para o próximo estado."""
-        input()
+        read_input()
         from ..world.gameplay_state import GameplayState
         self.game.change_state(GameplayState(self.game))
\ No newline at end of file
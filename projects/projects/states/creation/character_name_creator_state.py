@@ -1,8 +1,9 @@
-import random
-import time
 import sqlite3
 from game.config import culturas_comuns, culturas_fantasiosas
 from game.name_generator import NameGenerator
+from game.input_driver import read_input
+from game.pacing import pause
+from game.rng import stream
 
 class CharacterNameCreator:
     def __init__(self, cultura_padrao='medieval'):
@@ -25,38 +26,13 @@ class CharacterNameCreator:
     def get_components(self, gender, component_type, culture='medieval'):
         """Busca componentes priorizando gênero, depois cultura"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Atualizado para tratar NULL como unisex
-            query = '''
-            SELECT value, weight, is_required 
-            FROM name_components 
-            WHERE (gender = ? OR gender = 'unisex' OR gender IS NULL)
-            AND component_type = ?
-            AND LOWER(culture) = LOWER(?)
-            '''
-            cursor.execute(query, (gender, component_type, culture))
-            results = cursor.fetchall()
-            
-            # Separa obrigatórios e opcionais
-            required = []
-            optional = []
-            
-            for row in results:
-                if row['is_required']:
-                    required.append((row['value'], row['weight']))
-                else:
-                    optional.append((row['value'], row['weight']))
-            
-            return required, optional
-
+            # NULL é tratado como unisex
+            return self.generator.get_component_table().components(
+                (gender, 'unisex', None), component_type, culture
+            )
         except sqlite3.Error as e:
             print(f"Erro no banco de dados: {e}")
             return [], []  # Retorna listas vazias para evitar quebra
-        finally:
-            # Não fechar a conexão aqui!
-            pass
 
     def setup_cultures(self):
         """Configura as listas de culturas disponíveis"""
@@ -103,7 +79,7 @@ class CharacterNameCreator:
             print("4. Voltar ao menu principal")
             print("-"*50)
             
-            escolha = input("Escolha (1/2/3/4): ").strip()
+            escolha = read_input("Escolha (1/2/3/4): ").strip()
             
             if escolha == '4':
                 return False  # Indica que deve voltar
@@ -128,7 +104,7 @@ class CharacterNameCreator:
             print("6. Voltar ao menu principal")
             print("-"*50)
             
-            escolha_cultura = input("Escolha (1-6): ").strip()
+            escolha_cultura = read_input("Escolha (1-6): ").strip()
             
             if escolha_cultura == '1':
                 self.cultura_selecionada = self.cultura_padrao
@@ -157,7 +133,7 @@ class CharacterNameCreator:
         for idx, cultura in enumerate(self.culturas_comuns_filtradas, 1):
             print(f"{idx}. {cultura}")
         
-        escolha_num = input("\nEscolha o número da cultura: ").strip()
+        escolha_num = read_input("\nEscolha o número da cultura: ").strip()
         try:
             idx = int(escolha_num) - 1
             if 0 <= idx < len(self.culturas_comuns_filtradas):
@@ -188,7 +164,7 @@ class CharacterNameCreator:
             for i, cultura in enumerate(other_fantasy, start_idx):
                 print(f"{i}. {cultura}")
         
-        escolha_num = input("\nEscolha o número da cultura: ").strip()
+        escolha_num = read_input("\nEscolha o número da cultura: ").strip()
         try:
             idx = int(escolha_num) - 1
             if 0 <= idx < len(self.culturas_fantasiosas_filtradas):
@@ -205,14 +181,14 @@ class CharacterNameCreator:
             print("\n" + "="*50)
             print("ESCOLHA O NOME DO PERSONAGEM")
             print("="*50)
-            entrada = input("Digite seu nome ou ENTER para gerar: ").strip()
+            entrada = read_input("Digite seu nome ou ENTER para gerar: ").strip()
             
             if entrada:
                 return entrada  # Aceita diretamente o nome digitado
             
             # Determinar cultura para esta geração
             if self.cultura_selecionada is None:
-                cultura_ativa = random.choice(self.culturas_disponiveis)
+                cultura_ativa = stream("names").choice(self.culturas_disponiveis)
             else:
                 cultura_ativa = self.cultura_selecionada
             
@@ -230,14 +206,14 @@ class CharacterNameCreator:
             print("3. Digitar nome manualmente")
             print("4. Voltar (escolher cultura/gênero)")
             
-            escolha = input("\nEscolha: ").strip()
+            escolha = read_input("\nEscolha: ").strip()
             
             if escolha == '1':
                 return nome_base
             elif escolha == '2':
                 continue
             elif escolha == '3':
-                novo_nome = input("Digite o nome: ").strip()
+                novo_nome = read_input("Digite o nome: ").strip()
                 if novo_nome:
                     return novo_nome
                 print("Nome inválido. Tente novamente.")
@@ -245,7 +221,7 @@ class CharacterNameCreator:
                 return None  # Voltar
             else:
                 print("Opção inválida! Tente novamente.")
-                time.sleep(1)
+                pause(1)
     
     def run(self):
         """Executa o fluxo completo de criação de nome (SEM TÍTULOS)"""
@@ -1,6 +1,7 @@
 # game/states/delete_confirmation_state.py
 from ..base_state import BaseState
 from game.database import delete_character
+from game.input_driver import read_input
 
 class DeleteConfirmationState(BaseState):
     def render(self):
@@ -15,17 +16,17 @@ class DeleteConfirmationState(BaseState):
         print("=" * 50)
 
     def handle_input(self):
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         if choice == "1":
             # Chamada corrigida com conexão do banco
             if delete_character(self.game.db_conn, self.game.player.id):
                 print("\nPersonagem deletado com sucesso!")
-                input("Pressione Enter para voltar ao menu principal...")
+                read_input("Pressione Enter para voltar ao menu principal...")
                 from .main_menu_state import MainMenuState
                 self.game.change_state(MainMenuState(self.game))
             else:
                 print("\nFalha ao deletar personagem!")
-                input("Pressione Enter para continuar...")
+                read_input("Pressione Enter para continuar...")
                 from ..world.gameplay_state import GameplayState
                 self.game.change_state(GameplayState(self.game))
         elif choice == "2":
@@ -2,14 +2,17 @@
 from ..base_state import BaseState
 from game.config import DIFFICULTY_MODIFIERS
 from game.database import save_character
-import os
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 class DifficultyState(BaseState):
+    frame_render = True
+
     def enter(self):
         self.difficulty_options = ["Aventura Leve",  "Desafio Justo",  "Provação Maldita",  "Caminho da Dor", "Maldição de Ferro", "Inferno Vivo"]
         
     def render(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print("\n=== SELECIONE A DIFICULDADE ===")
         print("="*40)
         print("A dificuldade afeta:")
@@ -41,7 +44,7 @@ class DifficultyState(BaseState):
         print("\n0. Voltar")
         
     def handle_input(self):
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         if choice == "0":
             self.game.pop_state()
         elif choice.isdigit():
@@ -51,10 +54,10 @@ class DifficultyState(BaseState):
                 self.game.player.difficulty = new_difficulty
                 
                 # Corrigido: Use a função save_character em vez do método save()
-                if save_character(self.game.db_conn, self.game.player):
+                if save_character(self.game.db_conn, self.game.player, immediate=True):
                     print(f"\nDificuldade alterada para: {new_difficulty}")
                 else:
                     print("\nErro ao salvar alterações de dificuldade!")
                     
-                input("Pressione ENTER para continuar...")
+                read_input("Pressione ENTER para continuar...")
                 self.game.pop_state()
\ No newline at end of file
@@ -2,6 +2,7 @@ from ..base_state import BaseState
 from states.creation.character_creation_state import CharacterCreationState
 from .save_manager_state import SaveManagerState
 from game.config import print_path_info, get_db_path
+from game.input_driver import read_input
 
 class MainMenuState(BaseState):
     def __init__(self, game):
@@ -38,27 +39,27 @@ class MainMenuState(BaseState):
             print(f"Ocorreu um erro crítico. Verifique error_log.txt para detalhes.")
     
     def handle_input(self):
-        choice = input("\nEscolha uma opção: ").strip()
+        choice = read_input("\nEscolha uma opção: ").strip()
 
         if choice == "1":
             print("\nFuncionalidade 'Continuar' ainda não implementada")
-            input("Pressione Enter para voltar...")
+            read_input("Pressione Enter para voltar...")
         elif choice == "2":  # Novo Jogo
             self.game.change_state(CharacterCreationState(self.game))
         elif choice == "3":  # Gerenciar Saves
             self.game.change_state(SaveManagerState(self.game))
         elif choice == "4":
             print("\nFuncionalidade 'Tutorial' ainda não implementada")
-            input("Pressione Enter para voltar...")
+            read_input("Pressione Enter para voltar...")
         elif choice == "5":
             print("\nFuncionalidade 'Créditos' ainda não implementada")
-            input("Pressione Enter para voltar...")
+            read_input("Pressione Enter para voltar...")
         elif choice == "6":
             print("\nFuncionalidade 'Configurações' ainda não implementada")
-            input("Pressione Enter para voltar...")
+            read_input("Pressione Enter para voltar...")
         elif choice == "7":
             print("\nSaindo do jogo... Até sua próxima aventura!")
             self.game.running = False
         else:
             print("\nOpção inválida! Tente novamente.")
-            input("Pressione Enter para voltar...")
\ No newline at end of file
+            read_input("Pressione Enter para voltar...")
\ No newline at end of file
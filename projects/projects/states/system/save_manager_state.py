@@ -1,20 +1,45 @@
 # game/states/save_manager_state.py
 from ..base_state import BaseState
-from game.database import load_characters, delete_character, rename_character
+from game.database import (
+    load_character, load_character_summaries, get_character_summary, count_characters,
+    delete_character, rename_character
+)
 from states.world.gameplay_state import GameplayState
 from states.creation.character_creation_state import CharacterCreationState
+from game.input_driver import read_input
+from game.pacing import pause
+
+# Saves exibidos por página
+SAVES_PER_PAGE = 15
+
+# Ordenações disponíveis no menu: (chave de load_character_summaries, rótulo)
+SAVE_SORT_OPTIONS = [("id", "ID"), ("name", "Nome"), ("level", "Nível"), ("gold", "Ouro")]
 
 class SaveManagerState(BaseState):
     def enter(self):
         self.step = "main"
         self.message = None
-        self.characters = load_characters(self.game.db_conn)
+        self.page = 0
+        self.sort_index = 0
+        self._load_page()
         self.selected_char_id = None
         self.selected_char_name = None
         self.pending_action = None
     
+    def _load_page(self):
+        """Lista só os resumos da página atual; o personagem completo é carregado ao escolher o save"""
+        conn = self.game.db_conn
+        self.total_characters = count_characters(conn)
+        self.total_pages = max(1, -(-self.total_characters // SAVES_PER_PAGE))
+        self.page = min(self.page, self.total_pages - 1)
+        order_by = SAVE_SORT_OPTIONS[self.sort_index][0]
+        self.characters = load_character_summaries(
+            conn, limit=SAVES_PER_PAGE, offset=self.page * SAVES_PER_PAGE,
+            order_by=order_by, descending=order_by in ("level", "gold")
+        )
+    
     def _reload_characters(self):
-        self.characters = load_characters(self.game.db_conn)
+        self._load_page()
         self.selected_char_id = None
         self.selected_char_name = None
         self.pending_action = None
@@ -22,8 +47,7 @@ class SaveManagerState(BaseState):
     def render(self):
         if self.message:
             print(f"\n{self.message}\n")
-            import time
-            time.sleep(1.5)
+            pause(1.5)
             self.message = None
 
         if self.step == "main":
@@ -51,13 +75,14 @@ class SaveManagerState(BaseState):
             print("2. Criar novo personagem")
             return
         
-        print("\nPERSONAGENS SALVOS:")
+        sort_label = SAVE_SORT_OPTIONS[self.sort_index][1]
+        print(f"\nPERSONAGENS SALVOS ({self.total_characters}) - Página {self.page + 1}/{self.total_pages} - Ordem: {sort_label}")
         print("-" * 70)
         print(f"{'ID':<4} {'Nome':<20} {'Raça':<15} {'Classe':<15} {'Nível':<6} {'Ouro':<10} {'Dificuldade':<12}")
         print("-" * 70)
         
         for char in self.characters:
-            print(f"{char.id:<4} {char.name:<20} {char.race:<15} {char.char_class:<15} {char.level:<6} {char.gold:<10} {char.difficulty:<12}")
+            print(f"{char['id']:<4} {char['name']:<20} {char['race']:<15} {char['char_class']:<15} {char['level']:<6} {char['gold']:<10} {char['difficulty']:<12}")
         
         print("\n" + "=" * 70)
         print(" OPÇÕES DISPONÍVEIS ".center(70, '='))
@@ -66,6 +91,10 @@ class SaveManagerState(BaseState):
         print("2. Excluir save")
         print("3. Renomear personagem")
         print("4. Voltar ao menu principal")
+        print("5. Alterar ordenação")
+        if self.total_pages > 1:
+            print("6. Próxima página")
+            print("7. Página anterior")
         print("=" * 70)
         
     def handle_input(self):
@@ -79,7 +108,7 @@ class SaveManagerState(BaseState):
             self._handle_rename_input()
 
     def _handle_main_input(self):
-        choice = input("\nEscolha uma opção: ").strip()
+        choice = read_input("\nEscolha uma opção: ").strip()
         
         if not self.characters:
             if choice == "1":
@@ -103,25 +132,36 @@ class SaveManagerState(BaseState):
         elif choice == "4":
             from .main_menu_state import MainMenuState
             self.game.change_state(MainMenuState(self.game))
+        elif choice == "5":
+            self.sort_index = (self.sort_index + 1) % len(SAVE_SORT_OPTIONS)
+            self.page = 0
+            self._load_page()
+        elif choice == "6" and self.total_pages > 1:
+            self.page = (self.page + 1) % self.total_pages
+            self._load_page()
+        elif choice == "7" and self.total_pages > 1:
+            self.page = (self.page - 1) % self.total_pages
+            self._load_page()
         else:
             self.message = "Opção inválida!"
 
     def _handle_select_character_input(self):  # Novo método
-        input_str = input("> ").strip()
+        input_str = read_input("> ").strip()
         
         try:
             char_id = int(input_str)
-            selected_char = next((c for c in self.characters if c.id == char_id), None)
+            # O save pode estar em outra página: busca o resumo pelo id
+            selected_char = get_character_summary(self.game.db_conn, char_id)
             
             if not selected_char:
                 self.message = "ID inválido! Tente novamente."
                 return
             
             self.selected_char_id = char_id
-            self.selected_char_name = selected_char.name
+            self.selected_char_name = selected_char['name']
             
             if self.pending_action == "load":
-                self._load_character(selected_char)
+                self._load_character(char_id)
             elif self.pending_action == "delete":
                 self.step = "delete"
             elif self.pending_action == "rename":
@@ -131,21 +171,22 @@ class SaveManagerState(BaseState):
             self.message = "Digite um número válido!"
 
     def _handle_load_input(self):  # Vamos renomear para melhor refletir
-        input_str = input("> ").strip()
+        input_str = read_input("> ").strip()
         
         try:
             char_id = int(input_str)
-            selected_char = next((c for c in self.characters if c.id == char_id), None)
+            # O save pode estar em outra página: busca o resumo pelo id
+            selected_char = get_character_summary(self.game.db_conn, char_id)
             
             if not selected_char:
                 self.message = "ID inválido! Tente novamente."
                 return
             
             self.selected_char_id = char_id
-            self.selected_char_name = selected_char.name
+            self.selected_char_name = selected_char['name']
             
             if self.pending_action == "load":
-                self._load_character(selected_char)
+                self._load_character(char_id)
             elif self.pending_action == "delete":
                 self.step = "delete"
             elif self.pending_action == "rename":
@@ -155,7 +196,7 @@ class SaveManagerState(BaseState):
             self.message = "Digite um número válido!"
 
     def _handle_delete_input(self):
-        choice = input("> ").strip().lower()
+        choice = read_input("> ").strip().lower()
         if choice == 's':
             # Chamada corrigida com conexão do banco
             if delete_character(self.game.db_conn, self.selected_char_id):
@@ -170,7 +211,7 @@ class SaveManagerState(BaseState):
             self.message = "Opção inválida! Digite 's' ou 'n'."
 
     def _handle_rename_input(self):
-        new_name = input("> ").strip()
+        new_name = read_input("> ").strip()
         if new_name:
             # Chamada corrigida com conexão do banco
             if rename_character(self.game.db_conn, self.selected_char_id, new_name):
@@ -182,8 +223,12 @@ class SaveManagerState(BaseState):
         else:
             self.message = "Nome não pode ser vazio!"
     
-    def _load_character(self, character):
-        """Carrega o personagem e inicia o jogo"""
+    def _load_character(self, character_id):
+        """Carrega o personagem completo (só o escolhido) e inicia o jogo"""
+        character = load_character(self.game.db_conn, character_id)
+        if character is None:
+            self.message = "ID inválido! Tente novamente."
+            return
         if character.hp <= 0:
             character.hp = character.hp_max
         
@@ -1,45 +1,55 @@
 # game/states/settings_state.py
 from ..base_state import BaseState
 from game.database import save_character
-import os
+from game.screen import clear_screen
+from game.input_driver import read_input
+from game.pacing import PACING_LABELS, get_pacing_mode, next_pacing_mode
 
 class SettingsState(BaseState):
+    frame_render = True
+
     def enter(self):
         self.options = [
             ("Alterar Dificuldade", "change_difficulty"),
             ("Voltar", "back"),
             ("Salvar e continuar", "Save and continnue"),
             ("Salvar e sair", "Save and exit"),
-            ("Deletar personagem", "Delete character")
+            ("Deletar personagem", "Delete character"),
+            ("Ritmo das pausas", "pacing")
         ]
         
     def render(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print("\n=== CONFIGURAÇÕES ===")
         print("="*30)
         
-        for i, (name, _) in enumerate(self.options, 1):
+        for i, (name, action) in enumerate(self.options, 1):
+            if action == "pacing":
+                name = f"{name}: {PACING_LABELS[get_pacing_mode()]}"
             print(f"{i}. {name}")
         
     def handle_input(self):
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         if choice == "1":
             self.change_difficulty()
         elif choice == "2":
             from ..world.gameplay_state import GameplayState
             self.game.change_state(GameplayState(self.game))
         elif choice == "3":
-            save_character(self.game.db_conn, self.game.player)
+            save_character(self.game.db_conn, self.game.player, immediate=True)
             print("\nJogo salvo com sucesso! ✅")
-            input("Pressione Enter para continuar...")
+            read_input("Pressione Enter para continuar...")
         elif choice == "4":
-            save_character(self.game.db_conn, self.game.player)
+            save_character(self.game.db_conn, self.game.player, immediate=True)
             print("\nProgresso salvo. Até a próxima aventura! 👋")
             from .main_menu_state import MainMenuState
             self.game.change_state(MainMenuState(self.game))
         elif choice == "5":
             from .delete_confirmation_state import DeleteConfirmationState
             self.game.change_state(DeleteConfirmationState(self.game))
+        elif choice == "6":
+            next_pacing_mode()
+            self.invalidate()
     
     def change_difficulty(self):
         from .difficulty_state import DifficultyState
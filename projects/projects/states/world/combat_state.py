@@ -1,13 +1,15 @@
 # game/states/combat_state.py
-import time
-import os
 
 from ..base_state import BaseState
 from game.combat import Combat
 from game.database import save_character
 from .gameplay_state import GameplayState
+from game.screen import clear_screen
+from game.input_driver import read_input
 
 class CombatState(BaseState):
+    frame_render = True
+
     def __init__(self, game, db_conn):
         super().__init__(game)
         self.conn = db_conn
@@ -19,7 +21,7 @@ class CombatState(BaseState):
 
     def render(self):
         """Renderiza a tela inicial do combate"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         print("Preparando para o combate...")
 
     def handle_input(self):
@@ -32,14 +34,14 @@ class CombatState(BaseState):
 
     def _handle_combat_result(self):
         """Processa o resultado final do combate"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
 
         if self.result == "victory":
             # A chamada para self.combat.victory() foi removida daqui.
             # O método victory() já foi executado dentro da classe Combat.
             save_character(self.conn, self.game.player)
             print("\n[Pressione Enter para continuar sua aventura...]")
-            input()
+            read_input()
             self.game.change_state(GameplayState(self.game))
 
         elif self.result == "defeat":
@@ -50,7 +52,7 @@ class CombatState(BaseState):
             print(f"Você perdeu {gold_lost} moedas de ouro...")
             save_character(self.conn, self.game.player)
             print("\n[Pressione Enter para retornar a um lugar seguro...]")
-            input()
+            read_input()
             self.game.change_state(GameplayState(self.game))
 
         elif self.result == "permadeath":
@@ -60,7 +62,7 @@ class CombatState(BaseState):
         elif self.result == "fled":
             print("\nVocê escapou por pouco...")
             print("[Pressione Enter para continuar...]")
-            input()
+            read_input()
             self.game.change_state(GameplayState(self.game))
 
     def _handle_permadeath(self):
@@ -76,7 +78,7 @@ class CombatState(BaseState):
 
         # Confirmar exclusão do personagem
         print("\nPressione Enter para confirmar...")
-        input()
+        read_input()
 
         # Excluir personagem
         from game.database import delete_character
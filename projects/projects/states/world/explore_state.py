@@ -2,24 +2,26 @@
 from ..base_state import BaseState
 from .combat_state import CombatState
 from game.utils import roll_dice
-import time
+from game.input_driver import read_input
+from game.pacing import pause
+from game.rng import stream
 
 class ExploreState(BaseState):
     def enter(self):
         print("\n" + "=" * 50)
         print("EXPLORANDO...")
         print("=" * 50)
-        time.sleep(1.2)  # Pequeno delay para dramatismo
+        pause(1.2)  # Pequeno delay para dramatismo
         
         # 70% chance de encontro
-        if roll_dice("1d100") > 30:
+        if roll_dice("1d100", stream("encounters")) > 30:
             print("\nVocê encontrou um inimigo!")
-            time.sleep(1.2)  # Pequeno delay para dramatismo
+            pause(1.2)  # Pequeno delay para dramatismo
             self.encounter = True
         else:
             print("\nVocê explorou a área mas não encontrou nada.")
             self.encounter = False
-            input("\nPressione Enter para continuar...")
+            read_input("\nPressione Enter para continuar...")
 
     def handle_input(self):
         if self.encounter:
@@ -2,20 +2,45 @@
 from ..base_state import BaseState
 from game.database import save_character
 from game.utils import get_display_name, calculate_enhanced_damage, calculate_enhanced_armor_bonus
-import os
+from game.screen import clear_screen
+from game.input_driver import read_input
+from game.pacing import pause
 
 class GameplayState(BaseState):
+    frame_render = True
+    redraw_after_input = False  # Só redesenha quando algo muda (invalidate)
+
     def __init__(self, game):
         super().__init__(game) # <--- PASSE 'game' AQUI
         self.game = game
+        self.view = None
+
+    def invalidate(self, model_changed=True):
+        super().invalidate(model_changed)
+        if model_changed:
+            self.view = None
+
+    def _build_view(self):
+        """Dados da tela que dependem de consultas/recalculos: montados só quando o personagem muda."""
+        player = self.game.player
+        player.recalculate()
+        equipped_items = player.get_equipped_items()
+        return {
+            "weapon": next((item for item in equipped_items if item.get('category') == 'weapon' and item.get('equip_slot') == 'main_hand'), None),
+            "armor": next((item for item in equipped_items if item.get('category') == 'armor' and item.get('equip_slot') == 'body'), None),
+            "shield": next((item for item in equipped_items if item.get('category') == 'shield' and item.get('equip_slot') == 'off_hand'), None),
+            "dex_penalty": player.get_dexterity_penalty(),
+            "location": self._get_current_location(),
+        }
     
     def render(self):
         """Renderiza a tela principal do jogo, mostrando o status do jogador e opções."""
         player = self.game.player
-        os.system('cls' if os.name == 'nt' else 'clear')
+        clear_screen()
         
-        # Atualiza os status do personagem
-        player.recalculate()
+        if self.view is None:
+            self.view = self._build_view()
+        view = self.view
         
         # Calcula percentuais para barras de HP e Mana
         hp_percent = min(100, int((player.hp / player.hp_max) * 100))
@@ -44,15 +69,10 @@ class GameplayState(BaseState):
             print(mana_display)
         
         # Mostra equipamentos principais com detalhes de aprimoramento
-        equipped_items = player.get_equipped_items()
-        weapon = next((item for item in equipped_items if item.get('category') == 'weapon' and item.get('equip_slot') == 'main_hand'), None)
-        armor = next((item for item in equipped_items if item.get('category') == 'armor' and item.get('equip_slot') == 'body'), None)
-        shield = next((item for item in equipped_items if item.get('category') == 'shield' and item.get('equip_slot') == 'off_hand'), None)
-
-        # Calcula resistências totais
-        physical_res = player.get_physical_resistance()
-        magical_res = player.get_magical_resistance()
-        dex_penalty = player.get_dexterity_penalty()
+        weapon = view["weapon"]
+        armor = view["armor"]
+        shield = view["shield"]
+        dex_penalty = view["dex_penalty"]
         
         print("\n" + "-" * 50)
         print("EQUIPAMENTO PRINCIPAL".center(50))
@@ -96,7 +116,7 @@ class GameplayState(BaseState):
         print(f"⚠️ Penalidade Destreza Total: {dex_penalty}")
 
         # Determinar localização atual
-        location = self._get_current_location()
+        location = view["location"]
         
         print("\n" + "=" * 50)
         print(f"{location.upper()} - AÇÕES".center(50))
@@ -128,7 +148,7 @@ class GameplayState(BaseState):
     
     def handle_input(self):
         """Lida com a entrada do usuário na tela principal do jogo."""
-        choice = input("\nEscolha: ").strip()
+        choice = read_input("\nEscolha: ").strip()
         
         if choice == "1":
             from .explore_state import ExploreState
@@ -150,8 +170,7 @@ class GameplayState(BaseState):
         else:
             print("Opção inválida!")
             # Adiciona um pequeno atraso para o usuário ler a mensagem
-            import time
-            time.sleep(1) 
+            pause(1) 
     
     def _handle_travel(self):
         """Mostra opções de viagem e lida com a escolha do jogador."""
@@ -163,7 +182,7 @@ class GameplayState(BaseState):
         print("3. Cancelar")
         print("=" * 50)
         
-        travel_choice = input("Para onde deseja viajar? ").strip()
+        travel_choice = read_input("Para onde deseja viajar? ").strip()
         
         if travel_choice == "1":
             self._travel_to("lindenrock")
@@ -171,12 +190,10 @@ class GameplayState(BaseState):
             self._travel_to("vallengar")
         elif travel_choice == "3":
             print("\nViagem cancelada.")
-            import time
-            time.sleep(1)
+            pause(1)
         else:
             print("\nOpção inválida!")
-            import time
-            time.sleep(1)
+            pause(1)
 
     def _travel_to(self, city_name):
         """Viaja para uma cidade e muda para o estado da cidade."""
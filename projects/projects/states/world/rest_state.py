@@ -2,6 +2,8 @@ from ..base_state import BaseState
 from .combat_state import CombatState
 from game.utils import roll_dice, modifier
 from game.database import save_character
+from game.input_driver import read_input
+from game.rng import stream
 
 class RestState(BaseState):
     def enter(self):
@@ -10,7 +12,7 @@ class RestState(BaseState):
         print("=" * 50)
         
         # 30% chance de encontro
-        if roll_dice("1d100") > 70:
+        if roll_dice("1d100", stream("encounters")) > 70:
             print("\nUm monstro te surpreendeu durante o descanso!")
             self.encounter = True
         else:
@@ -52,7 +54,7 @@ class RestState(BaseState):
             print(f"HP atual: {player.hp}/{player.hp_max}")
             
             save_character(self.game.db_conn, player)
-            input("\nPressione Enter para continuar...")
+            read_input("\nPressione Enter para continuar...")
 
     def handle_input(self):
         if self.encounter:
@@ -0,0 +1,59 @@
+# tests/test_equipment_cache.py
+"""
+Regressão: vender (ou perder) a última unidade de um item equipado apaga a
+linha do inventário e o banco desequipa o item; o cache de equipamentos do
+Character precisa acompanhar.
+
+Uso (em projects/projects):
+    python -m unittest tests.test_equipment_cache
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from game.character import Character
+from game.connection import close_shared_connection, set_shared_connection
+from game.database import save_character
+from game.db_queries import add_item_to_inventory, get_character_equipment, get_character_inventory
+from game.db_template import open_memory_database
+
+
+class EquipmentCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = open_memory_database()
+        set_shared_connection(self.conn)
+        self.player = Character(self.conn, name="Teste", race="Humano", char_class="Guerreiro",
+                                background="Soldado", strength=14, dexterity=12, constitution=12,
+                                intelligence=10, wisdom=10, charisma=10)
+        with redirect_stdout(io.StringIO()):
+            save_character(self.conn, self.player, immediate=True)
+        get_character_equipment(self.conn, self.player.id)  # Cria a linha de equipamentos
+        self.weapon_id = self.conn.execute(
+            "SELECT id FROM items WHERE category = 'weapon' AND equip_slot = 'main_hand' ORDER BY id LIMIT 1"
+        ).fetchone()[0]
+
+    def tearDown(self):
+        close_shared_connection()
+
+    def _weapon_rows(self):
+        return [item for item in get_character_inventory(self.conn, self.player.id)
+                if item['item_base_id'] == self.weapon_id]
+
+    def test_selling_spare_copy_of_equipped_weapon_unequips_it(self):
+        add_item_to_inventory(self.conn, self.player.id, self.weapon_id, quantity=1)
+        success, _ = self.player.equip_item(self._weapon_rows()[0]['inventory_id'])
+        self.assertTrue(success)
+        self.assertEqual([item['item_base_id'] for item in self.player.get_equipped_items()],
+                         [self.weapon_id])
+
+        # A cópia extra entra na mesma linha do inventário; vendê-la apaga a linha
+        add_item_to_inventory(self.conn, self.player.id, self.weapon_id, quantity=1)
+        row = self._weapon_rows()[0]
+        self.assertTrue(self.player.remove_from_inventory(row['inventory_id'], row['quantity']))
+
+        self.assertEqual(self.player.get_equipped_items(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# tests/test_pack_combat.py
+"""
+Regressão: em "Inferno Vivo" o crítico do jogador soma um bônus fracionado
+ao dano, que quebrava as colunas inteiras do MonsterBatch no combate em bando.
+
+Uso (em projects/projects):
+    python -m unittest tests.test_pack_combat
+"""
+import random
+import unittest
+
+from game.combat_engine import PackCombatEngine, get_difficulty_modifiers
+from game.monster_batch import MonsterBatch
+
+GOBLIN = {
+    'id': 1, 'name': "Goblin", 'level': 1, 'hp': 40, 'ac': 10, 'attack_bonus': 2,
+    'damage_dice': "1d6", 'exp_reward': 10, 'gold_dice': "1d4", 'constitution': 10,
+    'strength': 10, 'dexterity': 10, 'attack_type': "physical",
+    'physical_resistance': 1, 'magical_resistance': 0,
+}
+
+PLAYER = {
+    'name': "Teste", 'level': 1, 'hp': 30, 'hp_max': 30, 'ac': 12,
+    'physical_resistance': 0, 'magical_resistance': 0, 'attack_bonus': 3,
+    'weapon_dice': "1d8", 'damage_bonus': 3, 'damage_type': "physical",
+    'crit_multiplier': 2, 'flee_bonus': 0, 'difficulty': "Inferno Vivo",
+}
+
+
+class AlwaysCritical(random.Random):
+    """Todo d20 sai 20; as demais rolagens seguem o Random semeado."""
+
+    def randint(self, a, b):
+        return 20 if (a, b) == (1, 20) else super().randint(a, b)
+
+
+class PackCriticalTest(unittest.TestCase):
+
+    def test_critical_on_inferno_vivo_keeps_integer_hp(self):
+        mods = get_difficulty_modifiers("Inferno Vivo")
+        self.assertIn("enemy_crit_chance_bonus", mods)  # A dificuldade que gera o dano fracionado
+        pack = MonsterBatch.from_rows([GOBLIN], count=3, hp_multiplier=mods["monster_hp_multiplier"])
+        engine = PackCombatEngine(dict(PLAYER), pack, mods, AlwaysCritical(7))
+
+        event = engine.player_attack()
+
+        self.assertTrue(event['critical'])
+        self.assertTrue(event['hit'])
+        self.assertIsInstance(pack.columns['hp'][event['target']], int)
+        self.assertEqual(pack.columns['hp'][event['target']],
+                         pack.columns['hp_max'][event['target']] - event['damage'])
+
+
+if __name__ == "__main__":
+    unittest.main()